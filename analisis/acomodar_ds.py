@@ -2,6 +2,15 @@ import pandas as pd
 import joblib
 import numpy as np
 import os
+import sys
+
+# --- MAPA HACIA LA CARPETA PREDICCION (módulos compartidos) ---
+ruta_prediccion = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'prediccion'))
+if ruta_prediccion not in sys.path:
+    sys.path.append(ruta_prediccion)
+
+from torneos import fecha_torneo
+from almacen_partidos import cargar_historial
 
 ruta_script = os.path.dirname(os.path.abspath(__file__))
 ruta_raiz = os.path.dirname(ruta_script)
@@ -11,7 +20,9 @@ ruta_raiz = os.path.join(ruta_raiz, "scraping")
 def get_path(archivo):
     return os.path.join(ruta_raiz, archivo)
 
-df = pd.read_csv(get_path("historial_tenis_COMPLETO.csv"))
+# Del almacén columnar si está al día ('python prediccion/almacen_partidos.py scraping/historial_tenis_COMPLETO.csv'
+# lo arma); si no, el CSV. Hacen falta todas las columnas: el archivo se reescribe entero
+df = cargar_historial(get_path("historial_tenis_COMPLETO.csv"), categorias=False)
 
 archivo_destino = "historialTenis.csv"
 
@@ -54,47 +65,15 @@ df['round'] = df['round'].replace(mapa_rondas)
 # ==============================================================================
 print("   -> Reparando fechas de 2026...")
 
-meses_torneos = {
-    'australian': '0115', # Enero 15
-    'dallas': '0205',
-    'rotterdam': '0205',
-    'buenos-aires': '0205',
-    'indian': '0310',     # Marzo 10
-    'miami': '0325',      # Marzo 25
-    'monte': '0415',      # Montecarlo Abril
-    'madrid': '0501',     # Mayo 1
-    'rome': '0515',       # Mayo 15
-    'garros': '0528',     # Roland Garros
-    'wimbledon': '0701',  # Julio
-    'canada': '0807',     # Agosto
-    'cincinnati': '0815', 
-    'us-open': '0828',    # US Open
-    'shanghai': '1005',
-    'paris': '1030',
-    'finals': '1115'
-}
+# Mes/día de inicio de cada torneo: sale de la tabla de metadatos (prediccion/torneos.py),
+# buscando el slug dentro del ID (ej: "2026-monte-carlo-22"). Sin coincidencia -> 0101.
+fechas = pd.to_numeric(df['tourney_date'], errors='coerce')
+ids = df['tourney_id'].astype(str)
+anios = ids.str.split('-').str[0]
+id_valido = anios.str.isdigit() & (anios.str.len() == 4)
 
-def corregir_fecha(row):
-    fecha_actual = row['tourney_date']
-    if pd.notna(fecha_actual) and float(fecha_actual) > 19900000:
-        return int(fecha_actual)
-    
-    # Intentar recuperar del ID
-    try:
-        id_parts = str(row['tourney_id']).split('-')
-        year = id_parts[0]
-        if year.isdigit() and len(year) == 4:
-            resto_id = str(row['tourney_id']).lower()
-            mes_dia = "0101" # Default
-            for key, val in meses_torneos.items():
-                if key in resto_id:
-                    mes_dia = val
-                    break
-            return int(year + mes_dia)
-    except: pass
-    return 0
-
-df['tourney_date'] = df.apply(corregir_fecha, axis=1)
+fecha_recuperada = pd.to_numeric(anios.where(id_valido) + fecha_torneo(ids), errors='coerce')
+df['tourney_date'] = fechas.where(fechas > 19900000, fecha_recuperada).fillna(0).astype(int)
 
 # ==============================================================================
 # 3. LIMPIEZA DE CEROS EN BIO (Edad, Altura, País)
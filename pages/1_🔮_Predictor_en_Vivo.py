@@ -1,8 +1,23 @@
 import streamlit as st
-import pandas as pd
-import joblib
 import os
-import plotly.graph_objects as go
+import sys
+
+# --- MAPA HACIA LA CARPETA PREDICCION (módulos compartidos) ---
+ruta_prediccion = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'prediccion'))
+if ruta_prediccion not in sys.path:
+    sys.path.append(ruta_prediccion)
+
+# ⏱️ Arranque: se mide cada bloque de imports (ver perfil_arranque.py y la página de diagnóstico).
+# plotly y los modelos (xgboost / sklearn) NO se importan acá: cada uno en el camino que lo usa
+from perfil_arranque import PERFIL_ARRANQUE
+
+with PERFIL_ARRANQUE.importando('pandas'):
+    import pandas as pd
+with PERFIL_ARRANQUE.importando('módulos de la app'):
+    from recursos_app import Recursos
+    from matriz_top import matriz_al_dia, valores_por_defecto
+    from cache_predicciones import CACHE_PREDICCIONES, version_artefactos
+    from registro_modelos import elegir_modelo
 
 st.set_page_config(page_title="ATP Predictor 2026", page_icon="🎾", layout="wide")
 
@@ -26,56 +41,35 @@ El sistema analiza:
 
 st.write("---")
 
-# CARGAR ARCHIVOS 
+# CARGAR ARCHIVOS (la carga en sí vive en prediccion/recursos_app.py)
 @st.cache_resource
 def cargar_todo():
     # Detectar la carpeta principal del proyecto (Subimos un nivel desde /pages)
     ruta_script = os.path.dirname(os.path.abspath(__file__))
     ruta_proyecto = os.path.dirname(ruta_script) 
-    
-    # --- LA BIFURCACIÓN: Definimos las dos carpetas ---
-    ruta_prediccion = os.path.join(ruta_proyecto, "prediccion")
-    ruta_scraping = os.path.join(ruta_proyecto, "scraping") 
 
-    # Funciones auxiliares para buscar en la carpeta correcta
-    def get_path_pred(archivo):
-        return os.path.join(ruta_prediccion, archivo)
-        
-    def get_path_scrap(archivo):
-        return os.path.join(ruta_scraping, archivo)
+    # No carga nada todavía: cada recurso se carga (una vez) la primera vez que se pide
+    return Recursos(ruta_proyecto)
+
+recursos = cargar_todo()
 
+# 🧠 Si se publicaron artefactos nuevos (modelo, perfiles, paquete...) se vacía la caché
+# de predicciones y se vuelve a cargar todo lo que se pida
+version = version_artefactos(recursos.ruta_proyecto)
+if CACHE_PREDICCIONES.actualizar_version(version):
+    recursos.descartar()
+
+def obtener(nombre):
     try:
-        # 🧠 1. MODELOS ESTÁTICOS (Leen de /prediccion)
-        model_xgb = joblib.load(get_path_pred('modelo_xgboost_final.pkl'))
-        model_log = joblib.load(get_path_pred('modelo_logistico_final.pkl'))
-        scaler = joblib.load(get_path_pred('scaler_final.pkl'))
-        stats_dict = joblib.load(get_path_pred('stats_superficie_v2.pkl'))
-        
-        
-        perfiles = joblib.load(get_path_scrap('perfiles_jugadores.pkl'))
-        
+        return recursos.obtener(nombre)
     except FileNotFoundError as e:
         st.error(f"Faltan archivos fundamentales. Error técnico: {e}")
         st.stop()
 
-    # 📊 3. HISTORIAL Y RANKING (Leen de /scraping)
-    try:
-        df_history = pd.read_csv(get_path_scrap("historialTenis.csv"), low_memory=False)
-    except:
-        df_history = pd.DataFrame() 
-    
-    try:
-        df_rank_26 = pd.read_csv(get_path_scrap("ranking_2026.csv"))
-        # (Asegúrate de que 'player_slug' exista en tu CSV de ranking, 
-        # o cámbialo por 'player' / 'Nombre Completo' según como lo hayas dejado en tu scraper)
-        ranking_2026_dict = dict(zip(df_rank_26['player_slug'], df_rank_26['rank']))
-    except:
-        ranking_2026_dict = {}
-
-    return model_xgb, model_log, scaler, stats_dict, perfiles, df_history, ranking_2026_dict
-
-# Desempaquetamos todo
-model_xgb, model_log, scaler, stats_dict, perfiles, df_history, ranking_2026_dict = cargar_todo()
+# Lo justo para pintar la página (el modelo y el scaler se piden al predecir)
+stats_dict = obtener('stats_superficie')
+perfiles = obtener('perfiles')
+ranking_2026_dict = obtener('ranking_2026')
 
 
 def get_skill(p, s): return stats_dict.get((p, s), 0.5)
@@ -99,14 +93,16 @@ def mostrar_historial_detallado(lista_partidos):
         st.caption(f"Score: {score}")
         st.divider() # Línea separadora
 
-# FUNCIÓN H2H 
-def calcular_h2h(p1, p2):
-    if df_history.empty: return 0, 0
-    # Partidos donde ganó P1 contra P2
-    wins1 = len(df_history[(df_history['winner_name'] == p1) & (df_history['loser_name'] == p2)])
-    # Partidos donde ganó P2 contra P1
-    wins2 = len(df_history[(df_history['winner_name'] == p2) & (df_history['loser_name'] == p1)])
-    return wins1, wins2
+# FUNCIÓN H2H (consulta O(1) al índice por los ids del par, sin recorrer el historial)
+def calcular_h2h(p1, p2, superficie=None):
+    indice_h2h = obtener('indice_h2h')  # Solo si no está guardado hace falta leer el historial
+    if indice_h2h is None: return 0, 0
+    return indice_h2h.victorias(p1, p2, superficie)
+
+def h2h_por_superficie(p1, p2):
+    indice_h2h = obtener('indice_h2h')
+    if indice_h2h is None: return {}
+    return indice_h2h.por_superficie(p1, p2)
 
 def mostrar_racha_visual(lista_racha):
     if not lista_racha: return "Sin datos"
@@ -115,6 +111,8 @@ def mostrar_racha_visual(lista_racha):
     return " ".join(iconos)
 
 def grafico_radar(j1, j2, perfiles, stats_sup):
+    with PERFIL_ARRANQUE.importando('plotly (radar)'):
+        import plotly.graph_objects as go  # Solo acá: es lo más pesado de importar de la página
     
     d1 = perfiles.get(j1, {}); d2 = perfiles.get(j2, {})
     
@@ -221,18 +219,35 @@ with st.sidebar:
     
     # --- SELECTOR DE MODELO (NUEVO) ---
     st.subheader("🧠 Cerebro de la IA")
+
+    # El recomendado sale de comparar_modelos.py: precisión Y costo de servirlo (latencia, tamaño)
+    modelos_app = {"XGBoost": 'xgboost', "Regresión Logística": 'logistica'}  # Se carga solo el que se use
+    captions_app = {"XGBoost": "Mayor precisión (72%)", "Regresión Logística": "Más simple y clásico (69%)"}
+    recomendado = "XGBoost"
+    try:
+        df_comp = pd.read_csv(os.path.join(os.path.dirname(ruta_prediccion), "resultados_comparacion.csv"))
+        df_comp = df_comp[df_comp['Modelo'].isin(modelos_app)]
+        if not df_comp.empty:
+            recomendado = elegir_modelo(df_comp)
+            if 'Latencia_1_ms' in df_comp.columns:
+                for _, r in df_comp.iterrows():
+                    captions_app[r['Modelo']] = f"{r['Accuracy']:.0%} de acierto · {r['Latencia_1_ms']:.1f} ms por predicción"
+    except FileNotFoundError:
+        pass
+
+    orden_app = [recomendado] + [m for m in modelos_app if m != recomendado]
     modelo_seleccionado = st.radio(
         "Elige el algoritmo:",
-        ["XGBoost (Recomendado)", "Regresión Logística"],
-        captions=["Mayor precisión (72%)", "Más simple y clásico (69%)"]
+        [f"{m} (Recomendado)" if m == recomendado else m for m in orden_app],
+        captions=[captions_app[m] for m in orden_app]
     )
     
     # Asignamos el modelo activo según la elección
     if "XGBoost" in modelo_seleccionado:
-        active_model = model_xgb
+        id_modelo = modelos_app["XGBoost"]
         st.info("Usando: **Árboles de Decisión Avanzados**")
     else:
-        active_model = model_log
+        id_modelo = modelos_app["Regresión Logística"]
         st.info("Usando: **Estadística Lineal Clásica**")
         
     st.divider()
@@ -329,6 +344,10 @@ with col2:
 
     fat2 = st.number_input("Fatiga (min)", 0, 1000, 0, key="f2")
 
+# ⏱️ Lo de arriba (selectores y datos de los jugadores) ya está pintado: se anota el arranque
+# (una vez por proceso, en la consola). El radar y el modelo se miden aparte cuando llegan
+PERFIL_ARRANQUE.registrar(recursos)
+
 # ================= SECCIÓN H2H =================
 # --- H2H Y RADAR ---
 st.divider()
@@ -343,6 +362,13 @@ with c_h2h:
     st.metric(f"Victorias {nombre2}", wins_p2)
     st.caption("Partidos previos registrados en la base de datos.")
 
+    desglose_h2h = h2h_por_superficie(nombre1, nombre2)
+    if desglose_h2h:
+        st.markdown("**Por superficie**")
+        for sup, (v1, v2) in desglose_h2h.items():
+            marca = " ⬅️" if sup == superficie else ""
+            st.markdown(f"{sup}: **{v1} - {v2}**{marca}")
+
 with c_radar:
     st.subheader("🕸️ Análisis Técnico 360°")
     try:
@@ -369,9 +395,8 @@ if st.button(boton_texto, type="primary", use_container_width=True):
     home1 = 1 if nac1 == pais_torneo else 0
     home2 = 1 if nac2 == pais_torneo else 0
 
-    pts1 = st.session_state.get('p1_points', 0)
-    pts2 = st.session_state.get('p2_points', 0)
-    diff_rank_points = pts1 - pts2  # <--- ¡ESTO FALTABA!
+    # Los mismos puntos que muestra la métrica (los del perfil), igual que predictor_lote.py
+    diff_rank_points = puntos1 - puntos2  # <--- ¡ESTO FALTABA!
     
     diff_h2h = wins_p1 - wins_p2
 
@@ -388,12 +413,34 @@ if st.button(boton_texto, type="primary", use_container_width=True):
         'diff_h2h': diff_h2h
     }])
     
+    # ⚡ Si nadie tocó los números (y no hay localía de uno solo), la respuesta ya está
+    # precalculada para el top 200 en matriz_top.py: se lee del array sin llamar al modelo
+    defecto1 = valores_por_defecto(perfiles[nombre1], ranking_2026_dict.get(nombre1))
+    defecto2 = valores_por_defecto(perfiles[nombre2], ranking_2026_dict.get(nombre2))
+    sin_tocar = ((r1, a1, h1, mom1, fat1) == (defecto1['rank'], defecto1['age'], defecto1['ht'], defecto1['momentum'], 0)
+                 and (r2, a2, h2, mom2, fat2) == (defecto2['rank'], defecto2['age'], defecto2['ht'], defecto2['momentum'], 0))
+    prob_precalculada = None
+    if sin_tocar and home1 == home2:
+        matriz = matriz_al_dia(os.path.dirname(ruta_prediccion), id_modelo)  # Si está vieja se rearma en segundo plano
+        if matriz is not None:
+            prob_precalculada = matriz.buscar(nombre1, nombre2, superficie)
+
     try:
-        input_scaled = scaler.transform(input_data)
-        
-        # USAMOS EL MODELO ACTIVO SELECCIONADO 
-        prob = active_model.predict_proba(input_scaled)[0]
-        prob_j1 = prob[1]
+        if prob_precalculada is not None:
+            prob_j1 = prob_precalculada
+        else:
+            def calcular():
+                # USAMOS EL MODELO ACTIVO SELECCIONADO (se carga acá la primera vez; sin paquete
+                # al día, recién acá se importa xgboost / sklearn para leer el .pkl)
+                with PERFIL_ARRANQUE.importando(f'modelo {id_modelo}'):
+                    scaler = obtener('scaler')
+                    active_model = obtener(f'modelo_{id_modelo}')
+                input_scaled = scaler.transform(input_data)
+                prob = active_model.predict_proba(input_scaled)[0]
+                return float(prob[1])
+
+            # 🧠 Mismo modelo y mismos números que un clic anterior (de cualquier sesión): sin llamar al modelo
+            prob_j1 = CACHE_PREDICCIONES.obtener(id_modelo, version, input_data.iloc[0], calcular)
         
         st.divider()
         col_res_izq, col_res_der = st.columns([1, 3])
@@ -409,6 +456,37 @@ if st.button(boton_texto, type="primary", use_container_width=True):
             else:
                 st.error(f"🏆 Ganador: **{nombre2}**")
                 st.metric("Confianza", f"{(1-prob_j1):.1%}", delta=f"Modelo: {modelo_seleccionado.split(' ')[0]}")
+            if prob_precalculada is not None:
+                st.caption("⚡ Respuesta precalculada (matriz del top 200)")
             
     except Exception as e:
-        st.error(f"⚠️ Error en predicción: {e}")
\ No newline at end of file
+        st.error(f"⚠️ Error en predicción: {e}")
+
+# ================= DIAGNÓSTICO =================
+# Al final, para que muestre lo que se cargó en esta misma ejecución
+with st.sidebar:
+    with st.expander("🩺 Diagnóstico de recursos"):
+        diag = recursos.diagnostico()
+        st.dataframe(
+            diag,
+            column_config={"Segundos": st.column_config.NumberColumn(format="%.3f"),
+                           "RSS MB": st.column_config.NumberColumn(format="%.1f"),
+                           "MB estimado": st.column_config.NumberColumn(format="%.1f")},
+            hide_index=True, use_container_width=True
+        )
+        st.caption(f"Cargados {int(diag['Cargado'].sum())} de {len(diag)} recursos · "
+                   f"+{diag['RSS MB'].sum():.1f} MB de RSS en {diag['Segundos'].sum():.2f} s")
+        if PERFIL_ARRANQUE.total is not None:
+            st.caption(f"⏱️ Primer pintado a {PERFIL_ARRANQUE.total:.2f} s del arranque del proceso "
+                       f"(desglose en la página 🩺 Diagnóstico)")
+
+        cache = CACHE_PREDICCIONES.estadisticas()
+        st.markdown("**🧠 Caché de predicciones**")
+        c_ac, c_fa, c_de = st.columns(3)
+        c_ac.metric("Aciertos", f"{cache['aciertos']:,}")
+        c_fa.metric("Fallos", f"{cache['fallos']:,}")
+        c_de.metric("Desalojos", f"{cache['desalojos']:,}")
+        tasa = "—" if cache['aciertos'] + cache['fallos'] == 0 else f"{cache['tasa_aciertos']:.0%}"
+        st.caption(f"{cache['entradas']:,} de {cache['capacidad']:,} guardadas · {tasa} de aciertos · "
+                   f"vaciada {cache['invalidaciones']} {'vez' if cache['invalidaciones'] == 1 else 'veces'} "
+                   f"por artefactos nuevos")
@@ -2,6 +2,14 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import os
+import sys
+
+# --- MAPA HACIA LA CARPETA PREDICCION (módulos compartidos) ---
+ruta_prediccion = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'prediccion'))
+if ruta_prediccion not in sys.path:
+    sys.path.append(ruta_prediccion)
+
+from registro_modelos import TOLERANCIA_ACCURACY, elegir_modelo
 
 st.set_page_config(page_title="Laboratorio IA", page_icon="🧠", layout="wide")
 
@@ -29,6 +37,9 @@ try:
     df_res = pd.read_csv(path_csv)
     df_res['Accuracy %'] = (df_res['Accuracy'] * 100).round(2)
     df_res = df_res.sort_values('Accuracy', ascending=False)
+    # Modelo elegido para la app: precisión + costo de servirlo (CSV viejo -> el más preciso)
+    elegido = elegir_modelo(df_res)
+    con_costos = 'Latencia_1_ms' in df_res.columns
 except FileNotFoundError:
     st.error("⚠️ Faltan los resultados. Ejecuta primero 'comparar_modelos.py'.")
     st.stop()
@@ -40,7 +51,7 @@ with col_graf:
     st.subheader("🏆 ¿Quién acertó más?")
     
     # Colores: Dorado para el ganador, Gris para el resto
-    colors = ['#FFD700' if x == df_res.iloc[0]['Modelo'] else '#E5E7EB' for x in df_res['Modelo']]
+    colors = ['#FFD700' if x == elegido else '#E5E7EB' for x in df_res['Modelo']]
     
     fig = px.bar(
         df_res, 
@@ -51,18 +62,52 @@ with col_graf:
         title="Porcentaje de Acierto en Partidos Nuevos",
     )
     fig.update_traces(marker_color='#2563EB', textposition='outside')
-    fig.update_layout(xaxis_range=[60, 80], xaxis_title="Porcentaje de Acierto")
+    fig.update_layout(xaxis_range=[max(0, df_res['Accuracy %'].min() - 10), min(100, df_res['Accuracy %'].max() + 5)],
+                      xaxis_title="Porcentaje de Acierto")
     st.plotly_chart(fig, use_container_width=True)
 
 with col_tabla:
     st.subheader("🥇 El Ganador")
-    ganador = df_res.iloc[0]
+    ganador = df_res[df_res['Modelo'] == elegido].iloc[0]
     st.success(f"El modelo **{ganador['Modelo']}** fue el mejor.")
     st.markdown(f"""
     Logró predecir correctamente el **{ganador['Accuracy %']}%** de los partidos de prueba.
     
     Por eso, es el motor elegido para esta App.
     """)
+    if con_costos:
+        st.caption(f"No solo cuenta acertar: entre los modelos a menos de {TOLERANCIA_ACCURACY:.1%} del más preciso, "
+                   f"elegimos el que responde más rápido (**{ganador['Latencia_1_ms']:.2f} ms** por predicción).")
+
+# COSTO DE CADA MODELO (tiempo, memoria, tamaño y velocidad de respuesta)
+if con_costos:
+    st.markdown("### 💸 ¿Cuánto cuesta cada modelo?")
+    st.write("Un modelo que acierta un poquito más pero tarda 10 veces en responder no siempre conviene. "
+             "Esto es lo que medimos al entrenar cada uno:")
+
+    metricas_costo = [
+        ('Segundos_Entrenamiento', "⏱️ Tiempo de entrenamiento (s)"),
+        ('RAM_Pico_MB', "🧠 Pico de memoria RAM (MB)"),
+        ('Tamaño_KB', "💾 Tamaño del archivo del modelo (KB)"),
+        ('Latencia_1_ms', "⚡ Tiempo por predicción, 1 partido (ms)"),
+        ('Latencia_1000_ms', "📦 Tiempo para 1000 partidos juntos (ms)"),
+    ]
+    cols_costo = st.columns(3)
+    for i, (col, titulo) in enumerate(metricas_costo):
+        with cols_costo[i % 3]:
+            fig_costo = px.bar(df_res, x='Modelo', y=col, text_auto='.2f', title=titulo, color='Modelo')
+            fig_costo.update_layout(showlegend=False, xaxis_title=None, yaxis_title=None, height=320)
+            st.plotly_chart(fig_costo, use_container_width=True)
+
+    # Precisión vs velocidad: lo ideal está arriba a la izquierda
+    with cols_costo[len(metricas_costo) % 3]:
+        fig_balance = px.scatter(df_res, x='Latencia_1_ms', y='Accuracy %', size='Tamaño_KB', color='Modelo',
+                                 text='Modelo', title="🎯 Precisión vs. velocidad", size_max=40)
+        fig_balance.update_traces(textposition='top center')
+        fig_balance.update_layout(showlegend=False, xaxis_title="ms por predicción", height=320)
+        st.plotly_chart(fig_balance, use_container_width=True)
+
+    st.dataframe(df_res.drop(columns=['Accuracy']).set_index('Modelo'), use_container_width=True)
 
 st.divider()
 
@@ -1,6 +1,5 @@
 import streamlit as st
 import pandas as pd
-import joblib
 import sys
 import os
 
@@ -11,6 +10,13 @@ ruta_scraping = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 's
 if ruta_scraping not in sys.path:
     sys.path.append(ruta_scraping)
 
+# --- MAPA HACIA LA CARPETA PREDICCION (módulos compartidos) ---
+ruta_prediccion = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'prediccion'))
+if ruta_prediccion not in sys.path:
+    sys.path.append(ruta_prediccion)
+
+from recursos_app import Recursos
+
 
 st.set_page_config(page_title="Ranking ATP", page_icon="🏆", layout="wide")
 
@@ -42,11 +48,13 @@ st.markdown("---")
 # --- CARGAR DATOS ---
 ruta_scraping = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scraping'))
 ruta_ranking = os.path.join(ruta_scraping, "ranking_2026.csv")
-ruta_perfiles = os.path.join(ruta_scraping, "perfiles_jugadores.pkl")
 
 try:
     df_ranking = pd.read_csv(ruta_ranking)
-    perfiles = joblib.load(ruta_perfiles)
+    # Del paquete de artefactos si está al día (si no, perfiles_jugadores.pkl como siempre)
+    recursos = Recursos(os.path.dirname(ruta_scraping))
+    perfiles = recursos.obtener('perfiles')
+    registro = recursos.obtener('registro')
 except Exception as e:
     st.warning(f"No se encontraron los datos en la carpeta scraping. ¿Ya corriste la actualización?")
     st.error(f"Error técnico: {e}") # Esto nos dirá exactamente qué falta si vuelve a fallar
@@ -87,9 +95,13 @@ with col2:
     
     jugador_seleccionado = st.selectbox("Buscar jugador:", lista_jugadores)
     
-    # Ahora sí, buscará "Jannik Sinner" en los perfiles
-    if jugador_seleccionado in perfiles:
-        p = perfiles[jugador_seleccionado]
+    # Ahora sí, buscará "Jannik Sinner" en los perfiles por su id del registro (también si
+    # el historial lo escribe distinto: "Felix Auger Aliassime" -> "Felix Auger-Aliassime")
+    id_jugador = registro.buscar(jugador_seleccionado)
+    if id_jugador is not None:
+        jugador_seleccionado = registro.nombre(id_jugador)
+    if id_jugador is not None and id_jugador in perfiles:
+        p = perfiles[id_jugador]
         
         # Panel de métricas principales
         c1, c2, c3 = st.columns(3)
@@ -0,0 +1,117 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import os
+import sys
+import time
+
+# --- MAPA HACIA LA CARPETA PREDICCION (módulos compartidos) ---
+ruta_prediccion = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'prediccion'))
+if ruta_prediccion not in sys.path:
+    sys.path.append(ruta_prediccion)
+
+from predictor_lote import PredictorLote
+from simulador_cuadro import (ARCHIVO_PARTIDOS, ARCHIVO_TORNEOS, SIMULACIONES, cuadro_torneo,
+                              simular_torneo, slug_torneo)
+
+st.set_page_config(page_title="Simulador de Torneos", page_icon="🎲", layout="wide")
+
+st.title("🎲 Simulador de Torneos 2026")
+
+hide_st_style = """
+            <style>
+            #MainMenu {visibility: hidden;} /* Oculta los 3 puntitos de arriba a la derecha */
+            footer {visibility: hidden;} /* Oculta el "Made with Streamlit" de abajo */
+            </style>
+            """
+st.markdown(hide_st_style, unsafe_allow_html=True)
+
+st.markdown("""
+Jugamos el torneo **miles de veces**: cada partido del cuadro se sortea con la probabilidad que da el modelo.
+Así sale la chance de cada jugador de llegar a cada ronda (y de levantar el trofeo).
+* 🗂️ **Cuadro:** si el torneo ya se jugó, el cuadro real; si no, los mejores del ranking sembrados.
+* ⚡ **Rápido:** todas las probabilidades del cuadro salen de una sola llamada al modelo.
+""")
+
+st.write("---")
+
+# CARGAR ARCHIVOS
+@st.cache_resource
+def cargar_predictor(modelo):
+    ruta_proyecto = os.path.dirname(ruta_prediccion)
+    try:
+        return PredictorLote.desde_recursos(ruta_proyecto, modelo)
+    except FileNotFoundError as e:
+        st.error(f"Faltan archivos fundamentales. Error técnico: {e}")
+        st.stop()
+
+@st.cache_data
+def cargar_torneos():
+    try:
+        df_torneos = pd.read_csv(ARCHIVO_TORNEOS)
+    except FileNotFoundError:
+        return pd.DataFrame(columns=['Torneo', 'Ciudad', 'slug'])
+    df_torneos['slug'] = df_torneos['Link_Resultados'].map(slug_torneo)
+    return df_torneos
+
+@st.cache_data
+def cargar_partidos():
+    try:
+        return pd.read_csv(ARCHIVO_PARTIDOS, low_memory=False)
+    except FileNotFoundError:
+        return pd.DataFrame(columns=['tourney_name', 'round', 'surface', 'winner_name', 'loser_name'])
+
+df_torneos = cargar_torneos()
+df_partidos = cargar_partidos()
+
+if df_torneos.empty:
+    st.warning("No se encontró atp_torneos_2026_final.csv (corre el scraper de torneos).")
+    st.stop()
+
+# INTERFAZ
+with st.sidebar:
+    st.header("⚙️ Configuración")
+    modelo = st.radio("Modelo:", ["XGBoost", "Regresión Logística"])
+    simulaciones = st.select_slider("Simulaciones", [10_000, 50_000, SIMULACIONES, 200_000, 500_000], value=SIMULACIONES)
+    semilla = st.number_input("Semilla", 0, 10_000, 0)
+
+predictor = cargar_predictor('xgboost' if modelo == "XGBoost" else 'logistica')
+
+opciones = df_torneos.index.tolist()
+indice = st.selectbox("Torneo:", opciones,
+                      format_func=lambda i: f"{df_torneos.at[i, 'Torneo']} — {str(df_torneos.at[i, 'Ciudad']).strip(' |')}")
+torneo = df_torneos.loc[indice]
+
+cuadro, superficie_real, pais, origen = cuadro_torneo(predictor, torneo['slug'], df_partidos, torneo['Torneo'])
+
+c_info1, c_info2, c_info3 = st.columns(3)
+c_info1.metric("Jugadores en el cuadro", sum(n is not None for n in cuadro))
+superficies = ["Hard", "Clay", "Grass"]
+superficie = c_info2.selectbox("Superficie", superficies,
+                               index=superficies.index(superficie_real) if superficie_real in superficies else 0)
+c_info3.metric("País sede", pais)
+st.caption(f"🗂️ {origen}")
+
+inicio = time.perf_counter()
+tabla, _, _ = simular_torneo(predictor, cuadro, superficie, pais, simulaciones, semilla)
+segundos = time.perf_counter() - inicio
+st.caption(f"⏱️ {simulaciones:,} simulaciones en {segundos:.2f} s".replace(",", "."))
+
+# ================= RESULTADOS =================
+rondas = [c for c in tabla.columns if c not in ('Jugador', 'Lugar')]
+
+c_graf, c_tabla = st.columns([1, 2])
+with c_graf:
+    st.subheader("🏆 Candidatos al título")
+    top = tabla.head(10).iloc[::-1]
+    fig = px.bar(top, x='Campeón', y='Jugador', orientation='h', text_auto='.1%')
+    fig.update_layout(xaxis_tickformat='.0%', xaxis_title=None, yaxis_title=None, height=420)
+    st.plotly_chart(fig, use_container_width=True)
+
+with c_tabla:
+    st.subheader("📈 Probabilidad de llegar a cada ronda")
+    st.dataframe(
+        tabla,
+        column_config={r: st.column_config.ProgressColumn(r, format="percent", min_value=0, max_value=1) for r in rondas},
+        hide_index=True, use_container_width=True, height=420
+    )
@@ -0,0 +1,86 @@
+import streamlit as st
+import pandas as pd
+import os
+import sys
+
+# --- MAPA HACIA LA CARPETA PREDICCION (módulos compartidos) ---
+ruta_prediccion = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'prediccion'))
+if ruta_prediccion not in sys.path:
+    sys.path.append(ruta_prediccion)
+
+from perfil_arranque import MODULOS_DIFERIDOS, MODULOS_PAGINA, PERFIL_ARRANQUE, medir_importaciones
+
+st.set_page_config(page_title="Diagnóstico", page_icon="🩺", layout="wide")
+
+st.title("🩺 Diagnóstico de Arranque")
+
+hide_st_style = """
+            <style>
+            #MainMenu {visibility: hidden;} /* Oculta los 3 puntitos de arriba a la derecha */
+            footer {visibility: hidden;} /* Oculta el "Made with Streamlit" de abajo */
+            </style>
+            """
+st.markdown(hide_st_style, unsafe_allow_html=True)
+
+st.markdown("""
+Cuánto tarda un proceso nuevo del servidor en mostrar el **Predictor en Vivo**: los imports
+de la página y la carga de cada artefacto. Lo pesado (plotly, xgboost, scikit-learn) se
+importa recién cuando se usa.
+""")
+
+# ================= ESTE PROCESO =================
+st.subheader("⏱️ Arranque de este proceso")
+
+if PERFIL_ARRANQUE.total is None:
+    st.info("Todavía no se abrió el Predictor en Vivo en este proceso: abrilo una vez y volvé acá.")
+else:
+    c1, c2, c3 = st.columns(3)
+    c1.metric("Primer pintado", f"{PERFIL_ARRANQUE.total:.2f} s")
+    tabla_imports = pd.DataFrame(PERFIL_ARRANQUE.importaciones_tabla())
+    c2.metric("Imports medidos", f"{tabla_imports['ms'].sum() / 1000:.2f} s" if not tabla_imports.empty else "—")
+    if PERFIL_ARRANQUE.recursos is not None:
+        diag = PERFIL_ARRANQUE.recursos.diagnostico()
+        c3.metric("Artefactos cargados", f"{diag['Segundos'].sum():.2f} s", delta=f"{int(diag['Cargado'].sum())} de {len(diag)}",
+                  delta_color="off")
+
+    col_imp, col_art = st.columns(2)
+    with col_imp:
+        st.markdown("**📥 Imports por bloque** (los diferidos aparecen cuando se usan)")
+        st.dataframe(tabla_imports, column_config={"ms": st.column_config.NumberColumn(format="%.1f")},
+                     hide_index=True, use_container_width=True)
+    with col_art:
+        st.markdown("**📦 Carga por artefacto**")
+        if PERFIL_ARRANQUE.recursos is not None:
+            st.dataframe(diag, column_config={"Segundos": st.column_config.NumberColumn(format="%.3f"),
+                                              "RSS MB": st.column_config.NumberColumn(format="%.1f"),
+                                              "MB estimado": st.column_config.NumberColumn(format="%.1f")},
+                         hide_index=True, use_container_width=True)
+
+st.divider()
+
+# ================= EN FRÍO =================
+st.subheader("🧊 Imports en frío (proceso nuevo)")
+st.caption("Corre `python -X importtime` con los imports de la página, como un servidor recién levantado. "
+           "Lo mismo desde la consola: `python prediccion/perfil_arranque.py`.")
+
+if st.button("⏱️ Medir ahora", type="primary"):
+    with st.spinner("Importando en un proceso nuevo..."):
+        por_modulo, por_paquete = medir_importaciones(MODULOS_PAGINA)
+        diferidos = [{'Módulo': modulo, 'ms': medir_importaciones([modulo])[0][0]['ms'], 'Cuándo': cuando}
+                     for modulo, cuando in MODULOS_DIFERIDOS.items()]
+
+    total = sum(f['ms'] or 0 for f in por_modulo)
+    st.metric("Imports de la página", f"{total:.0f} ms")
+
+    col_mod, col_paq = st.columns(2)
+    with col_mod:
+        st.markdown("**Por import de la página** (vacío = no instalado)")
+        st.dataframe(pd.DataFrame(por_modulo), column_config={"ms": st.column_config.NumberColumn(format="%.1f")},
+                     hide_index=True, use_container_width=True)
+        st.markdown("**Diferidos** (se pagan solo en ese camino)")
+        st.dataframe(pd.DataFrame(diferidos), column_config={"ms": st.column_config.NumberColumn(format="%.1f")},
+                     hide_index=True, use_container_width=True)
+    with col_paq:
+        st.markdown("**Por paquete** (tiempo propio, ms)")
+        top_paquetes = pd.Series(por_paquete, name='ms').head(15)
+        st.bar_chart(top_paquetes)
@@ -0,0 +1,204 @@
+import hashlib
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from columnar import guardar_tabla, cargar_tabla, leer_manifiesto
+from fatiga import variables_fatiga, DIAS_VENTANA
+from torneos import pais_torneo
+from skill_superficie import MotorSkill, guardar_estado_skill
+from motor_elo import MotorElo, huella_partidos, ordenar_cronologico, ultima_clave, guardar_estado
+from ventana_movil import VentanaMovil
+
+# =============================================================================
+# 📦 ALMACÉN DE VARIABLES (Feature Store)
+# =============================================================================
+# Calcula UNA sola vez todas las variables que usan los scripts de entrenamiento
+# (Elo, Skill por superficie, Localía, Fatiga, Momentum y H2H) y las guarda en
+# una tabla columnar identificada por el hash del CSV de partidos.
+# Si el CSV no cambió, los scripts cargan las variables directamente del caché.
+#
+# Uso típico desde un script de entrenamiento:
+#     df, stats_dict = cargar_features("historial_tenis_COMPLETO.csv")
+
+# Subir este número si cambia la forma de calcular alguna variable (invalida el caché)
+VERSION_FEATURES = 5
+CARPETA_CACHE = 'cache_features'
+
+MINUTOS_POR_DEFECTO = 100  # Relleno para partidos sin duración registrada
+VENTANA_MOMENTUM = 5       # Últimos N partidos para la racha (winner_momentum / loser_momentum)
+VENTANAS_EXTRA = (10, 20)  # Rachas más largas: winner_momentum_10, winner_momentum_20, ...
+SEMIVIDA_SKILL = 365       # Días: semivida del skill "reciente" (winner_skill_reciente / loser_skill_reciente)
+
+# Columnas del CSV original que se conservan en el almacén
+COLUMNAS_BASE = [
+    'tourney_id', 'tourney_name', 'tourney_date', 'tourney_level', 'surface', 'match_num', 'minutes', 'score',
+    'winner_name', 'loser_name', 'winner_ioc', 'loser_ioc',
+    'winner_rank', 'loser_rank', 'winner_rank_points', 'loser_rank_points',
+    'winner_age', 'loser_age', 'winner_ht', 'loser_ht',
+]
+
+
+# -------------------------------------------------------------------------
+# MOMENTUM + H2H (una sola pasada cronológica)
+# -------------------------------------------------------------------------
+# La fatiga ya no va en este bucle: se calcula vectorizada en fatiga.py
+def _variables_temporales(winners, losers):
+    # Momentum con buffer circular por jugador: todas las ventanas en la misma pasada
+    codigos, jugadores = pd.factorize(pd.Series(winners + losers, dtype=object))
+    n = len(winners)
+    ids_w, ids_l = codigos[:n].tolist(), codigos[n:].tolist()
+    ventanas = (VENTANA_MOMENTUM,) + VENTANAS_EXTRA
+    racha = VentanaMovil(len(jugadores), ventanas)
+
+    h2h_tracker = {}
+    m_w, m_l = [None] * n, [None] * n
+    h_w, h_l = [0] * n, [0] * n
+
+    for i, (w, l, jw, jl) in enumerate(zip(winners, losers, ids_w, ids_l)):
+        # Momentum (win rate de los últimos partidos, una columna por ventana)
+        m_w[i] = racha.promedios(jw); m_l[i] = racha.promedios(jl)
+        racha.agregar(jw, 1); racha.agregar(jl, 0)
+
+        # H2H (victorias previas propias - victorias previas del rival)
+        p1, p2 = (w, l) if w <= l else (l, w)
+        record = h2h_tracker.setdefault((p1, p2), [0, 0])
+        if w == p1:
+            h_w[i] = record[0] - record[1]; record[0] += 1
+        else:
+            h_w[i] = record[1] - record[0]; record[1] += 1
+        h_l[i] = -h_w[i]
+
+    return np.array(m_w).reshape(n, -1), np.array(m_l).reshape(n, -1), h_w, h_l
+
+
+# -------------------------------------------------------------------------
+# CONSTRUCCIÓN COMPLETA
+# -------------------------------------------------------------------------
+def calcular_diferencias(df):
+    # Todas las diff_* que usan los distintos modelos (vectorizado)
+    pts_w = df['winner_rank_points'].fillna(0)
+    pts_l = df['loser_rank_points'].fillna(0)
+    diffs = pd.DataFrame({
+        'diff_rank': df['loser_rank'] - df['winner_rank'],
+        'diff_rank_points': pts_w - pts_l,
+        'diff_rank_pts': df['winner_rank_points'] - df['loser_rank_points'],  # Sin relleno (predict.py)
+        'diff_age': df['winner_age'] - df['loser_age'],
+        'diff_ht': df['winner_ht'] - df['loser_ht'],
+        'diff_skill': df['winner_skill'] - df['loser_skill'],
+        'diff_skill_reciente': df['winner_skill_reciente'] - df['loser_skill_reciente'],
+        'diff_home': df['winner_home'] - df['loser_home'],
+        'diff_fatigue': df['winner_fatigue'] - df['loser_fatigue'],
+        'diff_momentum': df['winner_momentum'] - df['loser_momentum'],
+        'diff_h2h': df['winner_h2h'] - df['loser_h2h'],
+        'diff_elo': df['w_elo'] - df['l_elo'],
+        'diff_elo_surf': df['w_elo_surf'] - df['l_elo_surf'],
+    }, index=df.index)
+    for v in VENTANAS_EXTRA:
+        diffs[f'diff_momentum_{v}'] = df[f'winner_momentum_{v}'] - df[f'loser_momentum_{v}']
+    diffs['diff_sets_torneo'] = df['winner_sets_torneo'] - df['loser_sets_torneo']
+    for d in DIAS_VENTANA:
+        diffs[f'diff_min_{d}d'] = df[f'winner_min_{d}d'] - df[f'loser_min_{d}d']
+    return diffs
+
+
+def construir_features(df):
+    # Recibe el historial crudo y devuelve (tabla de variables, motor de skill, estado del Elo)
+    df = df.copy()
+    df['tourney_date'] = pd.to_numeric(df['tourney_date'], errors='coerce')
+    df = ordenar_cronologico(df[df['tourney_date'] > 0])
+    df = df[[c for c in COLUMNAS_BASE if c in df.columns]].reset_index(drop=True)
+
+    for col in ['winner_rank', 'loser_rank', 'winner_rank_points', 'loser_rank_points',
+                'winner_age', 'loser_age', 'winner_ht', 'loser_ht', 'minutes']:
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    # Relleno inteligente: sin dato o 0 minutos -> duración típica
+    df['minutes'] = df['minutes'].where(df['minutes'] > 0, MINUTOS_POR_DEFECTO)
+
+    # Localía: país de cada torneo según la tabla de metadatos (se resuelve por nombre distinto)
+    df['tourney_ioc'] = pais_torneo(df['tourney_name']).to_numpy()
+    df['winner_home'] = (df['winner_ioc'] == df['tourney_ioc']).astype(int)
+    df['loser_home'] = (df['loser_ioc'] == df['tourney_ioc']).astype(int)
+
+    # Elo general y por superficie
+    motor = MotorElo()
+    we, le, wes, les = motor.procesar_df(df)
+    df['w_elo'], df['l_elo'], df['w_elo_surf'], df['l_elo_surf'] = we, le, wes, les
+
+    # Skill por superficie AL DÍA del partido (sin mirar el futuro) + versión con decaimiento
+    motor_skill = MotorSkill(semividas=(None, SEMIVIDA_SKILL))
+    skill_w, skill_l = motor_skill.procesar_df(df)
+    df['winner_skill'], df['loser_skill'] = skill_w[:, 0], skill_l[:, 0]
+    df['winner_skill_reciente'], df['loser_skill_reciente'] = skill_w[:, 1], skill_l[:, 1]
+
+    # Fatiga (minutos y sets en el torneo, minutos en los últimos N días)
+    df = pd.concat([df, variables_fatiga(df)], axis=1)
+
+    # Momentum y H2H
+    m_w, m_l, h_w, h_l = _variables_temporales(df['winner_name'].tolist(), df['loser_name'].tolist())
+    df['winner_momentum'], df['loser_momentum'] = m_w[:, 0], m_l[:, 0]
+    for k, v in enumerate(VENTANAS_EXTRA, start=1):
+        df[f'winner_momentum_{v}'], df[f'loser_momentum_{v}'] = m_w[:, k], m_l[:, k]
+    df['winner_h2h'], df['loser_h2h'] = h_w, h_l
+
+    df = pd.concat([df, calcular_diferencias(df)], axis=1)
+    return df, motor_skill, motor.a_estado(ultima_clave(df), len(df), huella_partidos(df))
+
+
+# -------------------------------------------------------------------------
+# CACHÉ
+# -------------------------------------------------------------------------
+def hash_archivo(ruta, bloque=1 << 20):
+    h = hashlib.sha256()
+    with open(ruta, 'rb') as f:
+        for trozo in iter(lambda: f.read(bloque), b''):
+            h.update(trozo)
+    h.update(f"v{VERSION_FEATURES}".encode())
+    return h.hexdigest()
+
+
+def _stats_a_dict(stats):
+    return dict(zip(zip(stats['player'].astype(str), stats['surface'].astype(str)), stats['win_rate'].astype(float)))
+
+
+def carpeta_features(ruta_csv, carpeta_cache=CARPETA_CACHE):
+    return os.path.join(carpeta_cache, hash_archivo(ruta_csv)[:16])
+
+
+def cargar_features(ruta_csv, columnas=None, carpeta_cache=CARPETA_CACHE, forzar=False):
+    # Devuelve (df_features, stats_dict). Solo recalcula si el CSV cambió.
+    # stats_dict es la foto FINAL del skill por superficie (lo que usa la app);
+    # las columnas winner_skill / loser_skill son el valor al día de cada partido.
+    # En la misma carpeta quedan 'estado_elo.pkl' y 'estado_skill.pkl' con el estado final.
+    inicio = time.time()
+    clave = hash_archivo(ruta_csv)
+    carpeta = os.path.join(carpeta_cache, clave[:16])
+    ruta_tabla = os.path.join(carpeta, 'partidos')
+    ruta_stats = os.path.join(carpeta, 'superficie')
+
+    try:
+        if forzar or leer_manifiesto(ruta_tabla)['meta'].get('hash') != clave:
+            raise FileNotFoundError
+        df = cargar_tabla(ruta_tabla, columnas, mmap=False)
+        stats = cargar_tabla(ruta_stats, mmap=False)
+        print(f"   ⚡ Variables cargadas desde el caché ({clave[:8]}) en {time.time() - inicio:.2f} s")
+    except (FileNotFoundError, ValueError):
+        print(f"   -> Calculando variables (Elo, Skill, Localía, Fatiga, Momentum, H2H)...")
+        df_crudo = pd.read_csv(ruta_csv, low_memory=False)
+        df, motor_skill, estado_elo = construir_features(df_crudo)
+        stats = motor_skill.foto()
+        guardar_tabla(ruta_tabla, df, meta={'hash': clave, 'origen': os.path.basename(ruta_csv)})
+        guardar_tabla(ruta_stats, stats, meta={'hash': clave})
+        guardar_estado(estado_elo, os.path.join(carpeta, 'estado_elo.pkl'))
+        guardar_estado_skill(motor_skill, os.path.join(carpeta, 'estado_skill.pkl'))
+        if columnas:
+            df = df[columnas]
+        print(f"   ⏱️ Variables calculadas y guardadas en {time.time() - inicio:.2f} s")
+
+    # Los textos vuelven como categóricos; los pasamos a str para compararlos libremente
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype(object)
+    return df, _stats_a_dict(stats)
@@ -0,0 +1,194 @@
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from columnar import cargar_tabla, guardar_tabla, leer_manifiesto
+
+# =============================================================================
+# 🗃️ ALMACÉN COLUMNAR DEL HISTORIAL DE PARTIDOS
+# =============================================================================
+# historialTenis.csv se parsea entero en cada script (texto, columnas object,
+# low_memory=False) y cada nombre de jugador o torneo queda repetido como string
+# de Python en cada fila. Al final del pipeline se guarda una copia tipada con
+# columnar.py, al lado del CSV (carpeta historialTenis_columnar/):
+#   - textos (nombres, torneos, superficie, score...) codificados por diccionario -> categóricos
+#   - fechas (tourney_date) en int32
+#   - números en float32 o int32 cuando no se pierde nada (si no, float64 como en el CSV)
+# Las filas quedan en el MISMO orden que el CSV (el índice H2H guarda posiciones).
+#
+#   df = cargar_historial('historialTenis.csv', columnas=['winner_name', 'loser_name', 'surface'],
+#                         desde=20250101)
+#
+# Lee solo esas columnas (y con mmap solo esas filas). Si el almacén no existe o es
+# más viejo que el CSV, lee el CSV (solo esas columnas) y lo tipa igual: el que
+# llama recibe lo mismo en los dos casos.
+#
+# Uso:  python almacen_partidos.py                    (../scraping/historialTenis.csv)
+#       python almacen_partidos.py otro.csv --verificar
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ARCHIVO_HISTORIAL = os.path.join(RAIZ, 'scraping', 'historialTenis.csv')
+COLUMNA_FECHA = 'tourney_date'
+
+
+def ruta_almacen(ruta_csv):
+    return os.path.splitext(ruta_csv)[0] + '_columnar'
+
+
+def firma_csv(ruta_csv):
+    # Tamaño + fecha de modificación: alcanza para saber si el CSV se reescribió (sin leerlo)
+    info = os.stat(ruta_csv)
+    return f"{info.st_size}-{info.st_mtime_ns}"
+
+
+# -------------------------------------------------------------------------
+# TIPOS
+# -------------------------------------------------------------------------
+def _tipar_numerica(valores):
+    # El tipo más chico que guarda exactamente los mismos valores
+    valores = np.asarray(valores, dtype=np.float64)
+    if not np.isnan(valores).any() and np.array_equal(valores, np.round(valores)) \
+            and (len(valores) == 0 or np.abs(valores).max() < 2 ** 31):
+        return valores.astype(np.int32)
+    en_32 = valores.astype(np.float32)
+    if np.array_equal(en_32.astype(np.float64), valores, equal_nan=True):
+        return en_32
+    return valores
+
+
+def tipar_historial(df):
+    # Textos -> categóricos, números -> int32 / float32 / float64 (sin perder nada)
+    tipado = {}
+    for col in df.columns:
+        serie = df[col]
+        if pd.api.types.is_numeric_dtype(serie.dtype) and not pd.api.types.is_bool_dtype(serie.dtype):
+            tipado[col] = _tipar_numerica(serie.to_numpy(dtype=np.float64, na_value=np.nan))
+        else:
+            # Por diccionario: se convierte a str cada valor distinto (no cada fila)
+            codigos, valores = pd.factorize(serie)
+            codigos_txt, textos = pd.factorize(np.array([str(v) for v in valores], dtype=object))  # (1 y '1' -> uno)
+            if len(valores):
+                codigos = np.where(codigos >= 0, codigos_txt[np.maximum(codigos, 0)], -1)
+            tipado[col] = pd.Categorical.from_codes(codigos, categories=pd.Index(textos, dtype=object))
+    return pd.DataFrame(tipado, index=df.index)
+
+
+# -------------------------------------------------------------------------
+# ESCRIBIR / LEER
+# -------------------------------------------------------------------------
+def escribir_almacen(ruta_csv=ARCHIVO_HISTORIAL):
+    df = tipar_historial(pd.read_csv(ruta_csv, low_memory=False))
+    fechas = df[COLUMNA_FECHA].to_numpy(dtype=np.float64) if COLUMNA_FECHA in df.columns else np.array([])
+    ordenado = bool(len(fechas) and not np.isnan(fechas).any() and (np.diff(fechas) >= 0).all())
+    guardar_tabla(ruta_almacen(ruta_csv), df, meta={'origen': os.path.basename(ruta_csv), 'firma': firma_csv(ruta_csv),
+                                                    'ordenado_por_fecha': ordenado})
+    return df
+
+
+def almacen_al_dia(ruta_csv=ARCHIVO_HISTORIAL):
+    try:
+        return leer_manifiesto(ruta_almacen(ruta_csv))['meta'].get('firma') == firma_csv(ruta_csv)
+    except (FileNotFoundError, ValueError):
+        return False
+
+
+def _filas_en_rango(fechas, desde, hasta, ordenado):
+    # slice si las fechas están en orden (dos búsquedas binarias sobre el mmap); si no, posiciones
+    if desde is None and hasta is None:
+        return None
+    if ordenado:
+        inicio = 0 if desde is None else int(np.searchsorted(fechas, desde, side='left'))
+        fin = len(fechas) if hasta is None else int(np.searchsorted(fechas, hasta, side='right'))
+        return slice(inicio, fin)
+    fechas = np.asarray(fechas)
+    mascara = np.ones(len(fechas), dtype=bool)
+    if desde is not None:
+        mascara &= fechas >= desde
+    if hasta is not None:
+        mascara &= fechas <= hasta
+    return np.flatnonzero(mascara)
+
+
+def cargar_historial(ruta_csv=ARCHIVO_HISTORIAL, columnas=None, desde=None, hasta=None, categorias=True):
+    # DataFrame con esas columnas (todas si None) y partidos con desde <= tourney_date <= hasta (AAAAMMDD).
+    # categorias=False: los textos vuelven como str (para ordenar alfabéticamente, comparar con otros CSV...)
+    # Si no hay almacén al día, el CSV. Si no hay CSV -> FileNotFoundError
+    if almacen_al_dia(ruta_csv):
+        carpeta = ruta_almacen(ruta_csv)
+        manifiesto = leer_manifiesto(carpeta)
+        filas = None
+        if desde is not None or hasta is not None:
+            fechas = np.load(os.path.join(carpeta, f'{COLUMNA_FECHA}.npy'), mmap_mode='r')
+            filas = _filas_en_rango(fechas, desde, hasta, manifiesto['meta'].get('ordenado_por_fecha', False))
+        df = cargar_tabla(carpeta, columnas, mmap=True, filas=filas)
+        if filas is not None and not isinstance(filas, slice):
+            df.index = filas
+        elif isinstance(filas, slice):
+            df.index = pd.RangeIndex(filas.start, filas.stop)
+    else:
+        usar = None if columnas is None else list(dict.fromkeys(columnas + [COLUMNA_FECHA] * (desde is not None or hasta is not None)))
+        df = tipar_historial(pd.read_csv(ruta_csv, usecols=usar, low_memory=False))
+        filas = _filas_en_rango(df[COLUMNA_FECHA].to_numpy(dtype=np.float64), desde, hasta, ordenado=False) \
+            if desde is not None or hasta is not None else None
+        df = df if filas is None else df.iloc[filas]
+        df = df[columnas] if columnas is not None else df
+    if not categorias:
+        for col in df.columns:
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype(object)
+    return df
+
+
+if __name__ == "__main__":
+    import subprocess
+    import sys
+
+    parser = argparse.ArgumentParser(description="Guarda el historial de partidos en formato columnar")
+    parser.add_argument('csv', nargs='?', default=ARCHIVO_HISTORIAL)
+    parser.add_argument('--verificar', action='store_true', help="Compara contra el CSV y mide")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.csv):
+        print(f"❌ No existe '{args.csv}'")
+        raise SystemExit(1)
+    inicio = time.perf_counter()
+    df = escribir_almacen(args.csv)
+    carpeta = ruta_almacen(args.csv)
+    peso = sum(os.path.getsize(os.path.join(carpeta, a)) for a in os.listdir(carpeta)) / 1024 ** 2
+    print(f"🗃️ {len(df):,} partidos -> '{carpeta}' ({peso:.1f} MB, CSV: {os.path.getsize(args.csv) / 1024 ** 2:.1f} MB) "
+          f"en {time.perf_counter() - inicio:.2f} s")
+
+    if args.verificar:
+        # --- Mismos datos que el CSV ---
+        crudo = pd.read_csv(args.csv, low_memory=False)
+        leido = cargar_historial(args.csv, categorias=False)
+        for col in crudo.columns:
+            a, b = crudo[col], leido[col]
+            if pd.api.types.is_numeric_dtype(a.dtype):
+                assert np.array_equal(a.to_numpy(dtype=float, na_value=np.nan), b.to_numpy(dtype=float), equal_nan=True), col
+            else:
+                assert (a.isna() == b.isna()).all() and (a[a.notna()].astype(str) == b[b.notna()]).all(), col
+        fechas = crudo[COLUMNA_FECHA]
+        desde, hasta = fechas.quantile(0.5), fechas.max()
+        rango = cargar_historial(args.csv, ['winner_name'], desde=desde, hasta=hasta)
+        assert len(rango) == ((fechas >= desde) & (fechas <= hasta)).sum()
+        print("   ✅ Mismos valores que el CSV (y el filtro por fechas coincide)")
+
+        # --- Tiempo y memoria (proceso nuevo por caso) ---
+        columnas_app = ['tourney_date', 'tourney_name', 'round', 'surface', 'winner_name', 'loser_name', 'score']
+        casos = {
+            'CSV completo': f"pd.read_csv({args.csv!r}, low_memory=False)",
+            'CSV, 7 columnas': f"pd.read_csv({args.csv!r}, usecols={columnas_app!r}, low_memory=False)",
+            'Almacén, 7 columnas': f"cargar_historial({args.csv!r}, {columnas_app!r})",
+        }
+        base = ("import time, pandas as pd; from almacen_partidos import cargar_historial; "
+                "t = time.perf_counter(); df = {}; "
+                "s = time.perf_counter() - t; print(s, df.memory_usage(deep=True).sum())")
+        for nombre, codigo in casos.items():
+            salida = subprocess.run([sys.executable, '-c', base.format(codigo)], capture_output=True, text=True,
+                                    check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+            segundos, memoria = map(float, salida.stdout.split())
+            print(f"   ⏱️ {nombre:<20} {segundos * 1000:8.1f} ms | {memoria / 1024 ** 2:7.1f} MB en memoria")
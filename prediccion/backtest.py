@@ -0,0 +1,144 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import accuracy_score, brier_score_loss, log_loss
+
+from almacen_features import cargar_features
+from dataset_simetrico import espejar, orden_mezclado
+from memoria_compartida import DATOS, adjuntar, compartir, liberar
+from registro_modelos import MODELOS, crear_modelo, nombre_modelo
+
+# =============================================================================
+# 📅 BACKTEST WALK-FORWARD (temporada por temporada)
+# =============================================================================
+# El train_test_split al azar de los scripts mezcla partidos del futuro en el
+# entrenamiento. Acá la evaluación es "honesta":
+#   Fold Y+1 -> se entrena con todos los partidos hasta el año Y y se prueba en Y+1.
+#
+# - Cualquier modelo del registro (registro_modelos.py) se puede evaluar.
+# - Los folds corren en paralelo (un proceso por fold).
+# - Las variables se cargan UNA vez y se ponen en memoria compartida: los procesos
+#   las leen sin copiarlas (importante en Windows, donde cada proceso arranca de cero).
+#
+# Uso:  python backtest.py --csv historial_tenis_COMPLETO.csv --modelos logistica xgboost --desde 2015
+#       python backtest.py --procesos 1 2 4 8     -> mide cómo escala con los núcleos
+
+FEATURES = ['diff_rank', 'diff_rank_points', 'diff_age', 'diff_ht', 'diff_skill',
+            'diff_home', 'diff_fatigue', 'diff_momentum', 'diff_h2h']
+ARCHIVO_RESULTADOS = 'resultados_backtest.csv'
+
+
+# -------------------------------------------------------------------------
+# DATOS (se ponen en memoria compartida con memoria_compartida.py)
+# -------------------------------------------------------------------------
+def preparar_datos(ruta_csv, features=FEATURES):
+    # Una fila por partido (diffs vistas desde el ganador) + el año de cada partido
+    df, _ = cargar_features(ruta_csv, columnas=features + ['tourney_date'])
+    df = df.dropna(subset=features)
+    diffs = np.ascontiguousarray(df[features].to_numpy(dtype=np.float32))
+    anios = (df['tourney_date'].to_numpy(dtype=np.int64) // 10000).astype(np.int32)
+    return diffs, anios
+
+
+# -------------------------------------------------------------------------
+# UN FOLD
+# -------------------------------------------------------------------------
+def correr_fold(id_modelo, anio_test):
+    inicio = time.perf_counter()
+    diffs, anios = DATOS['diffs'], DATOS['anios']
+    entrenamiento = np.flatnonzero(anios < anio_test)
+    prueba = np.flatnonzero(anios == anio_test)
+
+    # Mismo armado que los scripts: dos filas por partido, entrenamiento mezclado
+    X_train, y_train = espejar(diffs[entrenamiento], orden_mezclado(len(entrenamiento)))
+    X_test, y_test = espejar(diffs[prueba])
+
+    modelo = crear_modelo(id_modelo)
+    modelo.fit(X_train, y_train)
+    prob = modelo.predict_proba(X_test)[:, 1]
+
+    return {
+        'Modelo': nombre_modelo(id_modelo),
+        'Año': int(anio_test),
+        'Partidos_Train': len(entrenamiento),
+        'Partidos_Test': len(prueba),
+        'Accuracy': accuracy_score(y_test, prob > 0.5),
+        'LogLoss': log_loss(y_test, prob, labels=[0, 1]),
+        'Brier': brier_score_loss(y_test, prob),
+        'Segundos': time.perf_counter() - inicio,
+    }
+
+
+# -------------------------------------------------------------------------
+# TODOS LOS FOLDS
+# -------------------------------------------------------------------------
+def anios_de_prueba(anios, desde=None, min_anios_train=1):
+    # Cada año con al menos min_anios_train temporadas previas para entrenar
+    unicos = np.unique(anios)
+    candidatos = unicos[min_anios_train:]
+    return [int(a) for a in candidatos if desde is None or a >= desde]
+
+
+def backtest(descripcion, modelos, anios_test, procesos=None):
+    # Devuelve (DataFrame con una fila por modelo y año, segundos de pared totales)
+    tareas = [(m, a) for m in modelos for a in anios_test]
+    inicio = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=procesos, initializer=adjuntar, initargs=(descripcion,)) as pool:
+        futuros = [pool.submit(correr_fold, m, a) for m, a in tareas]
+        filas = [f.result() for f in futuros]
+    return pd.DataFrame(filas), time.perf_counter() - inicio
+
+
+def imprimir_reporte(resultados, pared, procesos):
+    print("\n" + "=" * 86)
+    print(f"{'Modelo':<22} {'Año':>5} {'Train':>8} {'Test':>7} {'Accuracy':>9} {'LogLoss':>8} {'Brier':>7} {'Seg.':>7}")
+    print("-" * 86)
+    for _, r in resultados.iterrows():
+        print(f"{r['Modelo']:<22} {r['Año']:>5} {r['Partidos_Train']:>8,} {r['Partidos_Test']:>7,} "
+              f"{r['Accuracy']:>9.2%} {r['LogLoss']:>8.4f} {r['Brier']:>7.4f} {r['Segundos']:>7.2f}")
+
+    print("-" * 86)
+    resumen = resultados.groupby('Modelo').agg(Accuracy=('Accuracy', 'mean'), LogLoss=('LogLoss', 'mean'),
+                                               Brier=('Brier', 'mean'), Segundos=('Segundos', 'sum'))
+    for modelo, r in resumen.sort_values('Accuracy', ascending=False).iterrows():
+        print(f"🏆 {modelo:<20} promedio: {r['Accuracy']:.2%} | LogLoss {r['LogLoss']:.4f} | "
+              f"Brier {r['Brier']:.4f} | {r['Segundos']:.1f} s de CPU")
+
+    suma = resultados['Segundos'].sum()
+    print(f"\n⏱️ {procesos or os.cpu_count()} procesos: {pared:.1f} s de pared para {suma:.1f} s de folds "
+          f"(aceleración {suma / pared:.1f}x)")
+    print("=" * 86)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backtest walk-forward por temporada")
+    parser.add_argument('--csv', default='historial_tenis_COMPLETO.csv')
+    parser.add_argument('--modelos', nargs='+', default=list(MODELOS), choices=list(MODELOS))
+    parser.add_argument('--desde', type=int, default=None, help="Primer año de prueba")
+    parser.add_argument('--procesos', type=int, nargs='+', default=[None],
+                        help="Cantidad de procesos (varios valores = prueba de escalado)")
+    parser.add_argument('--salida', default=ARCHIVO_RESULTADOS)
+    args = parser.parse_args()
+
+    print("📅 BACKTEST WALK-FORWARD")
+    diffs, anios = preparar_datos(args.csv)
+    anios_test = anios_de_prueba(anios, args.desde)
+    if not anios_test:
+        print("❌ Hace falta más de una temporada para armar folds.")
+        raise SystemExit(1)
+    print(f"   -> {len(diffs):,} partidos | folds: {anios_test[0]}..{anios_test[-1]} | modelos: {', '.join(args.modelos)}")
+
+    bloques, descripcion = compartir({'diffs': diffs, 'anios': anios})
+    try:
+        for procesos in args.procesos:
+            resultados, pared = backtest(descripcion, args.modelos, anios_test, procesos)
+            imprimir_reporte(resultados, pared, procesos)
+    finally:
+        liberar(bloques)
+
+    resultados.to_csv(args.salida, index=False)
+    print(f"💾 Resultados guardados en '{args.salida}'")
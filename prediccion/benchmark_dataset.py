@@ -0,0 +1,67 @@
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from dataset_simetrico import construir_simetrico
+
+# =============================================================================
+# ⏱️ BENCHMARK: dataset simétrico con dicts vs arrays
+# =============================================================================
+# Compara tiempo y memoria pico (tracemalloc) del armado viejo
+# (df.iterrows() + 2 dicts por partido + pd.DataFrame) contra construir_simetrico().
+#
+# Uso:  python benchmark_dataset.py --tamanos 100000 500000
+
+FEATURES = ['diff_rank', 'diff_rank_points', 'diff_age', 'diff_ht', 'diff_skill',
+            'diff_home', 'diff_fatigue', 'diff_momentum', 'diff_h2h']
+
+
+def armar_con_dicts(df, features):
+    # Copia de la forma vieja (predict_xgboost.py / comparar_modelos.py)
+    data_rows = []
+    df_sample = df.sample(frac=1, random_state=42)
+    for index, row in df_sample.iterrows():
+        diffs = {f: row[f] for f in features}
+        d1 = diffs.copy(); d1['target'] = 1
+        data_rows.append(d1)
+        d0 = {k: -v for k, v in diffs.items()}; d0['target'] = 0
+        data_rows.append(d0)
+    df_train = pd.DataFrame(data_rows)
+    return df_train[features], df_train['target']
+
+
+def diffs_sinteticas(n, semilla=0):
+    rng = np.random.default_rng(semilla)
+    return pd.DataFrame({f: rng.normal(0, 50, n).round(1) for f in FEATURES})
+
+
+def medir(funcion, *args):
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = funcion(*args)
+    segundos = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, segundos, pico / 1e6
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark del dataset simétrico")
+    parser.add_argument('--tamanos', type=int, nargs='+', default=[100_000, 500_000])
+    args = parser.parse_args()
+
+    print(f"{'Partidos':>10} | {'dicts (s)':>9} | {'dicts (MB)':>10} | {'arrays (s)':>10} | {'arrays (MB)':>11} | {'Acel.':>6}")
+    print("-" * 72)
+    for n in args.tamanos:
+        df = diffs_sinteticas(n)
+        (X_viejo, y_viejo), t_viejo, mem_viejo = medir(armar_con_dicts, df, FEATURES)
+        (X, y), t_nuevo, mem_nuevo = medir(construir_simetrico, df, FEATURES)
+
+        # Mismas filas, mismo orden (a precisión float32)
+        assert np.array_equal(X_viejo.to_numpy(dtype=np.float32), X), "❌ Las features no coinciden"
+        assert np.array_equal(y_viejo.to_numpy(dtype=np.float32), y), "❌ Los targets no coinciden"
+
+        print(f"{n:>10,} | {t_viejo:9.2f} | {mem_viejo:10.1f} | {t_nuevo:10.3f} | {mem_nuevo:11.1f} | {t_viejo / t_nuevo:5.0f}x")
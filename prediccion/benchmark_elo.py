@@ -0,0 +1,117 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from motor_elo import calcular_elo
+
+# =============================================================================
+# ⏱️ BENCHMARK: Elo con iterrows vs Motor de Elo con arrays
+# =============================================================================
+# Uso:  python benchmark_elo.py
+#       python benchmark_elo.py --tamanos 100000 1000000 10000000 --legado-max 1000000
+# El cálculo viejo es MUY lento en tamaños grandes: por encima de --legado-max
+# se estima su tiempo por extrapolación lineal (es O(n) con costo constante por fila).
+
+
+def calcular_elo_iterrows(df_matches):
+    # Copia fiel de la versión original de predict.py (referencia para comparar)
+    elo_dict = {}
+    elo_surf_dict = {}
+    w_elo, l_elo = [], []
+    w_elo_surf, l_elo_surf = [], []
+
+    STARTING_ELO = 1500
+
+    for idx, row in df_matches.iterrows():
+        w, l, surf = row['winner_name'], row['loser_name'], row['surface']
+
+        we = elo_dict.get(w, STARTING_ELO)
+        le = elo_dict.get(l, STARTING_ELO)
+        wes = elo_surf_dict.get((w, surf), STARTING_ELO)
+        les = elo_surf_dict.get((l, surf), STARTING_ELO)
+
+        w_elo.append(we); l_elo.append(le)
+        w_elo_surf.append(wes); l_elo_surf.append(les)
+
+        pw = 1 / (1 + 10 ** ((le - we) / 400))
+        pws = 1 / (1 + 10 ** ((les - wes) / 400))
+
+        k = 32
+        if 'Grand Slam' in str(row['tourney_level']): k = 50
+        elif 'Masters' in str(row['tourney_level']): k = 40
+
+        delta = k * (1 - pw)
+        delta_s = k * (1 - pws)
+
+        elo_dict[w] = we + delta
+        elo_dict[l] = le - delta
+        elo_surf_dict[(w, surf)] = wes + delta_s
+        elo_surf_dict[(l, surf)] = les - delta_s
+
+    return w_elo, l_elo, w_elo_surf, l_elo_surf, elo_dict, elo_surf_dict
+
+
+def partidos_sinteticos(n, n_jugadores=5000, semilla=42):
+    # Partidos aleatorios con las columnas que usa el Elo
+    rng = np.random.default_rng(semilla)
+    nombres = np.array([f"Jugador {i}" for i in range(n_jugadores)], dtype=object)
+    w = rng.integers(0, n_jugadores, n)
+    l = (w + rng.integers(1, n_jugadores, n)) % n_jugadores  # Nunca juega contra sí mismo
+    return pd.DataFrame({
+        'winner_name': nombres[w],
+        'loser_name': nombres[l],
+        'surface': rng.choice(np.array(['Hard', 'Clay', 'Grass', 'Carpet'], dtype=object), n, p=[0.55, 0.3, 0.12, 0.03]),
+        'tourney_level': rng.choice(np.array(['A', 'Masters 1000', 'Grand Slam', 'D'], dtype=object), n, p=[0.6, 0.2, 0.15, 0.05]),
+    })
+
+
+def verificar_paridad(df):
+    viejo = calcular_elo_iterrows(df)
+    nuevo = calcular_elo(df)
+    for a, b in zip(viejo[:4], nuevo[:4]):
+        assert np.array_equal(np.asarray(a, dtype=float), b), "❌ Las columnas de Elo no coinciden"
+    assert viejo[4] == nuevo[4], "❌ elo_rating.pkl no coincide"
+    assert viejo[5] == nuevo[5], "❌ elo_rating_surface.pkl no coincide"
+
+
+def medir(funcion, df):
+    inicio = time.perf_counter()
+    funcion(df)
+    return time.perf_counter() - inicio
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark del cálculo de Elo")
+    parser.add_argument('--tamanos', type=int, nargs='+', default=[100_000, 1_000_000, 10_000_000])
+    parser.add_argument('--legado-max', type=int, default=1_000_000,
+                        help="Tamaño máximo en el que se ejecuta realmente la versión con iterrows")
+    args = parser.parse_args()
+
+    print("🔬 Verificando que ambos cálculos den exactamente lo mismo (20.000 partidos)...")
+    verificar_paridad(partidos_sinteticos(20_000))
+    print("   ✅ Paridad exacta.\n")
+
+    print(f"{'Partidos':>12} | {'iterrows (s)':>14} | {'Motor (s)':>10} | {'Aceleración':>11}")
+    print("-" * 58)
+
+    seg_por_fila = None
+    for n in args.tamanos:
+        df = partidos_sinteticos(n)
+        t_nuevo = medir(calcular_elo, df)
+
+        if n <= args.legado_max:
+            t_viejo = medir(calcular_elo_iterrows, df)
+            seg_por_fila = t_viejo / n
+            etiqueta = f"{t_viejo:14.2f}"
+        elif seg_por_fila is not None:
+            t_viejo = seg_por_fila * n
+            etiqueta = f"{'~' + format(t_viejo, '.2f'):>14}"  # Estimado
+        else:
+            t_viejo, etiqueta = None, f"{'-':>14}"
+
+        acel = f"{t_viejo / t_nuevo:10.1f}x" if t_viejo else f"{'-':>11}"
+        print(f"{n:>12,} | {etiqueta} | {t_nuevo:10.2f} | {acel}")
+
+    print("\n(~ = tiempo estimado por extrapolación lineal)")
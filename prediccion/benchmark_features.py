@@ -0,0 +1,57 @@
+import argparse
+import shutil
+import tempfile
+import time
+
+import pandas as pd
+
+from almacen_features import cargar_features, construir_features
+
+# =============================================================================
+# ⏱️ BENCHMARK: ¿Cuánto ahorra el almacén de variables?
+# =============================================================================
+# El flujo de trabajo normal corre 5 scripts seguidos sobre el mismo CSV:
+#   predict.py, predict_RF.py, predict_LR.py, predict_xgboost.py, comparar_modelos.py
+# Antes, cada uno leía el CSV y recalculaba todas las variables.
+# Ahora el primero las calcula y los otros 4 las cargan del caché.
+#
+# Uso:  python benchmark_features.py --csv historial_tenis_COMPLETO.csv
+
+SCRIPTS = ['predict.py', 'predict_RF.py', 'predict_LR.py', 'predict_xgboost.py', 'comparar_modelos.py']
+
+
+def medir(funcion):
+    inicio = time.perf_counter()
+    funcion()
+    return time.perf_counter() - inicio
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark del almacén de variables")
+    parser.add_argument('--csv', default='historial_tenis_COMPLETO.csv')
+    args = parser.parse_args()
+
+    cache = tempfile.mkdtemp(prefix='cache_features_')
+    try:
+        # Sin almacén: cada script lee el CSV y calcula todo desde cero
+        t_calculo = medir(lambda: construir_features(pd.read_csv(args.csv, low_memory=False)))
+
+        # Con almacén: el primer script llena el caché, el resto lo lee
+        t_frio = medir(lambda: cargar_features(args.csv, carpeta_cache=cache))
+        t_calientes = [medir(lambda: cargar_features(args.csv, carpeta_cache=cache)) for _ in SCRIPTS[1:]]
+    finally:
+        shutil.rmtree(cache, ignore_errors=True)
+
+    sin_almacen = t_calculo * len(SCRIPTS)
+    con_almacen = t_frio + sum(t_calientes)
+
+    print("\n" + "=" * 50)
+    print(f"📄 CSV: {args.csv}")
+    print(f"   Cálculo completo por script:      {t_calculo:8.2f} s")
+    print(f"   Carga desde caché por script:     {sum(t_calientes) / len(t_calientes):8.2f} s")
+    print("-" * 50)
+    print(f"   {len(SCRIPTS)} scripts SIN almacén:            {sin_almacen:8.2f} s")
+    print(f"   {len(SCRIPTS)} scripts CON almacén:            {con_almacen:8.2f} s")
+    print(f"   🚀 Ahorro: {sin_almacen - con_almacen:.2f} s ({sin_almacen / con_almacen:.1f}x)")
+    print("=" * 50)
+    print("(Los scripts viejos usaban df.iterrows(), así que el ahorro real es todavía mayor)")
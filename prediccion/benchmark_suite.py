@@ -0,0 +1,466 @@
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import joblib
+import numpy as np
+import pandas as pd
+
+# =============================================================================
+# ⏱️ SUITE DE BENCHMARKS DE PUNTA A PUNTA (todas las etapas del proyecto)
+# =============================================================================
+# Mide tiempo y pico de memoria (RSS) de cada etapa sobre historiales sintéticos
+# FIJOS (generador_sintetico.py, misma semilla siempre) de varios tamaños:
+#   - Pipeline de actualizador_maestro.py sin la parte de red:
+#       enriquecer -> corregir superficie -> juntar -> fusionar -> generar perfiles
+#   - analisis/acomodar_ds.py
+#   - Cálculo de variables (almacén de features, en frío)
+#   - Cada script de entrenamiento
+#   - cargar_todo() de la app (todo de una), el arranque perezoso de la página y predicciones (de a una y en lote)
+#
+# Cada tamaño corre en una carpeta temporal con una COPIA del código y los datos
+# sintéticos en los nombres de archivo que espera cada script. Cada etapa es un
+# proceso nuevo: el pico de RAM es el de esa etapa (os.wait4, solo Linux/macOS).
+# En las etapas "internas" el tiempo es el de la función, sin contar los imports.
+#
+# Los resultados se agregan a un historial JSON y se comparan contra una base:
+#   python benchmark_suite.py correr --tamanos chico mediano
+#   python benchmark_suite.py base                  -> la última corrida pasa a ser la base
+#   python benchmark_suite.py comparar              -> marca las etapas más lentas que la base
+#   python benchmark_suite.py correr --etapas generar_perfiles predict_xgboost --comparar
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CARPETAS_CODIGO = ('prediccion', 'scraping', 'analisis', 'pages')
+ARCHIVO_HISTORIAL = 'benchmarks.json'
+ARCHIVO_BASE = 'benchmark_base.json'
+VERSION_HISTORIAL = 1
+UMBRAL = 0.20           # Más de 20% más lento que la base -> regresión
+MINIMO_SEGUNDOS = 0.05  # Diferencias menores son ruido
+MARCA = '@@BENCH@@'     # Línea con el resultado de una etapa interna
+SEMILLA = 2026
+ANIO_FINAL = 2026       # La última temporada sintética hace de "2026 scrapeado"
+
+# (jugadores, temporadas, torneos por temporada)
+TAMANOS = {
+    'chico': (300, 5, 30),
+    'mediano': (1000, 10, 60),
+    'grande': (3000, 20, 120),
+}
+
+# (nombre, carpeta donde corre, comando | None si es interna, etapas de las que depende)
+ETAPAS = [
+    ('enriquecer', 'scraping', ['enriquecer_2026.py'], []),
+    ('corregir_superficie', 'scraping', ['corregir_superficie_ranking.py'], ['enriquecer']),
+    ('juntar', 'scraping', ['juntar_scrapings.py'], ['corregir_superficie']),
+    ('fusionar', 'scraping', ['fusionar_historico_final.py'], ['juntar']),
+    ('generar_perfiles', 'scraping', ['generar_perfiles.py'], ['fusionar']),
+    ('acomodar_ds', 'analisis', ['acomodar_ds.py'], []),
+    ('features', 'prediccion', None, []),
+    ('predict_LR', 'prediccion', ['predict_LR.py'], ['features']),
+    ('predict_RF', 'prediccion', ['predict_RF.py'], ['features']),
+    ('predict_xgboost', 'prediccion', ['predict_xgboost.py'], ['features']),
+    ('predict', 'prediccion', ['predict.py'], ['features']),
+    ('comparar_modelos', 'prediccion', ['comparar_modelos.py'], ['features']),
+    ('cargar_todo', 'prediccion', None, ['generar_perfiles', 'predict_LR', 'predict_xgboost']),
+    ('arranque_app', 'prediccion', None, ['generar_perfiles', 'predict_LR', 'predict_xgboost']),
+    ('prediccion_1', 'prediccion', None, ['generar_perfiles', 'predict_LR', 'predict_xgboost']),
+    ('prediccion_lote', 'prediccion', None, ['generar_perfiles', 'predict_LR', 'predict_xgboost']),
+]
+NOMBRES_ETAPAS = [e[0] for e in ETAPAS]
+PREDICCIONES_1 = 200
+FILAS_LOTE = 10_000
+
+
+# -------------------------------------------------------------------------
+# CARPETA DE PRUEBA (código + datos sintéticos)
+# -------------------------------------------------------------------------
+def _solo_codigo(carpeta, archivos):
+    # copytree: solo los .py (nada de CSV, pkl ni __pycache__ reales)
+    return [a for a in archivos if not a.endswith('.py')]
+
+
+def _formato_largo(df):
+    # Una fila por jugador y partido, con sus datos de ese partido
+    cols = ['name', 'rank', 'rank_points', 'ht', 'age', 'ioc']
+    largo = pd.concat([df[[f'{lado}_{c}' for c in cols] + ['tourney_date']]
+                       .set_axis(cols + ['tourney_date'], axis=1) for lado in ('winner', 'loser')])
+    return largo.sort_values('tourney_date', kind='stable')
+
+
+def _como_scrapeado(df):
+    # Lo que baja el scraper: sin fecha ni datos biográficos (solo el ranking)
+    scrap = df.copy()
+    vacias = ['tourney_date', 'match_num', 'draw_size', 'tourney_level', 'best_of',
+              'winner_id', 'winner_seed', 'winner_entry', 'winner_hand', 'winner_ht', 'winner_ioc', 'winner_age',
+              'loser_id', 'loser_seed', 'loser_entry', 'loser_hand', 'loser_ht', 'loser_ioc', 'loser_age',
+              'winner_rank_points', 'loser_rank_points']
+    scrap[vacias] = 0
+    return scrap
+
+
+def preparar_carpeta(tamano, destino):
+    # Devuelve la cantidad de partidos del historial sintético
+    from generador_sintetico import generar_historial
+
+    for carpeta in CARPETAS_CODIGO:
+        shutil.copytree(os.path.join(RAIZ, carpeta), os.path.join(destino, carpeta), ignore=_solo_codigo)
+    pred, scrap = os.path.join(destino, 'prediccion'), os.path.join(destino, 'scraping')
+
+    jugadores, temporadas, torneos = TAMANOS[tamano]
+    df = generar_historial(jugadores, temporadas, torneos, anio_inicio=ANIO_FINAL - temporadas + 1, semilla=SEMILLA)
+    anios = df['tourney_date'] // 10000
+
+    # Entrenamiento (cada script lee un nombre distinto) y entrada de acomodar_ds.py
+    completo = os.path.join(pred, 'historial_tenis_COMPLETO.csv')
+    df.to_csv(completo, index=False)
+    for nombre in ('historial_tenis.csv', 'historialTenis.csv'):
+        shutil.copyfile(completo, os.path.join(pred, nombre))
+    shutil.copyfile(completo, os.path.join(scrap, 'historial_tenis_COMPLETO.csv'))
+
+    # Pipeline: histórico + dos temporadas "scrapeadas" + perfiles y ranking de la corrida anterior
+    df[anios < ANIO_FINAL - 1].to_csv(os.path.join(scrap, 'historial_tenis.csv'), index=False)
+    _como_scrapeado(df[anios == ANIO_FINAL - 1]).to_csv(os.path.join(scrap, 'atp_matches_2025.csv'), index=False)
+    _como_scrapeado(df[anios == ANIO_FINAL]).to_csv(os.path.join(scrap, 'atp_matches_2026_indetectable.csv'), index=False)
+
+    previo = _formato_largo(df[anios < ANIO_FINAL]).groupby('name').last()
+    perfiles = {n: {'rank': r['rank'], 'points': r['rank_points'], 'ht': r['ht'], 'age': r['age'], 'ioc': r['ioc']}
+                for n, r in previo.iterrows()}
+    joblib.dump(perfiles, os.path.join(scrap, 'perfiles_jugadores.pkl'))
+
+    actual = _formato_largo(df[anios == ANIO_FINAL]).groupby('name').last().sort_values('rank').head(500)
+    nombres = actual.index.to_series()
+    pd.DataFrame({
+        'player': nombres.str[0] + '. ' + nombres.str.split(' ', n=1).str[1],  # "C. Alcaraz"
+        'rank': actual['rank'].to_numpy(),
+        'points': actual['rank_points'].to_numpy(),
+        'url_perfil': 'https://www.atptour.com/en/players/' + nombres.str.lower().str.replace(' ', '-') + '/x000/overview',
+    }).to_csv(os.path.join(scrap, 'ranking_2026.csv'), index=False)
+    return len(df)
+
+
+# -------------------------------------------------------------------------
+# ETAPAS INTERNAS (corren dentro del proceso hijo, en la carpeta de prueba)
+# -------------------------------------------------------------------------
+def _interna_features(raiz):
+    from almacen_features import CARPETA_CACHE, cargar_features
+    shutil.rmtree(CARPETA_CACHE, ignore_errors=True)  # En frío: calcula y deja el caché para los entrenamientos
+    df, _ = cargar_features('historial_tenis_COMPLETO.csv')
+    return {'partidos': len(df)}
+
+
+def _interna_cargar_todo(raiz):
+    from recursos_app import cargar_recursos
+    perfiles = cargar_recursos(raiz)[4]
+    return {'jugadores': len(perfiles)}
+
+
+def _interna_arranque_app(raiz):
+    # Lo que la página carga antes de mostrarse (el modelo y el scaler se piden recién al predecir)
+    from recursos_app import Recursos
+    rec = Recursos(raiz)
+    for nombre in ('stats_superficie', 'perfiles', 'ranking_2026', 'indice_h2h'):
+        rec.obtener(nombre)
+    diag = rec.diagnostico()
+    return {'recursos': int(diag['Cargado'].sum()), 'rss_mb': float(diag['RSS MB'].sum()),
+            'mb_estimado': float(diag['MB estimado'].sum())}
+
+
+def _entrada_app(perfiles, stats_dict, p1, p2, superficie='Hard'):
+    # El mismo DataFrame de una fila que arma la página al tocar "Predecir"
+    d1, d2 = perfiles[p1], perfiles[p2]
+    return pd.DataFrame([{
+        'diff_rank': d2['rank'] - d1['rank'],
+        'diff_rank_points': d1.get('points', 0) - d2.get('points', 0),
+        'diff_age': d1['age'] - d2['age'],
+        'diff_ht': d1['ht'] - d2['ht'],
+        'diff_skill': stats_dict.get((p1, superficie), 0.5) - stats_dict.get((p2, superficie), 0.5),
+        'diff_home': 0,
+        'diff_fatigue': 0,
+        'diff_momentum': d1['momentum'] - d2['momentum'],
+        'diff_h2h': 0,
+    }])
+
+
+def _interna_prediccion_1(raiz):
+    from recursos_app import cargar_recursos
+    model_xgb, model_log, scaler, stats_dict, perfiles = cargar_recursos(raiz)[:5]
+    nombres = list(perfiles)
+    rng = np.random.default_rng(0)
+    pares = rng.integers(0, len(nombres), size=(PREDICCIONES_1, 2))
+
+    inicio = time.perf_counter()
+    for i, j in pares.tolist():
+        entrada = scaler.transform(_entrada_app(perfiles, stats_dict, nombres[i], nombres[j]))
+        model_xgb.predict_proba(entrada)
+        model_log.predict_proba(entrada)
+    segundos = time.perf_counter() - inicio
+    return {'ms_por_prediccion': 1000 * segundos / PREDICCIONES_1, 'segundos_medidos': segundos}
+
+
+def _interna_prediccion_lote(raiz):
+    # Lo mismo que predictor_lote.py: features de N partidos con arrays y una sola llamada al modelo
+    from predictor_lote import PredictorLote
+    predictor = PredictorLote.desde_recursos(raiz, 'xgboost')
+    rng = np.random.default_rng(0)
+    nombres = np.array(predictor.nombres, dtype=object)
+    pares = list(zip(*(nombres[rng.integers(0, len(nombres), FILAS_LOTE)] for _ in range(2))))
+
+    inicio = time.perf_counter()
+    predictor.predict_many(pares, 'Hard', 'NEUTRAL')
+    segundos = time.perf_counter() - inicio
+    return {'filas_por_segundo': FILAS_LOTE / segundos, 'segundos_medidos': segundos}
+
+
+INTERNAS = {
+    'features': _interna_features,
+    'cargar_todo': _interna_cargar_todo,
+    'arranque_app': _interna_arranque_app,
+    'prediccion_1': _interna_prediccion_1,
+    'prediccion_lote': _interna_prediccion_lote,
+}
+
+
+def _correr_interna(nombre, raiz):
+    # Punto de entrada del proceso hijo: mide SOLO la función (los imports ya pasaron)
+    inicio = time.perf_counter()
+    detalle = INTERNAS[nombre](raiz)
+    segundos = detalle.pop('segundos_medidos', time.perf_counter() - inicio)
+    print(MARCA + json.dumps({'segundos': segundos, 'detalle': detalle}))
+
+
+# -------------------------------------------------------------------------
+# EJECUCIÓN DE UNA ETAPA (proceso hijo + medición)
+# -------------------------------------------------------------------------
+# Lanzador mínimo: en Linux el pico de RAM de un hijo arranca en el del proceso que lo creó
+# (fork + exec heredan el máximo). Si lanzara la suite (con los datos en memoria) todas las
+# etapas medirían eso como mínimo; este intérprete vacío es el que hace fork y mide con wait4.
+_LANZADOR = """
+import os, sys
+pid = os.fork()
+if pid == 0:
+    os.execv(sys.executable, [sys.executable] + sys.argv[1:])
+_, estado, uso = os.wait4(pid, 0)
+print('@@RSS@@', uso.ru_maxrss, flush=True)
+sys.exit(os.waitstatus_to_exitcode(estado))
+"""
+
+
+def _ejecutar(comando, cwd):
+    # Devuelve (código de salida, salida, segundos de pared, pico de RSS en MB del hijo)
+    env = dict(os.environ, MPLBACKEND='Agg', PYTHONIOENCODING='utf-8')
+    medir_rss = hasattr(os, 'wait4') and hasattr(os, 'fork')  # Solo Linux / macOS
+    previo = [sys.executable, '-c', _LANZADOR] if medir_rss else [sys.executable]
+    inicio = time.perf_counter()
+    resultado = subprocess.run([*previo, '-X', 'utf8', *comando], cwd=cwd, env=env, capture_output=True,
+                               text=True, encoding='utf-8', errors='replace')
+    pared = time.perf_counter() - inicio
+
+    salida, rss = resultado.stdout + resultado.stderr, float('nan')
+    for linea in resultado.stdout.splitlines():
+        if linea.startswith('@@RSS@@'):
+            rss = int(linea.split()[1]) / (1024 ** 2 if sys.platform == 'darwin' else 1024)  # macOS: bytes | Linux: KB
+    return resultado.returncode, salida, pared, rss
+
+
+def correr_etapa(nombre, raiz):
+    _, carpeta, comando, _ = ETAPAS[NOMBRES_ETAPAS.index(nombre)]
+    cwd = os.path.join(raiz, carpeta)
+    if comando is None:
+        comando = [os.path.join(raiz, 'prediccion', 'benchmark_suite.py'), '_interna', nombre, raiz]
+    codigo, salida, pared, rss = _ejecutar(comando, cwd)
+
+    # Los scripts del proyecto atrapan sus errores e imprimen ❌ (y salen con 0)
+    ok = codigo == 0 and '❌' not in salida
+    resultado = {'etapa': nombre, 'segundos': pared, 'rss_pico_mb': rss, 'ok': ok, 'detalle': {}}
+    for linea in salida.splitlines():
+        if linea.startswith(MARCA):
+            interna = json.loads(linea[len(MARCA):])
+            resultado['segundos'] = interna['segundos']
+            resultado['detalle'] = dict(interna['detalle'], segundos_proceso=pared)
+    return resultado, salida
+
+
+def resolver_etapas(pedidas):
+    # Agrega las dependencias que falten y respeta el orden del pipeline
+    necesarias, pendientes = set(), list(pedidas)
+    while pendientes:
+        etapa = pendientes.pop()
+        if etapa not in necesarias:
+            necesarias.add(etapa)
+            pendientes.extend(ETAPAS[NOMBRES_ETAPAS.index(etapa)][3])
+    return [e for e in NOMBRES_ETAPAS if e in necesarias]
+
+
+def correr_suite(tamanos, etapas, repeticiones=1, conservar=False):
+    resultados = []
+    for tamano in tamanos:
+        raiz = tempfile.mkdtemp(prefix=f'bench_{tamano}_')
+        try:
+            print(f"\n📦 Tamaño '{tamano}': generando datos sintéticos...")
+            partidos = preparar_carpeta(tamano, raiz)
+            print(f"   -> {partidos:,} partidos en {raiz}")
+
+            for etapa in resolver_etapas(etapas):
+                medir = etapa in etapas
+                corridas = []
+                for _ in range(repeticiones if medir else 1):
+                    resultado, salida = correr_etapa(etapa, raiz)
+                    corridas.append(resultado)
+                    if not resultado['ok']:
+                        break
+                mejor = min(corridas, key=lambda r: r['segundos'])  # La mejor de N: la menos afectada por ruido
+                if not corridas[-1]['ok']:
+                    print(f"   ❌ {etapa} falló:\n" + '\n'.join(salida.splitlines()[-15:]))
+                    if medir:
+                        resultados.append(dict(corridas[-1], tamano=tamano, partidos=partidos))
+                    break  # Las etapas siguientes pueden depender de esta
+                if medir:
+                    resultados.append(dict(mejor, tamano=tamano, partidos=partidos))
+                    print(f"   ⏱️ {etapa:<20} {mejor['segundos']:8.2f} s | {mejor['rss_pico_mb']:7.0f} MB")
+                else:
+                    print(f"   ·  {etapa:<20} (preparación)")
+        finally:
+            if conservar:
+                print(f"   📁 Carpeta conservada: {raiz}")
+            else:
+                shutil.rmtree(raiz, ignore_errors=True)
+    return resultados
+
+
+# -------------------------------------------------------------------------
+# HISTORIAL JSON Y COMPARACIÓN CONTRA LA BASE
+# -------------------------------------------------------------------------
+def _commit_actual():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=RAIZ, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def leer_historial(ruta):
+    if not os.path.exists(ruta):
+        return {'version': VERSION_HISTORIAL, 'corridas': []}
+    with open(ruta, encoding='utf-8') as f:
+        historial = json.load(f)
+    if historial.get('version') != VERSION_HISTORIAL:
+        raise ValueError(f"Versión de historial de benchmarks incompatible en '{ruta}'")
+    return historial
+
+
+def guardar_json(datos, ruta):
+    with open(ruta, 'w', encoding='utf-8') as f:
+        json.dump(datos, f, ensure_ascii=False, indent=1)
+
+
+def nueva_corrida(resultados, repeticiones):
+    return {
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'commit': _commit_actual(),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'cpus': os.cpu_count(),
+        'semilla': SEMILLA,
+        'repeticiones': repeticiones,
+        'resultados': resultados,
+    }
+
+
+def comparar_corridas(base, actual, umbral=UMBRAL):
+    # Devuelve (DataFrame con una fila por etapa y tamaño, hay_regresiones)
+    claves = ['etapa', 'tamano']
+    a = pd.DataFrame(base['resultados'])[claves + ['segundos', 'rss_pico_mb']]
+    b = pd.DataFrame(actual['resultados'])[claves + ['segundos', 'rss_pico_mb', 'ok']]
+    tabla = a.merge(b, on=claves, suffixes=('_base', '_actual'))
+    tabla['cambio'] = tabla['segundos_actual'] / tabla['segundos_base'] - 1
+    tabla['regresion'] = ~tabla['ok'] | ((tabla['cambio'] > umbral) &
+                                         (tabla['segundos_actual'] - tabla['segundos_base'] > MINIMO_SEGUNDOS))
+    tabla['cambio_rss'] = tabla['rss_pico_mb_actual'] / tabla['rss_pico_mb_base'] - 1
+    return tabla, bool(tabla['regresion'].any())
+
+
+def imprimir_comparacion(tabla, umbral):
+    print("\n" + "=" * 88)
+    print(f"{'Etapa':<20} {'Tamaño':<8} {'Base (s)':>9} {'Ahora (s)':>10} {'Cambio':>8} {'RAM base':>9} {'RAM ahora':>10}")
+    print("-" * 88)
+    for _, r in tabla.iterrows():
+        marca = " ⚠️ REGRESIÓN" if r['regresion'] else (" 🚀" if r['cambio'] < -umbral else "")
+        print(f"{r['etapa']:<20} {r['tamano']:<8} {r['segundos_base']:>9.2f} {r['segundos_actual']:>10.2f} "
+              f"{r['cambio']:>+7.0%} {r['rss_pico_mb_base']:>6.0f} MB {r['rss_pico_mb_actual']:>7.0f} MB{marca}")
+    print("=" * 88)
+
+
+def comparar_con_base(corrida, ruta_base, umbral):
+    if not os.path.exists(ruta_base):
+        print(f"⚠️ No hay base guardada ('{ruta_base}'). Guardala con: python benchmark_suite.py base")
+        return 0
+    with open(ruta_base, encoding='utf-8') as f:
+        base = json.load(f)
+    tabla, hay_regresiones = comparar_corridas(base, corrida, umbral)
+    print(f"\n📏 Base: {base['fecha']} (commit {base['commit']}) | umbral {umbral:.0%}")
+    imprimir_comparacion(tabla, umbral)
+    if hay_regresiones:
+        print(f"❌ {int(tabla['regresion'].sum())} etapa(s) más lentas que la base")
+        return 1
+    print("✅ Sin regresiones")
+    return 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '_interna':
+        _correr_interna(sys.argv[2], sys.argv[3])
+        raise SystemExit(0)
+
+    parser = argparse.ArgumentParser(description="Suite de benchmarks de punta a punta")
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    p_correr = sub.add_parser('correr', help="Corre la suite y agrega el resultado al historial")
+    p_correr.add_argument('--tamanos', nargs='+', default=['chico', 'mediano'], choices=list(TAMANOS))
+    p_correr.add_argument('--etapas', nargs='+', default=NOMBRES_ETAPAS, choices=NOMBRES_ETAPAS)
+    p_correr.add_argument('--repeticiones', type=int, default=1, help="Se guarda la mejor de N")
+    p_correr.add_argument('--conservar', action='store_true', help="No borra las carpetas de prueba")
+    p_correr.add_argument('--comparar', action='store_true', help="Al terminar, compara contra la base")
+
+    p_base = sub.add_parser('base', help="Guarda una corrida del historial como base")
+    p_base.add_argument('--corrida', type=int, default=-1, help="Índice en el historial (-1 = la última)")
+
+    p_comparar = sub.add_parser('comparar', help="Compara una corrida del historial contra la base")
+    p_comparar.add_argument('--corrida', type=int, default=-1)
+
+    for p in (p_correr, p_base, p_comparar):
+        p.add_argument('--historial', default=ARCHIVO_HISTORIAL)
+        p.add_argument('--base', default=ARCHIVO_BASE)
+        p.add_argument('--umbral', type=float, default=UMBRAL)
+    args = parser.parse_args()
+
+    historial = leer_historial(args.historial)
+
+    if args.comando == 'correr':
+        print("⏱️ SUITE DE BENCHMARKS")
+        resultados = correr_suite(args.tamanos, args.etapas, args.repeticiones, args.conservar)
+        corrida = nueva_corrida(resultados, args.repeticiones)
+        historial['corridas'].append(corrida)
+        guardar_json(historial, args.historial)
+        print(f"\n💾 Corrida #{len(historial['corridas']) - 1} agregada a '{args.historial}'")
+        codigo = 0 if all(r['ok'] for r in resultados) else 1
+        if args.comparar:
+            codigo = max(codigo, comparar_con_base(corrida, args.base, args.umbral))
+        raise SystemExit(codigo)
+
+    if not historial['corridas']:
+        print(f"❌ El historial '{args.historial}' está vacío. Primero: python benchmark_suite.py correr")
+        raise SystemExit(1)
+    corrida = historial['corridas'][args.corrida]
+
+    if args.comando == 'base':
+        guardar_json(corrida, args.base)
+        print(f"📏 Base guardada en '{args.base}': {corrida['fecha']} (commit {corrida['commit']})")
+    else:
+        raise SystemExit(comparar_con_base(corrida, args.base, args.umbral))
@@ -0,0 +1,145 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# =============================================================================
+# 🧠 CACHÉ DE PREDICCIONES (LRU, compartida por todo el proceso)
+# =============================================================================
+# La página vuelve a llamar al modelo en cada clic aunque sea el mismo partido con
+# los mismos números (Alcaraz vs Djokovic en Hard se pide una y otra vez). Acá se
+# guarda la respuesta con clave:
+#   (modelo, versión de los artefactos, vector de features redondeado)
+# - Acotada: al pasar de `capacidad` se tira la que hace más que no se usa.
+# - Segura con hilos: Streamlit atiende cada sesión en su propio hilo.
+# - La versión sale de fecha y tamaño de los artefactos (un stat por archivo, sin
+#   leerlos): si se publica un modelo, perfiles o paquete nuevo, la caché se vacía sola.
+#
+#   CACHE_PREDICCIONES.actualizar_version(version_artefactos(ruta_proyecto))
+#   prob = CACHE_PREDICCIONES.obtener('xgboost', version, fila, lambda: modelo.predict_proba(...)[0][1])
+
+CAPACIDAD = 4096
+DECIMALES = 6  # Features que difieren en menos que esto se consideran la misma
+
+# Lo que cambia una predicción de la app (relativo a la raíz del proyecto)
+ARTEFACTOS = [
+    os.path.join('prediccion', 'modelo_xgboost_final.pkl'),
+    os.path.join('prediccion', 'modelo_logistico_final.pkl'),
+    os.path.join('prediccion', 'scaler_final.pkl'),
+    os.path.join('prediccion', 'stats_superficie_v2.pkl'),
+    os.path.join('prediccion', 'paquete', 'manifiesto.json'),
+    os.path.join('scraping', 'perfiles_jugadores.pkl'),
+    os.path.join('scraping', 'ranking_2026.csv'),
+    os.path.join('scraping', 'indice_h2h.pkl'),
+]
+
+
+def version_artefactos(ruta_proyecto):
+    # Hash de (archivo, fecha de modificación, tamaño) de cada artefacto; los que falten cuentan igual
+    h = hashlib.sha256()
+    for archivo in ARTEFACTOS:
+        try:
+            info = os.stat(os.path.join(ruta_proyecto, archivo))
+            h.update(f"{archivo}|{info.st_mtime_ns}|{info.st_size};".encode())
+        except FileNotFoundError:
+            h.update(f"{archivo}|-;".encode())
+    return h.hexdigest()[:16]
+
+
+class CachePredicciones:
+    def __init__(self, capacidad=CAPACIDAD, decimales=DECIMALES):
+        self.capacidad, self.decimales = capacidad, decimales
+        self._datos = OrderedDict()  # {clave: probabilidad}, de la menos a la más usada
+        self._candado = threading.Lock()
+        self.version = None
+        self.aciertos = self.fallos = self.desalojos = self.invalidaciones = 0
+
+    def clave(self, id_modelo, version, features):
+        fila = np.round(np.asarray(features, dtype=float).ravel(), self.decimales) + 0.0  # (+0.0: -0.0 -> 0.0)
+        return id_modelo, version, tuple(fila.tolist())
+
+    def actualizar_version(self, version):
+        # True si cambió (y se vació la caché). La primera vez solo la anota
+        with self._candado:
+            if version == self.version:
+                return False
+            cambio = self.version is not None
+            self.version = version
+            if cambio:
+                self._datos.clear()
+                self.invalidaciones += 1
+            return cambio
+
+    def obtener(self, id_modelo, version, features, calcular):
+        # La probabilidad guardada, o calcular() (sin el candado: el modelo no frena a las otras sesiones)
+        clave = self.clave(id_modelo, version, features)
+        with self._candado:
+            if clave in self._datos:
+                self._datos.move_to_end(clave)
+                self.aciertos += 1
+                return self._datos[clave]
+            self.fallos += 1
+
+        valor = calcular()
+        with self._candado:
+            if version == self.version or self.version is None:  # No guardar algo calculado con artefactos viejos
+                self._datos[clave] = valor
+                self._datos.move_to_end(clave)
+                while len(self._datos) > self.capacidad:
+                    self._datos.popitem(last=False)
+                    self.desalojos += 1
+        return valor
+
+    def vaciar(self):
+        with self._candado:
+            self._datos.clear()
+
+    def estadisticas(self):
+        with self._candado:
+            consultas = self.aciertos + self.fallos
+            return {'entradas': len(self._datos), 'capacidad': self.capacidad, 'aciertos': self.aciertos,
+                    'fallos': self.fallos, 'desalojos': self.desalojos, 'invalidaciones': self.invalidaciones,
+                    'tasa_aciertos': self.aciertos / consultas if consultas else float('nan')}
+
+
+# La del proceso (la importan la página y quien la necesite)
+CACHE_PREDICCIONES = CachePredicciones()
+
+
+if __name__ == "__main__":
+    import time
+
+    from predictor_lote import RAIZ, PredictorLote
+
+    # --- Prueba con tráfico "de la app": muchos pedidos repetidos de unos pocos partidos populares ---
+    predictor = PredictorLote.desde_recursos(RAIZ, 'xgboost')
+    cache = CachePredicciones(capacidad=256)
+    cache.actualizar_version(version_artefactos(RAIZ))
+    rng = np.random.default_rng(0)
+    top = [predictor.nombres[k] for k in np.argsort(predictor.rank, kind='stable')[:60]]
+    pesos = 1 / np.arange(1, len(top) + 1)  # Los de arriba se piden mucho más (Zipf)
+    pesos /= pesos.sum()
+    pedidos = [tuple(rng.choice(top, size=2, replace=False, p=pesos)) for _ in range(3000)]
+
+    # Las features se arman antes: lo que se ahorra la caché es el scaler + el modelo
+    filas = [predictor.armar_features([par], 'Hard')[0] for par in pedidos]
+
+    def directo(X):
+        return predictor.modelo.predict_proba(predictor.scaler.transform(X))[0][1]
+
+    def con_cache(X):
+        return cache.obtener('xgboost', cache.version, X.iloc[0], lambda: directo(X))
+
+    tiempos, resultados = {}, {}
+    for nombre, funcion in (('sin caché', directo), ('con caché', con_cache)):
+        inicio = time.perf_counter()
+        resultados[nombre] = [funcion(X) for X in filas]
+        tiempos[nombre] = (time.perf_counter() - inicio) / len(filas) * 1000
+    assert resultados['sin caché'] == resultados['con caché']
+    e = cache.estadisticas()
+    print(f"🧠 {len(pedidos):,} pedidos: {tiempos['sin caché']:.3f} ms -> {tiempos['con caché']:.3f} ms por pedido "
+          f"| aciertos {e['tasa_aciertos']:.0%}, desalojos {e['desalojos']:,}")
+    assert cache.actualizar_version('otra') and cache.estadisticas()['entradas'] == 0
+    print("   ✅ Mismos resultados que el modelo y se vacía al cambiar la versión")
@@ -0,0 +1,132 @@
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import urlparse
+
+import numpy as np
+
+from servidor_prediccion import PUERTO
+
+# =============================================================================
+# 🔥 GENERADOR DE CARGA PARA EL SERVIDOR DE PREDICCIONES
+# =============================================================================
+# Manda pedidos de verdad (pares del top del ranking, superficies al azar) con N
+# clientes a la vez, cada uno con su conexión keep-alive, y mide por nivel de
+# concurrencia: latencia p50 / p99 y pedidos por segundo.
+#
+# Uso:  python carga_servidor.py                          (contra http://127.0.0.1:8765)
+#       python carga_servidor.py --lanzar                 (arranca un servidor local, mide y lo apaga)
+#       python carga_servidor.py --lanzar --espera-ms 0   (el mismo servidor sin juntar pedidos)
+#       python carga_servidor.py --concurrencia 1 8 32 --pedidos 2000
+
+CONCURRENCIA = [1, 4, 16, 64]
+SUPERFICIES = ['Hard', 'Clay', 'Grass']
+
+
+def pares_de_prueba(cantidad, semilla=0, top=200):
+    # Pares al azar entre los primeros del ranking (los que más consultan)
+    from recursos_app import Recursos
+    from predictor_lote import RAIZ
+    perfiles = Recursos(RAIZ).obtener('perfiles')
+    nombres = sorted(perfiles, key=lambda n: perfiles[n]['rank'])[:top]
+    rng = np.random.default_rng(semilla)
+    i = rng.integers(len(nombres), size=cantidad)
+    j = (i + rng.integers(1, len(nombres), size=cantidad)) % len(nombres)
+    s = rng.integers(len(SUPERFICIES), size=cantidad)
+    return [{'jugador1': nombres[a], 'jugador2': nombres[b], 'superficie': SUPERFICIES[k]}
+            for a, b, k in zip(i.tolist(), j.tolist(), s.tolist())]
+
+
+def _cliente(host, puerto, cuerpos, latencias, errores):
+    conexion = http.client.HTTPConnection(host, puerto, timeout=30)
+    for cuerpo in cuerpos:
+        inicio = time.perf_counter()
+        conexion.request('POST', '/predecir', body=cuerpo, headers={'Content-Type': 'application/json'})
+        respuesta = conexion.getresponse()
+        respuesta.read()
+        latencias.append(time.perf_counter() - inicio)
+        if respuesta.status != 200:
+            errores.append(respuesta.status)
+    conexion.close()
+
+
+def medir(url, pedidos, concurrencia):
+    # Reparte los pedidos entre `concurrencia` clientes -> {p50_ms, p99_ms, pedidos_s, errores}
+    destino = urlparse(url)
+    cuerpos = [json.dumps(p).encode('utf-8') for p in pedidos]
+    latencias, errores = [], []
+    hilos = [threading.Thread(target=_cliente, args=(destino.hostname, destino.port, cuerpos[k::concurrencia],
+                                                     latencias, errores))
+             for k in range(concurrencia)]
+    inicio = time.perf_counter()
+    for h in hilos:
+        h.start()
+    for h in hilos:
+        h.join()
+    total = time.perf_counter() - inicio
+    ms = np.array(latencias) * 1000
+    return {'concurrencia': concurrencia, 'p50_ms': float(np.percentile(ms, 50)), 'p99_ms': float(np.percentile(ms, 99)),
+            'pedidos_s': len(latencias) / total, 'errores': len(errores)}
+
+
+def salud(url):
+    destino = urlparse(url)
+    conexion = http.client.HTTPConnection(destino.hostname, destino.port, timeout=5)
+    conexion.request('GET', '/salud')
+    datos = json.loads(conexion.getresponse().read())
+    conexion.close()
+    return datos
+
+
+def lanzar_servidor(puerto, espera_ms):
+    # Servidor local en otro proceso; vuelve cuando ya responde
+    comando = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'servidor_prediccion.py'),
+               '--puerto', str(puerto), '--espera-ms', str(espera_ms)]
+    proceso = subprocess.Popen(comando, stdout=subprocess.DEVNULL)
+    limite = time.time() + 60
+    while time.time() < limite:
+        try:
+            salud(f'http://127.0.0.1:{puerto}')
+            return proceso
+        except OSError:
+            if proceso.poll() is not None:
+                raise RuntimeError("El servidor no arrancó")
+            time.sleep(0.1)
+    proceso.kill()
+    raise RuntimeError("El servidor no respondió a tiempo")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generador de carga para servidor_prediccion.py")
+    parser.add_argument('--url', default=f'http://127.0.0.1:{PUERTO}')
+    parser.add_argument('--concurrencia', type=int, nargs='+', default=CONCURRENCIA)
+    parser.add_argument('--pedidos', type=int, default=1000, help="Pedidos por nivel de concurrencia")
+    parser.add_argument('--lanzar', action='store_true', help="Arrancar un servidor local para la prueba")
+    parser.add_argument('--espera-ms', type=float, default=None, help="Ventana de micro-lotes del servidor lanzado")
+    args = parser.parse_args()
+
+    proceso = None
+    if args.lanzar:
+        from servidor_prediccion import ESPERA_MS
+        proceso = lanzar_servidor(urlparse(args.url).port, ESPERA_MS if args.espera_ms is None else args.espera_ms)
+    try:
+        pedidos = pares_de_prueba(args.pedidos)
+        medir(args.url, pedidos[:50], 1)  # Calentamiento (modelos cargados, conexiones abiertas)
+        antes = salud(args.url)
+        print(f"🔥 CARGA CONTRA {args.url} (ventana {antes['espera_ms']} ms, {args.pedidos:,} pedidos por nivel)")
+        print(f"   {'Clientes':>8} | {'p50 (ms)':>9} | {'p99 (ms)':>9} | {'Pedidos/s':>10} | {'Errores':>7}")
+        for concurrencia in args.concurrencia:
+            r = medir(args.url, pedidos, concurrencia)
+            print(f"   {concurrencia:>8} | {r['p50_ms']:>9.2f} | {r['p99_ms']:>9.2f} | {r['pedidos_s']:>10,.0f} | {r['errores']:>7}")
+        despues = salud(args.url)
+        lotes, atendidos = despues['lotes'] - antes['lotes'], despues['pedidos'] - antes['pedidos']
+        print(f"   📦 {atendidos:,} pedidos en {lotes:,} lotes ({atendidos / max(lotes, 1):.1f} por lote)")
+    finally:
+        if proceso is not None:
+            proceso.terminate()
+            proceso.wait()
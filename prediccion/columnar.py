@@ -0,0 +1,82 @@
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+# =============================================================================
+# 🗄️ TABLAS COLUMNARES (solo NumPy, sin dependencias nuevas)
+# =============================================================================
+# Una tabla es una carpeta con:
+#   manifiesto.json            -> columnas, tipos, cantidad de filas y metadatos
+#   <col>.npy                  -> columnas numéricas (se pueden abrir con mmap)
+#   <col>.codigos.npy + <col>.valores.npy -> columnas de texto codificadas por diccionario
+# Leer solo algunas columnas es abrir solo esos archivos.
+
+VERSION_FORMATO = 1
+MANIFIESTO = 'manifiesto.json'
+
+
+def _es_texto(serie):
+    return serie.dtype == object or isinstance(serie.dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(serie.dtype)
+
+
+def guardar_tabla(directorio, df, meta=None):
+    # Escribimos en una carpeta temporal y la renombramos al final (nunca queda una tabla a medias)
+    temporal = directorio.rstrip('/\\') + '.tmp'
+    shutil.rmtree(temporal, ignore_errors=True)
+    os.makedirs(temporal)
+
+    columnas = {}
+    for col in df.columns:
+        serie = df[col]
+        if _es_texto(serie):
+            codigos, valores = pd.factorize(serie.astype(object))
+            valores = np.asarray([str(v) for v in valores], dtype=str)
+            np.save(os.path.join(temporal, f"{col}.codigos.npy"), codigos.astype(np.int32))
+            np.save(os.path.join(temporal, f"{col}.valores.npy"), valores)
+            columnas[col] = {'tipo': 'texto'}
+        else:
+            arr = np.ascontiguousarray(serie.to_numpy())
+            np.save(os.path.join(temporal, f"{col}.npy"), arr)
+            columnas[col] = {'tipo': 'numerico', 'dtype': str(arr.dtype)}
+
+    manifiesto = {'version': VERSION_FORMATO, 'filas': len(df), 'columnas': columnas, 'meta': meta or {}}
+    with open(os.path.join(temporal, MANIFIESTO), 'w', encoding='utf-8') as f:
+        json.dump(manifiesto, f, ensure_ascii=False, indent=1)
+
+    shutil.rmtree(directorio, ignore_errors=True)
+    os.replace(temporal, directorio)
+
+
+def leer_manifiesto(directorio):
+    with open(os.path.join(directorio, MANIFIESTO), encoding='utf-8') as f:
+        manifiesto = json.load(f)
+    if manifiesto.get('version') != VERSION_FORMATO:
+        raise ValueError(f"Formato de tabla incompatible en '{directorio}'")
+    return manifiesto
+
+
+def cargar_columna(directorio, col, info, mmap=True, filas=None):
+    # filas: slice o array de posiciones (None = todas). Con mmap solo se leen esas partes del disco
+    modo = 'r' if mmap else None
+    todas = slice(None) if filas is None else filas
+    if info['tipo'] == 'texto':
+        codigos = np.load(os.path.join(directorio, f"{col}.codigos.npy"), mmap_mode=modo)
+        valores = np.load(os.path.join(directorio, f"{col}.valores.npy"))
+        return pd.Categorical.from_codes(np.asarray(codigos[todas]), categories=pd.Index(valores, dtype=object))
+    columna = np.load(os.path.join(directorio, f"{col}.npy"), mmap_mode=modo)
+    return columna if filas is None else np.asarray(columna[todas])
+
+
+def cargar_tabla(directorio, columnas=None, mmap=True, filas=None):
+    # Devuelve un DataFrame con las columnas pedidas (todas si columnas=None) y las filas pedidas.
+    # Los textos vuelven como categóricos: un solo string por valor distinto.
+    manifiesto = leer_manifiesto(directorio)
+    info = manifiesto['columnas']
+    faltan = [c for c in (columnas or []) if c not in info]
+    if faltan:
+        raise KeyError(f"Columnas inexistentes en '{directorio}': {faltan}")
+    columnas = columnas or list(info)
+    return pd.DataFrame({c: cargar_columna(directorio, c, info[c], mmap, filas) for c in columnas})
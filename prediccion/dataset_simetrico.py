@@ -0,0 +1,48 @@
+import numpy as np
+
+# =============================================================================
+# 🪞 DATASET SIMÉTRICO (sin diccionarios por fila)
+# =============================================================================
+# La IA aprende de DIFERENCIAS. Por cada partido generamos dos filas:
+#   1. Desde el ganador  -> diffs          , target 1
+#   2. Desde el perdedor -> diffs negadas  , target 0
+# Antes esto se hacía con df.iterrows() + dos dicts por partido + pd.DataFrame(data_rows).
+# Acá se arma directo desde las columnas en arrays float32 contiguos.
+# Mismo orden de filas que antes: partidos mezclados con df.sample(frac=1, random_state=semilla)
+# y, para cada uno, primero la fila target 1 y después la target 0.
+
+
+def orden_mezclado(n, semilla=42):
+    # Idéntico al orden de df.sample(frac=1, random_state=semilla)
+    return np.random.RandomState(semilla).permutation(n)
+
+
+def construir_simetrico(df, features, semilla=42, mezclar=True):
+    # df: una fila por partido con las columnas diff_* vistas desde el ganador
+    n, k = len(df), len(features)
+    orden = orden_mezclado(n, semilla) if mezclar else np.arange(n)
+
+    X = np.empty((2 * n, k), dtype=np.float32)
+    for j, col in enumerate(features):
+        valores = df[col].to_numpy(dtype=np.float32)[orden]
+        X[0::2, j] = valores   # Escenario 1: ganador = target 1
+        X[1::2, j] = -valores  # Escenario 2: invertimos todo, target 0
+
+    y = np.empty(2 * n, dtype=np.float32)
+    y[0::2] = 1
+    y[1::2] = 0
+    return X, y
+
+
+def espejar(diffs, orden=None):
+    # Igual que construir_simetrico, pero desde un array (n, k) ya armado (ej: memoria compartida)
+    d = diffs if orden is None else diffs[orden]
+    n, k = d.shape
+    X = np.empty((2 * n, k), dtype=np.float32)
+    X[0::2] = d
+    X[1::2] = -d
+
+    y = np.empty(2 * n, dtype=np.float32)
+    y[0::2] = 1
+    y[1::2] = 0
+    return X, y
@@ -0,0 +1,141 @@
+import numpy as np
+import pandas as pd
+
+# =============================================================================
+# 🔋 FATIGA VECTORIZADA
+# =============================================================================
+# La fatiga es la suma de minutos que el jugador YA jugó en el torneo antes de
+# este partido (suma acumulada exclusiva por (torneo, jugador)).
+# En lugar de recorrer fila por fila con un dict {(tid, jugador): minutos},
+# pasamos los partidos a formato largo (una fila por jugador y partido) y
+# hacemos una suma acumulada por grupo con NumPy (orden estable + cumsum). Con la misma tabla larga salen gratis otras variantes:
+#   - sets jugados en el torneo
+#   - minutos jugados en los últimos N días (cruzando torneos)
+#
+# El DataFrame de entrada debe estar en orden cronológico.
+
+DIAS_VENTANA = (7, 14, 30)
+_ORIGEN = pd.Timestamp('1900-01-01')
+
+
+def contar_sets(scores):
+    # "6-4 3-6 7-6(5)" -> 3 sets (los RET / W/O cuentan lo que se llegó a jugar)
+    # Los resultados se repiten muchísimo: se parsea cada resultado distinto una sola vez
+    codigos, unicos = pd.factorize(scores.astype(str))
+    return pd.Series(unicos).str.count(r'\d+-\d+').to_numpy(dtype=float)[codigos]
+
+
+def _formato_largo(df):
+    # Filas intercaladas: ganador del partido 0, perdedor del partido 0, ganador del 1, ...
+    # Jugadores y torneos como códigos enteros (los strings solo se factorizan una vez)
+    jugadores = np.column_stack([df['winner_name'].to_numpy(), df['loser_name'].to_numpy()]).ravel()
+    cod_jugador, nombres = pd.factorize(jugadores)
+    cod_torneo, _ = pd.factorize(df['tourney_id'].astype(str))
+    cod_torneo = np.repeat(cod_torneo, 2).astype(np.int64)
+    return cod_torneo * len(nombres) + cod_jugador, cod_jugador.astype(np.int64)
+
+
+def _acumulado_exclusivo(grupos, valores):
+    # Suma de los valores ANTERIORES del mismo grupo (el partido actual no cuenta).
+    # Orden estable por grupo -> cumsum global -> restamos lo acumulado al inicio del grupo.
+    # Minutos y sets son enteros, así que el resultado es exacto (igual al bucle).
+    orden = np.argsort(grupos, kind='stable')
+    g = grupos[orden]
+    previos = np.concatenate([[0.0], np.cumsum(valores[orden])])[:-1]
+    inicio = np.searchsorted(g, g, side='left')
+    resultado = np.empty(len(valores))
+    resultado[orden] = previos - previos[inicio]
+    return resultado
+
+
+def dias_calendario(fechas):
+    # yyyymmdd -> días desde 1900 (una conversión por fecha distinta)
+    codigos, unicas = pd.factorize(pd.to_numeric(fechas, errors='coerce'))
+    dt = pd.to_datetime(pd.Series(unicas).astype('Int64').astype(str), format='%Y%m%d', errors='coerce')
+    dias = (dt - _ORIGEN).dt.days.to_numpy(dtype=float)
+    return pd.Series(dias[codigos]).ffill().bfill().fillna(0).to_numpy(dtype=np.int64)
+
+
+def _minutos_ultimos_dias(cod_jugador, dias_partido, minutos, ventanas):
+    # Por jugador: minutos de partidos previos cuya fecha está dentro de los últimos N días
+    orden = np.argsort(cod_jugador, kind='stable')  # Por jugador, respetando el orden cronológico
+    cod = cod_jugador[orden]
+    dias = dias_partido[orden]
+    previos = np.concatenate([[0.0], np.cumsum(minutos[orden])])[:-1]  # Suma global exclusiva
+
+    # Clave ordenada (jugador, día): con searchsorted encontramos dónde empieza cada ventana
+    escala = int(dias.max()) + max(ventanas) + 1
+    claves = cod * escala + dias
+    inicio_jugador = np.searchsorted(claves, cod * escala, side='left')
+
+    resultado = {}
+    for n_dias in ventanas:
+        desde = np.maximum(np.searchsorted(claves, claves - n_dias, side='left'), inicio_jugador)
+        valor = np.empty(len(minutos))
+        valor[orden] = previos - previos[desde]
+        resultado[n_dias] = valor
+    return resultado
+
+
+def variables_fatiga(df, dias=DIAS_VENTANA):
+    # Devuelve un DataFrame (mismo índice que df) con todas las variantes de fatiga
+    grupos, cod_jugador = _formato_largo(df)
+    minutos = np.repeat(df['minutes'].to_numpy(dtype=float), 2)
+    sets = np.repeat(contar_sets(df['score']) if 'score' in df.columns else np.zeros(len(df)), 2)
+
+    salida = {
+        'fatigue': _acumulado_exclusivo(grupos, minutos),
+        'sets_torneo': _acumulado_exclusivo(grupos, sets),
+    }
+    if dias:
+        dias_partido = np.repeat(dias_calendario(df['tourney_date']), 2)
+        for n_dias, valor in _minutos_ultimos_dias(cod_jugador, dias_partido, minutos, dias).items():
+            salida[f'min_{n_dias}d'] = valor
+
+    columnas = {}
+    for nombre, valor in salida.items():
+        columnas[f'winner_{nombre}'] = valor[0::2]
+        columnas[f'loser_{nombre}'] = valor[1::2]
+    return pd.DataFrame(columnas, index=df.index)
+
+
+# -------------------------------------------------------------------------
+# CHEQUEO DE PARIDAD CONTRA EL BUCLE ORIGINAL
+# -------------------------------------------------------------------------
+def fatiga_con_bucle(df):
+    # Copia del cálculo viejo (predict.py / predict_RF.py / comparar_modelos.py)
+    fatiga_tracker = {}
+    w_fat, l_fat = [], []
+    for tid, w, l, dur in zip(df['tourney_id'].astype(str), df['winner_name'], df['loser_name'], df['minutes']):
+        f_w = fatiga_tracker.get((tid, w), 0)
+        f_l = fatiga_tracker.get((tid, l), 0)
+        w_fat.append(f_w); l_fat.append(f_l)
+        fatiga_tracker[(tid, w)] = f_w + dur
+        fatiga_tracker[(tid, l)] = f_l + dur
+    return np.asarray(w_fat, dtype=float), np.asarray(l_fat, dtype=float)
+
+
+def verificar_paridad(df):
+    w_viejo, l_viejo = fatiga_con_bucle(df)
+    nuevo = variables_fatiga(df, dias=())
+    assert np.array_equal(w_viejo, nuevo['winner_fatigue'].to_numpy()), "❌ Fatiga del ganador distinta"
+    assert np.array_equal(l_viejo, nuevo['loser_fatigue'].to_numpy()), "❌ Fatiga del perdedor distinta"
+
+
+# Uso:  python fatiga.py historial_tenis_COMPLETO.csv
+if __name__ == "__main__":
+    import sys
+    import time
+    from motor_elo import ordenar_cronologico
+
+    ruta = sys.argv[1] if len(sys.argv) > 1 else 'historial_tenis_COMPLETO.csv'
+    df = pd.read_csv(ruta, low_memory=False)
+    df['tourney_date'] = pd.to_numeric(df['tourney_date'], errors='coerce')
+    df = ordenar_cronologico(df[df['tourney_date'] > 0])
+    df['minutes'] = pd.to_numeric(df['minutes'], errors='coerce').fillna(100)
+
+    inicio = time.perf_counter(); fatiga_con_bucle(df); t_bucle = time.perf_counter() - inicio
+    inicio = time.perf_counter(); variables_fatiga(df); t_vector = time.perf_counter() - inicio
+    verificar_paridad(df)
+    print(f"✅ Paridad exacta con el bucle original ({len(df)} partidos)")
+    print(f"   Bucle: {t_bucle:.2f} s | Vectorizado (todas las variantes): {t_vector:.2f} s")
@@ -0,0 +1,200 @@
+import numpy as np
+import pandas as pd
+
+# =============================================================================
+# ⚔️ ÍNDICE H2H (enfrentamientos directos precalculados)
+# =============================================================================
+# Antes la app filtraba todo el historial con dos máscaras booleanas en cada
+# interacción. Este índice se arma UNA vez (al generar perfiles) y se guarda:
+#   - jugadores: id -> nombre (los ids del registro de jugadores, si se arma con él)
+#   - claves:  un entero por par sin orden (id_a * n + id_b, con id_a <= id_b), ordenados
+#   - conteos: array [id_par, superficie, 2] con las victorias de a y de b
+#   - filas:   posiciones de los partidos en el CSV, agrupadas por par
+# Consultar un par es buscar dos ids y una entrada de diccionario (clave entera del
+# par -> posición en `claves`, se arma la primera vez que se consulta): O(1), y da el
+# desglose por superficie sin recorrer nada. Con los ids ya resueltos (victorias_ids)
+# no se toca ningún nombre.
+
+VERSION_INDICE = 2
+ARCHIVO_INDICE = 'indice_h2h.pkl'
+
+
+class IndiceH2H:
+    def __init__(self, jugadores, claves, superficies, conteos, inicios, filas):
+        self.jugadores = jugadores      # id -> nombre
+        self.id_jugador = {n: i for i, n in enumerate(jugadores)}
+        self.claves = claves            # int64 ordenado: id_a * len(jugadores) + id_b
+        self.superficies = superficies  # ['Clay', 'Grass', 'Hard', ...]
+        self.conteos = conteos          # int32 [n_pares, n_superficies, 2]
+        self.inicios = inicios          # Las filas del par i son filas[inicios[i]:inicios[i + 1]]
+        self.filas = filas
+        self._totales = None
+        self._posiciones = None  # {clave del par: posición} (perezoso: del paquete llega solo `claves`, con mmap)
+
+    def __len__(self):
+        return len(self.claves)
+
+    @classmethod
+    def construir(cls, df, registro=None):
+        # df: historial con winner_name, loser_name y surface (las filas quedan como posiciones 0..n-1).
+        # registro: RegistroJugadores para usar sus ids (los alias caen en el mismo jugador); si no, ids locales
+        if registro is not None:
+            id_w = registro.ids(df['winner_name'].astype(str), crear=True).astype(np.int64)
+            id_l = registro.ids(df['loser_name'].astype(str), crear=True).astype(np.int64)
+            jugadores = list(registro.nombres)
+        else:
+            codigos, unicos = pd.factorize(pd.concat([df['winner_name'], df['loser_name']], ignore_index=True).astype(str))
+            id_w, id_l = codigos[:len(df)].astype(np.int64), codigos[len(df):].astype(np.int64)
+            jugadores = list(unicos)
+        primero = id_w <= id_l
+        a, b = np.minimum(id_w, id_l), np.maximum(id_w, id_l)
+
+        claves, codigos_par = np.unique(a * len(jugadores) + b, return_inverse=True)
+        codigos_sup, superficies = pd.factorize(df['surface'].fillna('Unknown').astype(str))
+        n_pares, n_sup = len(claves), len(superficies)
+
+        # Victorias por (par, superficie, quién ganó): 0 = ganó a, 1 = ganó b
+        ganador = (~primero).astype(np.int64)
+        plano = (codigos_par * n_sup + codigos_sup) * 2 + ganador
+        conteos = np.bincount(plano, minlength=n_pares * n_sup * 2).astype(np.int32).reshape(n_pares, n_sup, 2)
+
+        # Filas de cada par, contiguas y en el orden del CSV
+        filas = np.argsort(codigos_par, kind='stable').astype(np.int64)
+        inicios = np.concatenate([[0], np.cumsum(np.bincount(codigos_par, minlength=n_pares))]).astype(np.int64)
+
+        return cls(jugadores, claves.astype(np.int64), list(superficies), conteos, inicios, filas)
+
+    def ids(self, nombres):
+        # Array de ids del índice (-1 si no está): cada nombre distinto se busca una sola vez
+        codigos, unicos = pd.factorize(pd.Series(nombres, dtype=object))
+        por_unico = np.array([self.id_jugador.get(n, -1) for n in unicos], dtype=np.int64)
+        return np.where(codigos >= 0, por_unico[np.maximum(codigos, 0)] if len(unicos) else -1, -1)
+
+    def _posicion_par(self):
+        if self._posiciones is None:
+            self._posiciones = dict(zip(self.claves.tolist(), range(len(self.claves))))
+        return self._posiciones
+
+    def _buscar_lote(self, id1, id2):
+        # (posiciones de los pares o -1, invertido = p1 es el "b" del par) para arrays de ids
+        id1, id2 = np.asarray(id1, dtype=np.int64), np.asarray(id2, dtype=np.int64)
+        n = len(self.jugadores)
+        a, b = np.minimum(id1, id2), np.maximum(id1, id2)
+        validos = (a >= 0) & (b < n)  # (con un id fuera de rango la clave caería en otro par)
+        posiciones = self._posicion_par()
+        pos = [posiciones.get(c, -1) if v else -1 for c, v in zip((a * n + b).tolist(), validos.tolist())]
+        return np.array(pos, dtype=np.int64), id1 > id2
+
+    def _buscar(self, p1, p2):
+        # Devuelve (id_par, invertido). invertido=True si p1 es el "b" del par
+        i1, i2 = self.id_jugador.get(p1, -1), self.id_jugador.get(p2, -1)
+        if i1 < 0 or i2 < 0:
+            return None, False
+        a, b = min(i1, i2), max(i1, i2)
+        return self._posicion_par().get(a * len(self.jugadores) + b), i1 > i2
+
+    def victorias(self, p1, p2, superficie=None):
+        # (victorias de p1, victorias de p2), en total o en una superficie
+        i, invertido = self._buscar(p1, p2)
+        if i is None:
+            return 0, 0
+        if superficie is None:
+            v = self.conteos[i].sum(axis=0)
+        elif superficie in self.superficies:
+            v = self.conteos[i, self.superficies.index(superficie)]
+        else:
+            return 0, 0
+        return (int(v[1]), int(v[0])) if invertido else (int(v[0]), int(v[1]))
+
+    def victorias_lote(self, p1, p2):
+        # Igual que victorias() (en total) para N pares de una vez -> (array victorias p1, array victorias p2)
+        return self.victorias_ids(self.ids(p1), self.ids(p2))
+
+    def victorias_ids(self, id1, id2):
+        # Lo mismo con los ids del índice ya resueltos (arrays; -1 = no está)
+        if self._totales is None:
+            self._totales = self.conteos.sum(axis=1)
+        if len(self._totales) == 0:
+            return np.zeros(len(id1), dtype=np.int64), np.zeros(len(id1), dtype=np.int64)
+        pares, invertidos = self._buscar_lote(id1, id2)
+        v = np.where((pares >= 0)[:, None], self._totales[np.maximum(pares, 0)], 0)
+        return np.where(invertidos, v[:, 1], v[:, 0]), np.where(invertidos, v[:, 0], v[:, 1])
+
+    def por_superficie(self, p1, p2):
+        # {superficie: (victorias p1, victorias p2)} solo con las superficies donde se cruzaron
+        i, invertido = self._buscar(p1, p2)
+        if i is None:
+            return {}
+        desglose = {}
+        for s, (va, vb) in zip(self.superficies, self.conteos[i].tolist()):
+            if va or vb:
+                desglose[s] = (vb, va) if invertido else (va, vb)
+        return desglose
+
+    def filas_partidos(self, p1, p2):
+        # Posiciones (en el CSV con el que se construyó) de todos sus partidos
+        i, _ = self._buscar(p1, p2)
+        if i is None:
+            return np.empty(0, dtype=np.int64)
+        return self.filas[self.inicios[i]:self.inicios[i + 1]]
+
+    def a_estado(self, origen=None):
+        return {
+            'version': VERSION_INDICE,
+            'origen': origen,
+            'jugadores': self.jugadores,
+            'claves': self.claves,
+            'superficies': self.superficies,
+            'conteos': self.conteos,
+            'inicios': self.inicios,
+            'filas': self.filas,
+        }
+
+    @classmethod
+    def desde_estado(cls, estado):
+        return cls(list(estado['jugadores']), estado['claves'], list(estado['superficies']),
+                   estado['conteos'], estado['inicios'], estado['filas'])
+
+
+def guardar_indice(indice, ruta=ARCHIVO_INDICE, origen=None):
+    import joblib
+    joblib.dump(indice.a_estado(origen), ruta)
+
+
+def cargar_indice(ruta=ARCHIVO_INDICE):
+    import joblib  # (acá y no arriba: la app casi siempre lo saca del paquete)
+    estado = joblib.load(ruta)
+    if not isinstance(estado, dict) or estado.get('version') != VERSION_INDICE:
+        raise ValueError(f"Versión de índice H2H incompatible en '{ruta}'")
+    return IndiceH2H.desde_estado(estado)
+
+
+# Uso:  python indice_h2h.py ../scraping/historialTenis.csv "Carlos Alcaraz" "Jannik Sinner"
+if __name__ == "__main__":
+    import sys
+    import time
+
+    from almacen_partidos import cargar_historial
+
+    ruta = sys.argv[1] if len(sys.argv) > 1 else '../scraping/historialTenis.csv'
+    df = cargar_historial(ruta, ['winner_name', 'loser_name', 'surface'])
+
+    inicio = time.perf_counter()
+    indice = IndiceH2H.construir(df)
+    print(f"✅ Índice H2H: {len(indice):,} pares en {time.perf_counter() - inicio:.2f} s")
+
+    # Chequeo contra el cálculo viejo con máscaras (algunos pares al azar)
+    rng = np.random.default_rng(0)
+    for fila in rng.choice(len(df), size=min(200, len(df)), replace=False):
+        p1, p2 = df['winner_name'].iat[fila], df['loser_name'].iat[fila]
+        wins1 = len(df[(df['winner_name'] == p1) & (df['loser_name'] == p2)])
+        wins2 = len(df[(df['winner_name'] == p2) & (df['loser_name'] == p1)])
+        assert indice.victorias(p1, p2) == (wins1, wins2), f"❌ H2H distinto para {p1} vs {p2}"
+        assert len(indice.filas_partidos(p1, p2)) == wins1 + wins2
+    print("✅ Coincide con el cálculo por máscaras")
+
+    if len(sys.argv) > 3:
+        p1, p2 = sys.argv[2], sys.argv[3]
+        print(f"\n⚔️ {p1} vs {p2}: {indice.victorias(p1, p2)}")
+        for s, (v1, v2) in indice.por_superficie(p1, p2).items():
+            print(f"   {s:<8} {v1} - {v2}")
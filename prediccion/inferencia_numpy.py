@@ -0,0 +1,241 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+
+# =============================================================================
+# ⚡ INFERENCIA EN NUMPY PURO (sin xgboost ni scikit-learn al servir)
+# =============================================================================
+# Al entrenar, cada .pkl de la app se "compila" a un .npz con arrays planos:
+#   - scaler_final.pkl            -> media y escala
+#   - modelo_logistico_final.pkl  -> coeficientes + intercepto
+#   - modelo_xgboost_final.pkl    -> todos los árboles en arrays de nodos
+#                                    (feature, umbral, hijo izq/der, default, valor de hoja)
+# y se evalúa con NumPy: el XGBoost baja por TODOS los árboles a la vez, un paso
+# por nivel (5 pasos para max_depth=5), para una fila o para un lote entero.
+#
+# Cada .npz guarda el hash del .pkl del que salió: si el .pkl cambia (se volvió a
+# entrenar sin exportar), cargar_modelo() lo ignora y usa joblib como antes.
+#
+# Uso:  python inferencia_numpy.py   (exporta los tres, verifica contra el original y mide)
+
+VERSION_COMPILADO = 1
+ARCHIVOS_APP = ['scaler_final.pkl', 'modelo_logistico_final.pkl', 'modelo_xgboost_final.pkl']
+
+
+def _sigmoide(margen):
+    return 1.0 / (1.0 + np.exp(-margen))
+
+
+def _matriz(X):
+    # DataFrame, lista o array -> array 2D float64 (una fila si viene 1D)
+    X = np.asarray(X, dtype=np.float64)
+    return X.reshape(1, -1) if X.ndim == 1 else X
+
+
+def _proba(p1):
+    return np.column_stack([1.0 - p1, p1])  # Mismo formato que predict_proba de sklearn
+
+
+# -------------------------------------------------------------------------
+# MODELOS COMPILADOS (misma interfaz que usa la app: transform / predict_proba)
+# -------------------------------------------------------------------------
+class EscaladorNumpy:
+    def __init__(self, media, escala):
+        self.media, self.escala = media, escala
+
+    def transform(self, X):
+        return (_matriz(X) - self.media) / self.escala
+
+
+class LogisticaNumpy:
+    def __init__(self, coef, intercepto):
+        self.coef, self.intercepto = coef, intercepto
+
+    def predict_proba(self, X):
+        return _proba(_sigmoide(_matriz(X) @ self.coef + self.intercepto))
+
+
+class XGBoostNumpy:
+    def __init__(self, feature, umbral, izq, der, por_defecto_izq, valor, raices, profundidad, margen_base):
+        # Nodos de todos los árboles concatenados. Las hojas apuntan a sí mismas (izq = der = ella),
+        # así después de `profundidad` pasos cada árbol queda parado en su hoja.
+        self.feature, self.umbral = feature, umbral
+        self.izq, self.der, self.por_defecto_izq = izq, der, por_defecto_izq
+        self.valor, self.raices = valor, raices
+        self.profundidad, self.margen_base = int(profundidad), float(margen_base)
+        self._hijos = np.column_stack([der, izq]).ravel()  # hijos[2 * nodo + va_a_izquierda]
+
+    def predict_proba(self, X):
+        X = _matriz(X).astype(np.float32)  # XGBoost compara en float32
+        plano, hay_nan = X.ravel(), np.isnan(X).any()
+        desplazamiento = (np.arange(len(X)) * X.shape[1])[:, None]
+        nodos = np.broadcast_to(self.raices, (len(X), len(self.raices)))
+        for _ in range(self.profundidad):
+            x = plano[desplazamiento + self.feature[nodos]]
+            a_izq = x < self.umbral[nodos]
+            if hay_nan:
+                a_izq = np.where(np.isnan(x), self.por_defecto_izq[nodos], a_izq)
+            nodos = self._hijos[2 * nodos + a_izq]
+        margen = self.margen_base + self.valor[nodos].sum(axis=1, dtype=np.float64)
+        return _proba(_sigmoide(margen))
+
+
+CLASES = {'escalador': EscaladorNumpy, 'logistica': LogisticaNumpy, 'xgboost': XGBoostNumpy}
+
+
+# -------------------------------------------------------------------------
+# COMPILACIÓN (esto sí necesita sklearn / xgboost: corre al entrenar)
+# -------------------------------------------------------------------------
+def _compilar_xgboost(modelo):
+    modelo_json = json.loads(modelo.get_booster().save_raw('json'))
+    learner = modelo_json['learner']
+    objetivo = learner['objective']['name']
+    if objetivo != 'binary:logistic':
+        raise ValueError(f"Objetivo de XGBoost no soportado: {objetivo}")
+
+    partes, raices, inicio, profundidad = [], [], 0, 0
+    for arbol in learner['gradient_booster']['model']['trees']:
+        izq = np.asarray(arbol['left_children'], dtype=np.int32)
+        der = np.asarray(arbol['right_children'], dtype=np.int32)
+        hoja = izq == -1
+        propios = np.arange(len(izq), dtype=np.int32)
+        partes.append({
+            'feature': np.where(hoja, 0, np.asarray(arbol['split_indices'], dtype=np.int32)),
+            'umbral': np.asarray(arbol['split_conditions'], dtype=np.float32),
+            'izq': np.where(hoja, propios, izq) + inicio,
+            'der': np.where(hoja, propios, der) + inicio,
+            'por_defecto_izq': np.asarray(arbol['default_left'], dtype=bool),
+            'valor': np.where(hoja, np.asarray(arbol['split_conditions'], dtype=np.float32), 0).astype(np.float32),
+        })
+        raices.append(inicio)
+        inicio += len(izq)
+
+        # Profundidad del árbol (para saber cuántos pasos dar)
+        nivel = np.zeros(len(izq), dtype=np.int32)
+        for nodo in range(len(izq)):  # Los hijos siempre tienen índice mayor que el padre
+            if not hoja[nodo]:
+                nivel[izq[nodo]] = nivel[der[nodo]] = nivel[nodo] + 1
+        profundidad = max(profundidad, int(nivel.max()))
+
+    base = float(str(learner['learner_model_param']['base_score']).strip('[]'))
+    arrays = {clave: np.concatenate([p[clave] for p in partes]) for clave in partes[0]}
+    return dict(arrays, raices=np.asarray(raices, dtype=np.int32), profundidad=np.int32(profundidad),
+                margen_base=np.float64(np.log(base / (1.0 - base))))
+
+
+def compilar(modelo):
+    # Objeto entrenado (sklearn / xgboost) -> (tipo, {nombre: array})
+    nombre = type(modelo).__name__
+    if nombre == 'StandardScaler':
+        media = modelo.mean_ if modelo.mean_ is not None else np.zeros(modelo.n_features_in_)
+        escala = modelo.scale_ if modelo.scale_ is not None else np.ones(modelo.n_features_in_)
+        return 'escalador', {'media': media, 'escala': escala}
+    if nombre == 'LogisticRegression':
+        if modelo.coef_.shape[0] != 1:
+            raise ValueError("Solo regresión logística binaria")
+        return 'logistica', {'coef': modelo.coef_[0], 'intercepto': np.float64(modelo.intercept_[0])}
+    if nombre == 'XGBClassifier':
+        return 'xgboost', _compilar_xgboost(modelo)
+    raise ValueError(f"No sé compilar un {nombre}")
+
+
+# -------------------------------------------------------------------------
+# GUARDAR / CARGAR
+# -------------------------------------------------------------------------
+def huella_archivo(ruta):
+    with open(ruta, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def ruta_compilado(ruta_pkl):
+    return os.path.splitext(ruta_pkl)[0] + '.npz'
+
+
+def exportar(ruta_pkl):
+    # Compila un .pkl de la app a su .npz (al lado). Devuelve la ruta del .npz
+    import joblib
+    tipo, arrays = compilar(joblib.load(ruta_pkl))
+    destino = ruta_compilado(ruta_pkl)
+    np.savez(destino, _version=np.int32(VERSION_COMPILADO), _tipo=np.str_(tipo),
+             _origen=np.str_(huella_archivo(ruta_pkl)), **arrays)
+    return destino
+
+
+def leer_compilado(ruta_npz, huella_origen=None):
+    # (tipo, {nombre: array}) del .npz, o None si no existe, es de otra versión o salió de otro .pkl
+    try:
+        with np.load(ruta_npz, allow_pickle=False) as datos:
+            if int(datos['_version']) != VERSION_COMPILADO:
+                return None
+            if huella_origen is not None and str(datos['_origen']) != huella_origen:
+                return None
+            return str(datos['_tipo']), {k: datos[k] for k in datos.files if not k.startswith('_')}
+    except (FileNotFoundError, KeyError, ValueError):
+        return None
+
+
+def cargar_compilado(ruta_npz, huella_origen=None):
+    # El modelo compilado, o None (mismos casos que leer_compilado)
+    leido = leer_compilado(ruta_npz, huella_origen)
+    if leido is None:
+        return None
+    tipo, arrays = leido
+    return CLASES[tipo](**arrays)
+
+
+def cargar_modelo(ruta_pkl):
+    # Lo que usa la app: el .npz si está al día con el .pkl; si no, el .pkl con joblib.
+    # Si falta el .pkl -> FileNotFoundError (como joblib.load)
+    compilado = cargar_compilado(ruta_compilado(ruta_pkl), huella_archivo(ruta_pkl))
+    if compilado is not None:
+        return compilado
+    import joblib
+    return joblib.load(ruta_pkl)
+
+
+if __name__ == "__main__":
+    import subprocess
+    import sys
+    import time
+
+    import joblib
+
+    print("⚡ EXPORTANDO MODELOS A NUMPY...")
+    for archivo in ARCHIVOS_APP:
+        print(f"   💾 {archivo} -> {os.path.basename(exportar(archivo))}")
+
+    # --- Verificación contra el original (filas reales escaladas + algunos NaN) ---
+    scaler = joblib.load('scaler_final.pkl')
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(5000, len(scaler.mean_))) * scaler.scale_ + scaler.mean_
+    X[rng.random(X.shape) < 0.01] = np.nan
+    Xs = scaler.transform(X)
+    assert np.allclose(cargar_modelo('scaler_final.pkl').transform(X), Xs, atol=1e-12, equal_nan=True)
+
+    Xs_sin_nan = np.nan_to_num(Xs)
+    for archivo, entrada in (('modelo_logistico_final.pkl', Xs_sin_nan), ('modelo_xgboost_final.pkl', Xs)):
+        original, rapido = joblib.load(archivo), cargar_modelo(archivo)
+        diferencia = np.abs(original.predict_proba(entrada)[:, 1] - rapido.predict_proba(entrada)[:, 1]).max()
+        assert diferencia < 1e-6, f"❌ {archivo}: diferencia {diferencia:.2e}"
+        print(f"   ✅ {archivo}: máxima diferencia {diferencia:.1e} en {len(entrada):,} filas")
+
+        # --- Latencia de una fila (lo que hace la app por clic) ---
+        fila = entrada[:1]
+        tiempos = {}
+        for nombre, modelo in (('original', original), ('numpy', rapido)):
+            inicio = time.perf_counter()
+            for _ in range(500):
+                modelo.predict_proba(fila)
+            tiempos[nombre] = (time.perf_counter() - inicio) / 500 * 1000
+        print(f"      ⏱️ 1 fila: {tiempos['original']:.3f} ms -> {tiempos['numpy']:.3f} ms")
+
+    # --- Arranque en frío (proceso nuevo: imports + carga) ---
+    codigo = ("import time; t = time.perf_counter(); {imp}; "
+              "[cargar(a) for a in {archivos!r}]; print(time.perf_counter() - t)")
+    for nombre, imp in (('joblib', "import joblib; cargar = joblib.load"),
+                        ('numpy', "from inferencia_numpy import cargar_modelo as cargar")):
+        salida = subprocess.run([sys.executable, '-W', 'ignore', '-c', codigo.format(imp=imp, archivos=ARCHIVOS_APP)],
+                                capture_output=True, text=True, check=True)
+        print(f"   🚀 Arranque en frío con {nombre}: {float(salida.stdout.strip()) * 1000:.0f} ms")
@@ -0,0 +1,231 @@
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from predictor_lote import FEATURES, RAIZ, PredictorLote
+
+# =============================================================================
+# 🧮 MATRIZ PRECALCULADA DEL TOP N (jugador x jugador x superficie)
+# =============================================================================
+# Casi todas las consultas de la app son entre jugadores del top 200 y con los
+# valores que la página pone sola al elegirlos (ranking, edad, altura y momentum
+# del perfil, fatiga 0, sin localía). Para esos casos la respuesta se precalcula:
+#   P[i, j, s] = prob. de que i le gane a j en la superficie s  (float32)
+# y la página la lee del array en vez de llamar al modelo. Si el usuario toca
+# algún número (o juega de local uno solo), se usa el modelo como siempre.
+#
+# - Se guarda un .npy por modelo en matriz_top/ y se abre con mmap (no se copia a RAM).
+# - La "huella" es el hash de los archivos de los que sale: modelo, scaler, skills,
+#   perfiles, ranking e índice H2H. Si cambia alguno, la matriz se rearma (y solo entonces).
+#
+# Uso:  python matriz_top.py                 (rearma solo si cambió algo)
+#       python matriz_top.py --top 300 --forzar --verificar
+
+VERSION_MATRIZ = 1
+CARPETA_MATRIZ = 'matriz_top'  # Dentro de /prediccion
+SUPERFICIES = ['Hard', 'Clay', 'Grass']
+TOP_N = 200
+MODELOS_APP = ['xgboost', 'logistica']
+ARCHIVOS_MODELO = {'xgboost': 'modelo_xgboost_final.pkl', 'logistica': 'modelo_logistico_final.pkl'}
+
+
+def valores_por_defecto(perfil, rank_2026=None):
+    # Lo que la página pone en los inputs al elegir un jugador (con sus mismos redondeos)
+    return {
+        'rank': rank_2026 if rank_2026 is not None else int(perfil['rank']),
+        'age': float(perfil['age']),
+        'ht': int(perfil['ht']),
+        'momentum': int(perfil['momentum'] * 100) / 100,
+    }
+
+
+def huella_artefactos(ruta_proyecto, modelo, top=TOP_N):
+    # Hash del contenido de todo lo que entra en la matriz (los que falten cuentan como vacíos)
+    archivos = [os.path.join(ruta_proyecto, 'prediccion', ARCHIVOS_MODELO[modelo]),
+                os.path.join(ruta_proyecto, 'prediccion', 'scaler_final.pkl'),
+                os.path.join(ruta_proyecto, 'prediccion', 'stats_superficie_v2.pkl'),
+                os.path.join(ruta_proyecto, 'scraping', 'perfiles_jugadores.pkl'),
+                os.path.join(ruta_proyecto, 'scraping', 'ranking_2026.csv'),
+                os.path.join(ruta_proyecto, 'scraping', 'indice_h2h.pkl')]
+    h = hashlib.sha256(f"v{VERSION_MATRIZ}|{modelo}|{top}|{','.join(SUPERFICIES)}".encode())
+    for ruta in archivos:
+        h.update(os.path.basename(ruta).encode())
+        if os.path.exists(ruta):
+            with open(ruta, 'rb') as f:
+                h.update(f.read())
+    return h.hexdigest()[:16]
+
+
+class MatrizTop:
+    def __init__(self, nombres, superficies, P, huella):
+        self.nombres = nombres
+        self.posicion = {n: i for i, n in enumerate(nombres)}
+        self.superficies = {s: k for k, s in enumerate(superficies)}
+        self.P = P          # float32 [N, N, superficies] (mmap de solo lectura)
+        self.huella = huella
+
+    def buscar(self, p1, p2, superficie):
+        # Prob. de que gane p1 con los valores por defecto, o None si el par no está en la matriz
+        i, j, s = self.posicion.get(p1), self.posicion.get(p2), self.superficies.get(superficie)
+        if i is None or j is None or s is None or i == j:
+            return None
+        return float(self.P[i, j, s])
+
+
+# -------------------------------------------------------------------------
+# ARMADO Y CARGA
+# -------------------------------------------------------------------------
+def _carpeta(ruta_proyecto):
+    return os.path.join(ruta_proyecto, 'prediccion', CARPETA_MATRIZ)
+
+
+def _rutas(ruta_proyecto, modelo, huella=None):
+    carpeta = _carpeta(ruta_proyecto)
+    manifiesto = os.path.join(carpeta, f'{modelo}.json')
+    return manifiesto, (os.path.join(carpeta, f'{modelo}_{huella}.npy') if huella else None)
+
+
+def predictor_por_defecto(ruta_proyecto, modelo):
+    # PredictorLote con los valores que pone la página (en vez de los crudos del perfil)
+    predictor = PredictorLote.desde_recursos(ruta_proyecto, modelo)
+    defecto = [valores_por_defecto(predictor.perfiles[i], predictor.ranking.get(n))
+               for i, n in zip(predictor.ids.tolist(), predictor.nombres)]
+    for atributo, campo in (('rank', 'rank'), ('edad', 'age'), ('altura', 'ht'), ('momentum', 'momentum')):
+        setattr(predictor, atributo, np.array([d[campo] for d in defecto], dtype=float))
+    return predictor
+
+
+def construir_matriz(ruta_proyecto=RAIZ, modelo='xgboost', top=TOP_N):
+    huella = huella_artefactos(ruta_proyecto, modelo, top)
+    predictor = predictor_por_defecto(ruta_proyecto, modelo)
+    orden = np.argsort(predictor.rank, kind='stable')[:top]  # Mismo ranking que muestra la página
+    nombres = [predictor.nombres[k] for k in orden]
+
+    n = len(nombres)
+    i, j = np.nonzero(~np.eye(n, dtype=bool))
+    pares = [(nombres[a], nombres[b]) for a, b in zip(i, j)]
+    P = np.full((n, n, len(SUPERFICIES)), 0.5, dtype=np.float32)
+    for s, superficie in enumerate(SUPERFICIES):
+        P[i, j, s] = predictor.predict_many(pares, superficie, 'NEUTRAL')
+
+    # Archivo nuevo con la huella en el nombre + manifiesto reemplazado de una vez:
+    # quien tenga abierta la matriz vieja la sigue leyendo sin problemas
+    carpeta = _carpeta(ruta_proyecto)
+    os.makedirs(carpeta, exist_ok=True)
+    manifiesto, ruta_npy = _rutas(ruta_proyecto, modelo, huella)
+    np.save(ruta_npy + '.tmp.npy', P)
+    os.replace(ruta_npy + '.tmp.npy', ruta_npy)
+    with open(manifiesto + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump({'version': VERSION_MATRIZ, 'huella': huella, 'modelo': modelo, 'top': top,
+                   'superficies': SUPERFICIES, 'archivo': os.path.basename(ruta_npy), 'nombres': nombres}, f)
+    os.replace(manifiesto + '.tmp', manifiesto)
+
+    for viejo in os.listdir(carpeta):
+        if viejo.startswith(f'{modelo}_') and viejo.endswith('.npy') and viejo != os.path.basename(ruta_npy):
+            try:
+                os.remove(os.path.join(carpeta, viejo))
+            except OSError:
+                pass  # Windows: todavía abierta por la app, se borra en el próximo armado
+    return huella
+
+
+def cargar_matriz(ruta_proyecto=RAIZ, modelo='xgboost', huella=None):
+    # MatrizTop al día, o None si no existe o quedó vieja (otra huella)
+    manifiesto, _ = _rutas(ruta_proyecto, modelo)
+    try:
+        with open(manifiesto, encoding='utf-8') as f:
+            datos = json.load(f)
+        if datos.get('version') != VERSION_MATRIZ:
+            return None
+        if datos['huella'] != (huella or huella_artefactos(ruta_proyecto, modelo, datos['top'])):
+            return None
+        P = np.load(os.path.join(_carpeta(ruta_proyecto), datos['archivo']), mmap_mode='r')
+    except (FileNotFoundError, ValueError, KeyError):
+        return None
+    return MatrizTop(datos['nombres'], datos['superficies'], P, datos['huella'])
+
+
+# -------------------------------------------------------------------------
+# PARA LA APP: usar la matriz si está al día y, si no, rearmarla en segundo plano
+# -------------------------------------------------------------------------
+_CARGADAS = {}   # {(ruta, modelo): MatrizTop}
+_EN_CURSO = {}   # {(ruta, modelo): hilo que la está armando}
+_CANDADO = threading.Lock()
+
+
+def matriz_al_dia(ruta_proyecto=RAIZ, modelo='xgboost', top=TOP_N):
+    huella = huella_artefactos(ruta_proyecto, modelo, top)
+    clave = (ruta_proyecto, modelo)
+    actual = _CARGADAS.get(clave)
+    if actual is not None and actual.huella == huella:
+        return actual
+
+    matriz = cargar_matriz(ruta_proyecto, modelo, huella)
+    if matriz is not None:
+        _CARGADAS[clave] = matriz
+        return matriz
+
+    # Vieja o inexistente: mientras se arma, la app sigue llamando al modelo
+    with _CANDADO:
+        hilo = _EN_CURSO.get(clave)
+        if hilo is None or not hilo.is_alive():
+            hilo = threading.Thread(target=construir_matriz, args=(ruta_proyecto, modelo, top), daemon=True)
+            _EN_CURSO[clave] = hilo
+            hilo.start()
+    return None
+
+
+def _verificar(ruta_proyecto, modelo, matriz, cantidad=300):
+    # Chequeo contra el camino de la página: DataFrame de una fila con los valores por defecto
+    predictor = PredictorLote.desde_recursos(ruta_proyecto, modelo)
+    rng = np.random.default_rng(0)
+    n = len(matriz.nombres)
+    for _ in range(cantidad):
+        a, b = rng.choice(n, size=2, replace=False)
+        p1, p2 = matriz.nombres[a], matriz.nombres[b]
+        superficie = SUPERFICIES[rng.integers(len(SUPERFICIES))]
+        d1 = valores_por_defecto(predictor.perfiles[p1], predictor.ranking.get(p1))
+        d2 = valores_por_defecto(predictor.perfiles[p2], predictor.ranking.get(p2))
+        wins1, wins2 = predictor.indice_h2h.victorias(p1, p2) if predictor.indice_h2h is not None else (0, 0)
+        fila = pd.DataFrame([{
+            'diff_rank': d2['rank'] - d1['rank'],
+            'diff_rank_points': predictor.perfiles[p1].get('points', 0) - predictor.perfiles[p2].get('points', 0),
+            'diff_age': d1['age'] - d2['age'],
+            'diff_ht': d1['ht'] - d2['ht'],
+            'diff_skill': predictor.stats_dict.get((p1, superficie), 0.5) - predictor.stats_dict.get((p2, superficie), 0.5),
+            'diff_home': 0,
+            'diff_fatigue': 0,
+            'diff_momentum': d1['momentum'] - d2['momentum'],
+            'diff_h2h': wins1 - wins2,
+        }], columns=FEATURES)
+        esperada = predictor.modelo.predict_proba(predictor.scaler.transform(fila))[0][1]
+        guardada = matriz.buscar(p1, p2, superficie)
+        assert abs(esperada - guardada) < 1e-6, f"❌ {p1} vs {p2} ({superficie}): {guardada} vs {esperada}"
+    print(f"   ✅ Coincide con la predicción de la página ({cantidad} pares al azar)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Arma la matriz de probabilidades del top N")
+    parser.add_argument('--top', type=int, default=TOP_N)
+    parser.add_argument('--modelos', nargs='+', default=MODELOS_APP, choices=MODELOS_APP)
+    parser.add_argument('--forzar', action='store_true', help="Rearmar aunque esté al día")
+    parser.add_argument('--verificar', action='store_true')
+    args = parser.parse_args()
+
+    print(f"🧮 MATRIZ DEL TOP {args.top} ({' x '.join(SUPERFICIES)})")
+    for modelo in args.modelos:
+        huella = huella_artefactos(RAIZ, modelo, args.top)
+        if not args.forzar and cargar_matriz(RAIZ, modelo, huella) is not None:
+            print(f"   ✅ {modelo}: al día ({huella})")
+        else:
+            inicio = time.perf_counter()
+            construir_matriz(RAIZ, modelo, args.top)
+            print(f"   💾 {modelo}: rearmada en {time.perf_counter() - inicio:.2f} s ({huella})")
+        if args.verificar:
+            _verificar(RAIZ, modelo, cargar_matriz(RAIZ, modelo, huella))
@@ -0,0 +1,45 @@
+import numpy as np
+from multiprocessing import shared_memory
+
+# =============================================================================
+# 🧵 ARRAYS EN MEMORIA COMPARTIDA PARA LOS PROCESOS DEL POOL
+# =============================================================================
+# El proceso principal copia cada array UNA vez a un bloque compartido y le pasa
+# a los workers solo (nombre, forma, dtype). Cada worker se "engancha" a los
+# bloques en su inicializador y lee los datos sin copiarlos (importante en
+# Windows, donde cada proceso arranca de cero).
+#
+#   bloques, descripcion = compartir({'X': X, 'y': y})
+#   ProcessPoolExecutor(initializer=adjuntar, initargs=(descripcion,))
+#   ... en el worker: DATOS['X']
+#   liberar(bloques)
+
+DATOS = {}      # Arrays vistos por cada worker (apuntan a la memoria compartida)
+_BLOQUES = []   # Referencias para que los bloques no se cierren mientras se usan
+
+
+def compartir(arrays):
+    # Copia cada array a un bloque de memoria compartida. Devuelve (bloques, descripción para los workers)
+    bloques, descripcion = [], {}
+    for clave, arr in arrays.items():
+        shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+        np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[:] = arr
+        bloques.append(shm)
+        descripcion[clave] = (shm.name, arr.shape, arr.dtype.str)
+    return bloques, descripcion
+
+
+def adjuntar(descripcion):
+    # Inicializador de cada worker: se "engancha" a los bloques sin copiarlos
+    for clave, (nombre, forma, dtype) in descripcion.items():
+        # (Los workers comparten el resource tracker del proceso principal, que es quien los borra)
+        shm = shared_memory.SharedMemory(name=nombre)
+        _BLOQUES.append(shm)
+        DATOS[clave] = np.ndarray(forma, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def liberar(bloques):
+    # Solo en el proceso principal, cuando el pool ya terminó
+    for shm in bloques:
+        shm.close()
+        shm.unlink()
@@ -0,0 +1,334 @@
+import argparse
+import hashlib
+import os
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from almacen_partidos import ARCHIVO_HISTORIAL, cargar_historial
+
+# =============================================================================
+# 🧠 MOTOR DE ELO (IDs enteros + arrays de NumPy)
+# =============================================================================
+# Reemplaza al viejo bucle con df.iterrows() de predict.py.
+# - Cada jugador y cada superficie recibe un ID entero.
+# - Los ratings viven en arrays (elo[jugador], elo_surf[jugador, superficie]).
+# - La actualización secuencial recorre columnas ya extraídas (sin filas de Pandas).
+# Los resultados son idénticos a calcular_elo() original (mismas fórmulas y mismo orden).
+#
+# El estado completo (IDs + ratings + último partido procesado) se guarda en
+# 'estado_elo.pkl'. Así el refresco nocturno solo procesa los partidos nuevos:
+#     python motor_elo.py update               -> aplica solo lo nuevo
+#     python motor_elo.py update --rebuild     -> recalcula desde el primer partido
+#     python motor_elo.py update --verificar   -> chequea (en una copia) incremental == recalcular todo
+# Siempre sobre el MISMO historial (scraping/historialTenis.csv, el que actualiza el
+# pipeline). El estado guarda una huella de los partidos ya aplicados: si el historial
+# cambió antes de la marca (u otro CSV), se recalcula todo en vez de sumar encima.
+
+STARTING_ELO = 1500
+
+# Factor K según la categoría del torneo
+K_BASE = 32
+K_MASTERS = 40
+K_GRAND_SLAM = 50
+
+# Formato del artefacto de estado (subir si cambia la estructura)
+VERSION_ESTADO = 3
+ARCHIVO_ESTADO = 'estado_elo.pkl'
+
+# Clave cronológica de cada partido: define el orden y la "marca de agua"
+COLUMNAS_CLAVE = ['tourney_date', 'tourney_id', 'match_num']
+# Lo que lee procesar_df() de cada partido: todo esto entra en la huella
+COLUMNAS_PARTIDO = ['winner_name', 'loser_name', 'surface', 'tourney_level']
+
+
+def factor_k(niveles):
+    # Se evalúa una sola vez por categoría distinta (no por partido)
+    niveles = pd.Series(niveles).astype(str)
+    k = np.full(len(niveles), K_BASE, dtype=np.int64)
+    k[niveles.str.contains('Masters', regex=False).to_numpy()] = K_MASTERS
+    k[niveles.str.contains('Grand Slam', regex=False).to_numpy()] = K_GRAND_SLAM
+    return k
+
+
+def claves_cronologicas(df):
+    # Normalizamos tipos para poder ordenar y comparar sin sorpresas
+    return pd.DataFrame({
+        'tourney_date': pd.to_numeric(df['tourney_date'], errors='coerce').to_numpy(dtype=float),
+        'tourney_id': df['tourney_id'].astype(str).to_numpy(),
+        'match_num': pd.to_numeric(df['match_num'], errors='coerce').fillna(0).to_numpy(dtype=float),
+    }, index=df.index)
+
+
+def ordenar_cronologico(df):
+    # Orden estable por (fecha, torneo, número de partido)
+    claves = claves_cronologicas(df)
+    orden = np.lexsort((claves['match_num'].to_numpy(), claves['tourney_id'].to_numpy(),
+                        claves['tourney_date'].to_numpy()))
+    return df.iloc[orden]
+
+
+def posteriores_a(df, marca):
+    # Máscara de los partidos cuya clave es estrictamente mayor que la marca
+    claves = claves_cronologicas(df)
+    d, t, m = claves['tourney_date'].to_numpy(), claves['tourney_id'].to_numpy(), claves['match_num'].to_numpy()
+    d0, t0, m0 = marca
+    return (d > d0) | ((d == d0) & ((t > t0) | ((t == t0) & (m > m0))))
+
+
+def huella_partidos(df_ordenado):
+    # Hash de la clave y de todo lo que usa el Elo de cada partido (jugadores, superficie y
+    # categoría -> K), en orden: cambia si se agrega, borra, reordena o corrige cualquier partido
+    # (ej: corregir_superficie_ranking.py reescribe superficies de partidos viejos)
+    tabla = claves_cronologicas(df_ordenado).assign(
+        **{col: df_ordenado[col].astype(str).to_numpy() for col in COLUMNAS_PARTIDO})
+    return hashlib.sha256(pd.util.hash_pandas_object(tabla, index=False).to_numpy().tobytes()).hexdigest()
+
+
+def _asignar_ids(valores, mapa):
+    # Factorizamos primero: el trabajo en Python es por valor único, no por fila
+    codigos, unicos = pd.factorize(np.asarray(valores, dtype=object), use_na_sentinel=False)
+    ids_unicos = np.array([mapa.setdefault(u, len(mapa)) for u in unicos], dtype=np.int64)
+    return ids_unicos[codigos]
+
+
+def _actualizar(w_ids, l_ids, s_ids, ks, elo, elo_surf):
+    # Bucle secuencial puro: el Elo de cada partido depende del anterior.
+    # Trabajamos sobre listas planas (el acceso por índice es mucho más barato
+    # que indexar escalares de NumPy) y al final volcamos todo a los arrays.
+    n_surf = elo_surf.shape[1]
+    r = elo.tolist()
+    rs = elo_surf.ravel().tolist()
+
+    n = len(w_ids)
+    out_we, out_le = [0.0] * n, [0.0] * n
+    out_wes, out_les = [0.0] * n, [0.0] * n
+
+    for i, (w, l, s, k) in enumerate(zip(w_ids.tolist(), l_ids.tolist(), s_ids.tolist(), ks.tolist())):
+        we = r[w]; le = r[l]
+        iw = w * n_surf + s; il = l * n_surf + s
+        wes = rs[iw]; les = rs[il]
+
+        out_we[i] = we; out_le[i] = le
+        out_wes[i] = wes; out_les[i] = les
+
+        # Probabilidad esperada del ganador
+        pw = 1 / (1 + 10 ** ((le - we) / 400))
+        pws = 1 / (1 + 10 ** ((les - wes) / 400))
+
+        delta = k * (1 - pw)
+        delta_s = k * (1 - pws)
+
+        r[w] = we + delta
+        r[l] = le - delta
+        rs[iw] = wes + delta_s
+        rs[il] = les - delta_s
+
+    elo[:] = r
+    elo_surf[:] = np.asarray(rs).reshape(elo_surf.shape)
+    return (np.asarray(out_we), np.asarray(out_le),
+            np.asarray(out_wes), np.asarray(out_les))
+
+
+class MotorElo:
+    def __init__(self):
+        self.jugadores = {}    # {nombre: id}
+        self.superficies = {}  # {superficie: id}
+        self.elo = np.empty(0, dtype=np.float64)
+        self.elo_surf = np.empty((0, 0), dtype=np.float64)
+        self.visto_surf = np.zeros((0, 0), dtype=bool)  # ¿El jugador jugó alguna vez en esa superficie?
+        self.orden_surf = []  # Orden de aparición de (jugador, superficie), para exportar igual que antes
+
+    def _crecer(self):
+        # Agrandamos los arrays si aparecieron jugadores o superficies nuevas
+        n_j, n_s = len(self.jugadores), len(self.superficies)
+        if n_j > len(self.elo):
+            self.elo = np.concatenate([self.elo, np.full(n_j - len(self.elo), float(STARTING_ELO))])
+        if (n_j, n_s) != self.elo_surf.shape:
+            nuevo = np.full((n_j, n_s), float(STARTING_ELO))
+            visto = np.zeros((n_j, n_s), dtype=bool)
+            f, c = self.elo_surf.shape
+            nuevo[:f, :c] = self.elo_surf
+            visto[:f, :c] = self.visto_surf
+            self.elo_surf, self.visto_surf = nuevo, visto
+
+    def procesar(self, winners, losers, surfaces, niveles):
+        # Recibe columnas (ya ordenadas cronológicamente) y devuelve el Elo PREVIO a cada partido
+        winners = np.asarray(winners, dtype=object)
+        losers = np.asarray(losers, dtype=object)
+
+        # Intercalamos ganador/perdedor para respetar el orden de aparición original
+        ids = _asignar_ids(np.column_stack([winners, losers]).ravel(), self.jugadores)
+        w_ids, l_ids = ids[0::2], ids[1::2]
+        s_ids = _asignar_ids(surfaces, self.superficies)
+        ks = factor_k(niveles)
+        self._crecer()
+
+        # Registramos los pares (jugador, superficie) nuevos en orden de aparición
+        pares = np.column_stack([w_ids, l_ids]).ravel() * len(self.superficies) + np.repeat(s_ids, 2)
+        _, primeros = np.unique(pares, return_index=True)
+        for p in pares[np.sort(primeros)]:
+            j, s = divmod(int(p), len(self.superficies))
+            if not self.visto_surf[j, s]:
+                self.visto_surf[j, s] = True
+                self.orden_surf.append((j, s))
+
+        return _actualizar(w_ids, l_ids, s_ids, ks, self.elo, self.elo_surf)
+
+    def procesar_df(self, df):
+        return self.procesar(*(df[col].to_numpy() for col in COLUMNAS_PARTIDO))
+
+    def diccionarios(self):
+        # Mismo formato que elo_rating.pkl / elo_rating_surface.pkl
+        nombres = list(self.jugadores)
+        surfs = list(self.superficies)
+        elo_dict = dict(zip(nombres, self.elo.tolist()))
+        elo_surf_dict = {(nombres[j], surfs[s]): float(self.elo_surf[j, s]) for j, s in self.orden_surf}
+        return elo_dict, elo_surf_dict
+
+    # --- PERSISTENCIA ---
+    def a_estado(self, ultima_clave, partidos, huella):
+        return {
+            'version': VERSION_ESTADO,
+            'jugadores': list(self.jugadores),
+            'superficies': list(self.superficies),
+            'elo': self.elo,
+            'elo_surf': self.elo_surf,
+            'orden_surf': np.asarray(self.orden_surf, dtype=np.int64).reshape(-1, 2),
+            'ultima_clave': ultima_clave,  # (tourney_date, tourney_id, match_num) del último partido aplicado
+            'partidos': partidos,          # Cantidad de partidos aplicados
+            'huella': huella,              # huella_partidos() de esos partidos (control de consistencia)
+        }
+
+    @classmethod
+    def desde_estado(cls, estado):
+        motor = cls()
+        motor.jugadores = {n: i for i, n in enumerate(estado['jugadores'])}
+        motor.superficies = {s: i for i, s in enumerate(estado['superficies'])}
+        motor.elo = np.array(estado['elo'], dtype=np.float64)
+        motor.elo_surf = np.array(estado['elo_surf'], dtype=np.float64)
+        motor.orden_surf = [tuple(p) for p in estado['orden_surf'].tolist()]
+        motor.visto_surf = np.zeros(motor.elo_surf.shape, dtype=bool)
+        for j, s in motor.orden_surf:
+            motor.visto_surf[j, s] = True
+        return motor
+
+
+def guardar_estado(estado, ruta=ARCHIVO_ESTADO):
+    joblib.dump(estado, ruta)
+
+
+def cargar_estado(ruta=ARCHIVO_ESTADO):
+    estado = joblib.load(ruta)
+    if not isinstance(estado, dict) or estado.get('version') != VERSION_ESTADO:
+        raise ValueError(f"Versión de estado de Elo incompatible en '{ruta}'")
+    return estado
+
+
+def ultima_clave(df_ordenado):
+    if df_ordenado.empty:
+        return (-np.inf, '', -np.inf)
+    fila = claves_cronologicas(df_ordenado.iloc[[-1]]).iloc[0]
+    return (float(fila['tourney_date']), str(fila['tourney_id']), float(fila['match_num']))
+
+
+def actualizar_elo(ruta_historial=ARCHIVO_HISTORIAL, ruta_estado=ARCHIVO_ESTADO, reconstruir=False):
+    # Aplica al estado guardado SOLO los partidos posteriores a la marca de agua.
+    # El resultado es idéntico a recalcular toda la historia.
+    df = cargar_historial(ruta_historial, categorias=False)  # Almacén columnar si está al día; si no, el CSV
+    df['tourney_date'] = pd.to_numeric(df['tourney_date'], errors='coerce')
+    df = ordenar_cronologico(df[df['tourney_date'] > 0])
+
+    estado = None
+    if not reconstruir and os.path.exists(ruta_estado):
+        try:
+            estado = cargar_estado(ruta_estado)
+        except ValueError as e:
+            print(f"   ⚠️ {e}. Se recalcula todo.")
+
+    if estado is not None:
+        nuevos = posteriores_a(df, estado['ultima_clave'])
+        # Si cambió algo ANTES de la marca (partidos viejos agregados, borrados o corregidos, u otro
+        # historial) no podemos seguir incrementalmente
+        if huella_partidos(df[~nuevos]) != estado['huella']:
+            print("   ⚠️ El historial cambió antes del último partido procesado. Se recalcula todo.")
+            estado = None
+
+    if estado is None:
+        motor, df_nuevos = MotorElo(), df
+    else:
+        motor, df_nuevos = MotorElo.desde_estado(estado), df[nuevos]
+
+    if not df_nuevos.empty:
+        motor.procesar_df(df_nuevos)
+        clave = ultima_clave(df_nuevos)
+    else:
+        clave = estado['ultima_clave'] if estado is not None else ultima_clave(df)
+
+    # Todo lo aplicado hasta acá = todo el historial (lo de antes de la marca ya coincidía)
+    guardar_estado(motor.a_estado(clave, len(df), huella_partidos(df)), ruta_estado)
+    return motor, len(df_nuevos)
+
+
+def calcular_elo(df_matches):
+    # Misma firma y salida que la versión con iterrows
+    motor = MotorElo()
+    w_elo, l_elo, w_elo_surf, l_elo_surf = motor.procesar_df(df_matches)
+    elo_dict, elo_surf_dict = motor.diccionarios()
+    return w_elo, l_elo, w_elo_surf, l_elo_surf, elo_dict, elo_surf_dict
+
+
+def verificar_incremental(ruta_historial=ARCHIVO_HISTORIAL, fraccion=0.9):
+    # En una carpeta temporal: estado con el primer 90% del historial, después el historial completo
+    # (a) tal cual y (b) con una superficie y una categoría de partidos viejos corregidas.
+    # En los dos casos el resultado tiene que ser IDÉNTICO a recalcular todo, y (b) tiene que recalcular
+    import tempfile
+
+    df = cargar_historial(ruta_historial, categorias=False)
+    df['tourney_date'] = pd.to_numeric(df['tourney_date'], errors='coerce')
+    df = ordenar_cronologico(df[df['tourney_date'] > 0]).reset_index(drop=True)
+    corte = int(len(df) * fraccion)
+    corregido = df.copy()
+    superficies = corregido['surface'].astype(str).unique()
+    otra = lambda actual, opciones: next((o for o in opciones if o != actual), actual + ' (corregida)')
+    corregido.loc[0, 'surface'] = otra(str(corregido.loc[0, 'surface']), superficies)
+    corregido.loc[1, 'tourney_level'] = otra(str(corregido.loc[1, 'tourney_level']), ['Grand Slam', 'A'])
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta_csv, ruta_est = os.path.join(carpeta, 'historial.csv'), os.path.join(carpeta, 'estado.pkl')
+        for nombre, completo, esperados in [('sin cambios', df, len(df) - corte),
+                                            ('partidos viejos corregidos', corregido, len(df))]:
+            df.iloc[:corte].to_csv(ruta_csv, index=False)
+            actualizar_elo(ruta_csv, ruta_est, reconstruir=True)
+            completo.to_csv(ruta_csv, index=False)
+            incremental, aplicados = actualizar_elo(ruta_csv, ruta_est)
+            desde_cero, _ = actualizar_elo(ruta_csv, os.path.join(carpeta, 'desde_cero.pkl'), reconstruir=True)
+
+            assert aplicados == esperados, f"❌ {nombre}: se aplicaron {aplicados} partidos, se esperaban {esperados}"
+            assert incremental.diccionarios() == desde_cero.diccionarios(), f"❌ {nombre}: el Elo no coincide"
+            print(f"   ✅ {nombre}: {aplicados} partidos aplicados, idéntico a recalcular todo")
+
+
+# Esto permite correrlo desde la terminal (o desde actualizador_maestro.py)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Actualización incremental del Elo")
+    parser.add_argument('accion', nargs='?', default='update', choices=['update'])
+    parser.add_argument('--historial', default=ARCHIVO_HISTORIAL)
+    parser.add_argument('--estado', default=ARCHIVO_ESTADO)
+    parser.add_argument('--rebuild', action='store_true', help="Ignora el estado guardado y recalcula todo")
+    parser.add_argument('--verificar', action='store_true',
+                        help="Chequea en una copia que lo incremental coincida con recalcular (no toca el estado)")
+    args = parser.parse_args()
+
+    if args.verificar:
+        print("🔬 VERIFICANDO LA ACTUALIZACIÓN INCREMENTAL...")
+        verificar_incremental(args.historial)
+        raise SystemExit(0)
+
+    print("🧠 ACTUALIZANDO ELO...")
+    inicio = time.time()
+    motor, aplicados = actualizar_elo(args.historial, args.estado, reconstruir=args.rebuild)
+    print(f"   -> {aplicados} partidos aplicados | {len(motor.jugadores)} jugadores | {time.time() - inicio:.1f} s")
+    print(f"✅ Estado guardado en '{args.estado}'")
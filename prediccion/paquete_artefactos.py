@@ -0,0 +1,547 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+from collections.abc import Mapping
+from datetime import datetime
+
+import numpy as np
+
+from indice_h2h import IndiceH2H
+from inferencia_numpy import CLASES, huella_archivo
+from registro_jugadores import RegistroJugadores
+
+# =============================================================================
+# 📦 PAQUETE DE ARTEFACTOS (versionado, con mmap, sin pickles)
+# =============================================================================
+# Los artefactos vivían sueltos como pickles de joblib en /prediccion y /scraping
+# (perfiles_jugadores.pkl hasta está dos veces) y cada proceso los deserializaba
+# enteros. El paquete es UNA carpeta:
+#
+#   paquete/
+#     manifiesto.json        versión del esquema, hash de los datos, fecha, componentes
+#     cadenas_bytes.npy      TODAS las cadenas (nombres, países, rivales, ...) en UTF-8, una vez cada una
+#     cadenas_inicios.npy    dónde empieza cada cadena -> las tablas guardan códigos int32
+#     <componente>__<campo>.npy   arrays numéricos
+#
+# - Los .npy se abren con mmap (np.load(mmap_mode='r')): no se copian a RAM y varios
+#   procesos de la app comparten las mismas páginas del disco.
+# - Leer un .npy no ejecuta código (un pickle sí): es más seguro.
+# - Cada componente anota de qué archivo salió y su hash: si ese archivo cambió
+#   después de armar el paquete, ese componente se ignora y se usa el archivo suelto.
+# - Se escribe en una carpeta temporal y se reemplaza de una vez.
+#
+# Perfiles y stats por superficie van POR ID del registro de jugadores (ver
+# registro_jugadores.py): cada fila guarda el id del jugador y no su nombre, y el
+# lector busca la fila de un id en un array (sin diccionarios con strings de clave).
+# Los nombres que el registro todavía no tenía reciben un id al armar el paquete, y
+# el registro que se guarda en el paquete ya los incluye.
+#
+# Lo leen las páginas (vía recursos_app.py) con objetos de solo lectura que se usan
+# igual que los diccionarios de antes, con el id o con el nombre (se resuelve con el
+# registro): perfiles[id]['age'], perfiles[nombre]['age'], stats.get((id, s), 0.5)...
+#
+# Uso:  python paquete_artefactos.py              (arma el paquete y lo compara con los originales)
+
+VERSION_ESQUEMA = 3
+CARPETA_PAQUETE = 'paquete'  # Dentro de /prediccion
+MANIFIESTO = 'manifiesto.json'
+
+# (componente, tipo, archivo de origen relativo a la raíz del proyecto). El registro va después
+# de los que van por id: se guarda con los jugadores que hayan agregado
+COMPONENTES = [
+    ('perfiles', 'perfiles', os.path.join('scraping', 'perfiles_jugadores.pkl')),
+    ('stats_superficie', 'por_jugador', os.path.join('prediccion', 'stats_superficie_v2.pkl')),
+    ('indice_h2h', 'h2h', os.path.join('scraping', 'indice_h2h.pkl')),
+    ('registro', 'registro', os.path.join('scraping', 'registro_jugadores.pkl')),
+    ('scaler', 'compilado', os.path.join('prediccion', 'scaler_final.pkl')),
+    ('modelo_xgboost', 'compilado', os.path.join('prediccion', 'modelo_xgboost_final.pkl')),
+    ('modelo_logistica', 'compilado', os.path.join('prediccion', 'modelo_logistico_final.pkl')),
+]
+
+
+def carpeta_paquete(ruta_proyecto):
+    return os.path.join(ruta_proyecto, 'prediccion', CARPETA_PAQUETE)
+
+
+# -------------------------------------------------------------------------
+# CADENAS INTERNADAS
+# -------------------------------------------------------------------------
+class Internador:
+    # Al escribir: cada cadena distinta recibe un código (una sola vez)
+    def __init__(self):
+        self.codigos, self.cadenas = {}, []
+
+    def __call__(self, texto):
+        texto = str(texto)
+        if texto not in self.codigos:
+            self.codigos[texto] = len(self.cadenas)
+            self.cadenas.append(texto)
+        return self.codigos[texto]
+
+    def muchos(self, textos):
+        return np.array([self(t) for t in textos], dtype=np.int32)
+
+    def arrays(self):
+        datos = [c.encode('utf-8') for c in self.cadenas]
+        inicios = np.concatenate([[0], np.cumsum([len(d) for d in datos])]).astype(np.int64)
+        return {'cadenas_bytes': np.frombuffer(b''.join(datos), dtype=np.uint8), 'cadenas_inicios': inicios}
+
+
+class TablaCadenas:
+    # Al leer: código -> texto (se decodifica solo lo que se pide; la lista entera se arma una vez si hace falta)
+    def __init__(self, datos, inicios):
+        self._datos, self._inicios = datos, inicios
+        self._lista = None
+
+    def __len__(self):
+        return len(self._inicios) - 1
+
+    def __getitem__(self, codigo):
+        if self._lista is not None:
+            return self._lista[codigo]
+        return bytes(self._datos[self._inicios[codigo]:self._inicios[codigo + 1]]).decode('utf-8')
+
+    def lista(self):
+        if self._lista is None:
+            todo, inicios = bytes(self._datos), self._inicios.tolist()
+            self._lista = [todo[inicios[k]:inicios[k + 1]].decode('utf-8') for k in range(len(self))]
+        return self._lista
+
+    def textos(self, codigos):
+        lista = self.lista()
+        return [lista[c] for c in codigos.tolist()]
+
+
+# -------------------------------------------------------------------------
+# EMPAQUETAR CADA TIPO DE ARTEFACTO -> ({campo: array}, metadatos)
+# -------------------------------------------------------------------------
+# Los que van por id (perfiles y por_jugador): una fila por id, en el orden en que aparecen
+TIPOS_POR_ID = ('perfiles', 'por_jugador')
+
+
+def _unicos_por_id(nombres, registro):
+    # -> (ids, posiciones de `nombres` que se quedan). Dos formas de escribir al mismo jugador
+    # (un pickle armado antes del registro) dan el mismo id: queda la que coincide con el nombre
+    # para mostrar del registro y si no, la primera
+    ids = registro.ids(nombres, crear=True)
+    elegida = {}
+    for k, (nombre, i) in enumerate(zip(nombres, ids.tolist())):
+        if i not in elegida or nombre == registro.nombre(i):
+            elegida[i] = k
+    quedan = sorted(elegida.values())
+    return ids[quedan], quedan
+
+
+def _empaquetar_perfiles(perfiles, cad, registro):
+    ids, quedan = _unicos_por_id(list(perfiles), registro)
+    nombres = list(perfiles)
+    datos = [perfiles[nombres[k]] for k in quedan]
+    campos = sorted({k for d in datos for k in d})
+    arrays, meta = {'id': ids}, {'numericos': {}, 'cadenas': [], 'listas': {}, 'por_id': True}
+    for campo in campos:
+        valores = [d.get(campo) for d in datos]
+        muestra = next((v for v in valores if v is not None), None)
+        if isinstance(muestra, str):
+            arrays[campo] = cad.muchos(['' if v is None else v for v in valores])
+            meta['cadenas'].append(campo)
+        elif isinstance(muestra, list):
+            # Lista de diccionarios de texto (last_5): todas las filas seguidas + dónde empieza cada jugador
+            claves = sorted({k for v in valores for fila in (v or []) for k in fila})
+            filas = [fila for v in valores for fila in (v or [])]
+            arrays[f'{campo}.inicios'] = np.concatenate([[0], np.cumsum([len(v or []) for v in valores])]).astype(np.int64)
+            for clave in claves:
+                arrays[f'{campo}.{clave}'] = cad.muchos([fila.get(clave, '') for fila in filas])
+            meta['listas'][campo] = claves
+        else:
+            enteros = all(isinstance(v, (int, np.integer)) and not isinstance(v, bool) for v in valores)
+            arrays[campo] = np.array([np.nan if v is None else v for v in valores], dtype=np.int64 if enteros else np.float64)
+            meta['numericos'][campo] = 'int' if enteros else 'float'
+    return arrays, meta
+
+
+def _empaquetar_por_jugador(diccionario, cad, registro):
+    # {jugador: valor} o {(jugador, superficie): valor} -> matriz densa ids x superficies (NaN = no está)
+    claves = list(diccionario)
+    con_superficie = bool(claves) and isinstance(claves[0], tuple)
+    if not con_superficie:
+        ids, quedan = _unicos_por_id([str(j) for j in claves], registro)
+        valores = np.array(list(diccionario.values()), dtype=np.float64)[quedan]
+        return {'id': ids, 'valores': valores}, {'superficie': False, 'por_id': True}
+    claves = [(str(j), str(s)) for j, s in claves]  # Cada NaN es una clave distinta: como texto quedan iguales
+    jugadores = list(dict.fromkeys(j for j, _ in claves))
+    ids, quedan = _unicos_por_id(jugadores, registro)
+    id_de = dict(zip(jugadores, registro.ids(jugadores).tolist()))
+    fila_de = {i: f for f, i in enumerate(ids.tolist())}
+    superficies = list(dict.fromkeys(s for _, s in claves))
+    pos_s = {s: i for i, s in enumerate(superficies)}
+    valores = np.full((len(ids), len(superficies)), np.nan)
+    # Por casilla: la forma del registro pisa a las otras; si no está, queda la primera que tenga valor
+    for (j, s), v in zip(claves, diccionario.values()):
+        f, k = fila_de[id_de[j]], pos_s[s]
+        if np.isnan(valores[f, k]) or j == registro.nombre(id_de[j]):
+            valores[f, k] = v
+    return {'id': ids, 'superficie': cad.muchos(superficies), 'valores': valores}, {'superficie': True, 'por_id': True}
+
+
+def _empaquetar_h2h(indice, cad, registro=None):
+    return {'jugadores': cad.muchos(indice.jugadores), 'claves': indice.claves,
+            'superficies': cad.muchos(indice.superficies), 'conteos': indice.conteos,
+            'inicios': indice.inicios, 'filas': indice.filas}, {}
+
+
+def _empaquetar_registro(registro, cad, _registro=None):
+    alias = list(registro.alias)
+    return {'nombres': cad.muchos(registro.nombres), 'alias': cad.muchos(alias),
+            'alias_id': np.array([registro.alias[a] for a in alias], dtype=np.int32)}, {}
+
+
+def _cargar_origen(tipo, ruta):
+    import joblib
+    if tipo == 'compilado':
+        from inferencia_numpy import compilar, leer_compilado, ruta_compilado
+        # El .npz de inferencia_numpy si está al día; si no, se compila el .pkl (necesita sklearn/xgboost)
+        leido = leer_compilado(ruta_compilado(ruta), huella_archivo(ruta))
+        return leido if leido is not None else compilar(joblib.load(ruta))
+    if tipo == 'h2h':
+        from indice_h2h import cargar_indice
+        return cargar_indice(ruta)
+    if tipo == 'registro':
+        from registro_jugadores import cargar_registro
+        return cargar_registro(ruta)
+    return joblib.load(ruta)
+
+
+EMPAQUETAR = {'perfiles': _empaquetar_perfiles, 'por_jugador': _empaquetar_por_jugador, 'h2h': _empaquetar_h2h,
+              'registro': _empaquetar_registro}
+
+
+# -------------------------------------------------------------------------
+# ESCRIBIR
+# -------------------------------------------------------------------------
+def escribir_paquete(carpeta, componentes, cad):
+    # componentes: {nombre: (tipo, {campo: array}, metadatos)}
+    temporal, vieja = f'{carpeta}.tmp-{os.getpid()}', f'{carpeta}.viejo-{os.getpid()}'
+    shutil.rmtree(temporal, ignore_errors=True)
+    os.makedirs(temporal)
+
+    h = hashlib.sha256()
+    indice = {}
+    todos = dict(cad.arrays(), **{f'{c}__{campo}': arr for c, (_, arrays, _) in componentes.items()
+                                  for campo, arr in arrays.items()})
+    for nombre in sorted(todos):
+        arr = np.asarray(todos[nombre])
+        np.save(os.path.join(temporal, f'{nombre}.npy'), arr)
+        h.update(nombre.encode())
+        h.update(arr.tobytes())
+        indice[nombre] = {'dtype': arr.dtype.str, 'forma': list(arr.shape)}
+
+    manifiesto = {
+        'version_esquema': VERSION_ESQUEMA,
+        'creado': datetime.now().isoformat(timespec='seconds'),
+        'hash_datos': h.hexdigest(),
+        'componentes': {c: dict(meta, tipo=tipo) for c, (tipo, _, meta) in componentes.items()},
+        'arrays': indice,
+    }
+    with open(os.path.join(temporal, MANIFIESTO), 'w', encoding='utf-8') as f:
+        json.dump(manifiesto, f, ensure_ascii=False, indent=1)
+
+    # Reemplazo: los procesos que tengan abierto el paquete viejo lo siguen leyendo (Linux / macOS)
+    if os.path.exists(carpeta):
+        os.replace(carpeta, vieja)
+    os.replace(temporal, carpeta)
+    shutil.rmtree(vieja, ignore_errors=True)
+    return manifiesto
+
+
+def construir_paquete(ruta_proyecto):
+    # Junta todos los artefactos que existan. Devuelve el manifiesto (o None si no había nada)
+    cad = Internador()
+    # Un solo registro para todo el paquete (el guardado, o uno nuevo si todavía no hay)
+    ruta_registro = os.path.join(ruta_proyecto, next(o for _, t, o in COMPONENTES if t == 'registro'))
+    registro = _cargar_origen('registro', ruta_registro) if os.path.exists(ruta_registro) else RegistroJugadores()
+    componentes = {}
+    for nombre, tipo, origen in COMPONENTES:
+        ruta = os.path.join(ruta_proyecto, origen)
+        existe = os.path.exists(ruta)
+        if tipo == 'registro':
+            if not existe and not any(t in TIPOS_POR_ID for t, _, _ in componentes.values()):
+                continue
+            objeto = registro  # (con los jugadores que agregaron los componentes de arriba)
+        elif not existe:
+            continue
+        else:
+            objeto = _cargar_origen(tipo, ruta)
+        if tipo == 'compilado':
+            clase, arrays = objeto
+            meta = {'clase': clase}
+        else:
+            arrays, meta = EMPAQUETAR[tipo](objeto, cad, registro)
+        meta.update(origen=origen.replace(os.sep, '/'), huella_origen=huella_archivo(ruta) if existe else None)
+        componentes[nombre] = (tipo, arrays, meta)
+    if not componentes:
+        return None
+    return escribir_paquete(carpeta_paquete(ruta_proyecto), componentes, cad)
+
+
+# -------------------------------------------------------------------------
+# LEER
+# -------------------------------------------------------------------------
+class _FilasPorId:
+    # id del registro -> fila del componente, con un array (-1 = ese jugador no tiene fila)
+    def __init__(self, ids, registro):
+        self.registro = registro
+        self.ids = np.asarray(ids)
+        self._fila = np.full(max(len(registro), int(self.ids.max()) + 1 if len(self.ids) else 0), -1, dtype=np.int64)
+        self._fila[self.ids] = np.arange(len(self.ids))
+
+    def filas(self, ids):
+        # Array de ids -> array de filas (-1 si no está)
+        ids = np.asarray(ids, dtype=np.int64)
+        dentro = (ids >= 0) & (ids < len(self._fila))
+        return np.where(dentro, self._fila[np.where(dentro, ids, 0)], -1)
+
+    def fila(self, clave):
+        # Fila de un id (int) o de un nombre (str, se resuelve con el registro), o None
+        if not isinstance(clave, (int, np.integer)):
+            clave = self.registro.buscar(clave) if isinstance(clave, str) else None
+            if clave is None:
+                return None
+        fila = self.filas([clave])[0]
+        return None if fila < 0 else int(fila)
+
+
+class PerfilesPaquete(_FilasPorId, Mapping):
+    # Se usa como el dict de perfiles: perfiles[id] o perfiles[nombre] -> {'age': ..., 'ioc': ..., 'last_5': [...]}
+    # Al recorrerlo da los nombres para mostrar (los del registro), alineados con self.ids
+    def __init__(self, paquete, meta, registro):
+        self._cad = paquete.cadenas
+        self._meta = meta
+        self._col = paquete.componente('perfiles')
+        super().__init__(self._col['id'], registro)
+        self.nombres = [registro.nombre(i) for i in self.ids.tolist()]
+
+    def columna(self, campo):
+        # Array alineado con self.ids / self.nombres (mmap, sin copiar). Los de texto vienen como códigos
+        return self._col[campo]
+
+    def textos(self, campo):
+        # Columna de texto decodificada (lista alineada con self.ids)
+        return self._cad.textos(self._col[campo])
+
+    def __getitem__(self, clave):
+        i = self.fila(clave)
+        if i is None:
+            raise KeyError(clave)
+        perfil = {}
+        for campo, tipo in self._meta['numericos'].items():
+            v = self._col[campo][i]
+            perfil[campo] = int(v) if tipo == 'int' else float(v)
+        for campo in self._meta['cadenas']:
+            perfil[campo] = self._cad[self._col[campo][i]]
+        for campo, claves in self._meta['listas'].items():
+            inicios = self._col[f'{campo}.inicios']
+            filas = range(inicios[i], inicios[i + 1])
+            perfil[campo] = [{k: self._cad[self._col[f'{campo}.{k}'][f]] for k in claves} for f in filas]
+        return perfil
+
+    def __iter__(self):
+        return iter(self.nombres)
+
+    def __len__(self):
+        return len(self.nombres)
+
+    def __contains__(self, clave):
+        return self.fila(clave) is not None
+
+
+class PorJugadorPaquete(_FilasPorId, Mapping):
+    # Se usa como {jugador: valor} o {(jugador, superficie): valor}, con el id o el nombre:
+    # stats.get((id, 'Clay'), 0.5). Al recorrerlo da las claves con el nombre para mostrar
+    def __init__(self, paquete, nombre, meta, registro):
+        col = paquete.componente(nombre)
+        super().__init__(col['id'], registro)
+        self._valores = col['valores']
+        self.superficies = paquete.cadenas.textos(col['superficie']) if meta['superficie'] else None
+        self._pos_s = {s: i for i, s in enumerate(self.superficies)} if meta['superficie'] else None
+
+    def _posicion(self, clave):
+        # Las superficies se guardaron como texto (una NaN de un partido sin dato queda como 'nan')
+        if self._pos_s is None:
+            return self.fila(clave)
+        if not isinstance(clave, tuple) or len(clave) != 2:
+            return None
+        i, k = self.fila(clave[0]), self._pos_s.get(str(clave[1]))
+        return None if i is None or k is None else (i, k)
+
+    def valores_ids(self, ids, superficie=None, defecto=np.nan):
+        # Array de valores para un array de ids (en una superficie si van por superficie); `defecto` si no está
+        filas = self.filas(ids)
+        if self._pos_s is not None:
+            k = self._pos_s.get(str(superficie))
+            if k is None:
+                return np.full(len(filas), defecto, dtype=float)
+            columna = self._valores[:, k]
+        else:
+            columna = self._valores
+        v = np.where(filas >= 0, columna[np.maximum(filas, 0)] if len(columna) else np.nan, np.nan)
+        return np.where(np.isnan(v), defecto, v)
+
+    def __getitem__(self, clave):
+        pos = self._posicion(clave)
+        if pos is None or np.isnan(self._valores[pos]):
+            raise KeyError(clave)
+        return float(self._valores[pos])
+
+    def __contains__(self, clave):
+        pos = self._posicion(clave)
+        return pos is not None and not np.isnan(self._valores[pos])
+
+    def __iter__(self):
+        nombres = [self.registro.nombre(i) for i in self.ids.tolist()]
+        if self._pos_s is None:
+            return (nombres[a] for a in np.nonzero(~np.isnan(self._valores))[0].tolist())
+        i, k = np.nonzero(~np.isnan(self._valores))
+        return ((nombres[a], self.superficies[b]) for a, b in zip(i.tolist(), k.tolist()))
+
+    def __len__(self):
+        return int((~np.isnan(self._valores)).sum())
+
+
+class Paquete:
+    def __init__(self, carpeta, manifiesto, arrays=None):
+        # arrays: ya en memoria (ver en_memoria); si no, se abren de `carpeta` a medida que se piden
+        self.carpeta, self.manifiesto = carpeta, manifiesto
+        self._arrays = dict(arrays or {})
+        self._registro = None
+        self.cadenas = TablaCadenas(self.array('cadenas_bytes'), self.array('cadenas_inicios'))
+
+    def array(self, nombre):
+        if nombre not in self._arrays:
+            self._arrays[nombre] = np.load(os.path.join(self.carpeta, f'{nombre}.npy'), mmap_mode='r', allow_pickle=False)
+        return self._arrays[nombre]
+
+    def componente(self, nombre):
+        # {campo: array (mmap)} de un componente
+        prefijo = f'{nombre}__'
+        return {n[len(prefijo):]: self.array(n) for n in self.manifiesto['arrays'] if n.startswith(prefijo)}
+
+    def al_dia(self, nombre, ruta_proyecto):
+        # False si el componente no está o si su archivo de origen cambió después de armar el paquete
+        # (los que van por id, además, si el registro del paquete está al día: sus ids son de ese registro)
+        meta = self.manifiesto['componentes'].get(nombre)
+        if meta is None:
+            return False
+        if meta.get('por_id') and not self.al_dia('registro', ruta_proyecto):
+            return False
+        origen = os.path.join(ruta_proyecto, *meta['origen'].split('/'))
+        return not os.path.exists(origen) or huella_archivo(origen) == meta['huella_origen']
+
+    def registro(self):
+        # El registro del paquete (uno solo, lo comparten los componentes que van por id)
+        if self._registro is None:
+            col = self.componente('registro')
+            self._registro = RegistroJugadores(self.cadenas.textos(col['nombres']),
+                                               dict(zip(self.cadenas.textos(col['alias']), col['alias_id'].tolist())))
+        return self._registro
+
+    def objeto(self, nombre, registro=None):
+        # El componente listo para usar (mismo uso que el pickle original).
+        # registro: con el que se armaron sus ids (por defecto, el del paquete)
+        meta = self.manifiesto['componentes'][nombre]
+        if meta['tipo'] == 'perfiles':
+            return PerfilesPaquete(self, meta, registro or self.registro())
+        if meta['tipo'] == 'por_jugador':
+            return PorJugadorPaquete(self, nombre, meta, registro or self.registro())
+        col = self.componente(nombre)
+        if meta['tipo'] == 'h2h':
+            return IndiceH2H(self.cadenas.textos(col['jugadores']), col['claves'], self.cadenas.textos(col['superficies']),
+                             col['conteos'], col['inicios'], col['filas'])
+        if meta['tipo'] == 'registro':
+            return self.registro()
+        return CLASES[meta['clase']](**col)
+
+    def verificar(self):
+        # Recalcula el hash de los datos (lee todo del disco): True si coincide con el manifiesto
+        h = hashlib.sha256()
+        for nombre in sorted(self.manifiesto['arrays']):
+            h.update(nombre.encode())
+            h.update(np.asarray(self.array(nombre)).tobytes())
+        return h.hexdigest() == self.manifiesto['hash_datos']
+
+
+def en_memoria(nombre, tipo, objeto, registro):
+    # El mismo lector del paquete, armado en RAM desde el pickle suelto (por id, con `registro`,
+    # que suma los nombres que no tenía). Así la app usa siempre los mismos objetos
+    cad = Internador()
+    arrays, meta = EMPAQUETAR[tipo](objeto, cad, registro)
+    todos = dict(cad.arrays(), **{f'{nombre}__{campo}': arr for campo, arr in arrays.items()})
+    manifiesto = {'componentes': {nombre: dict(meta, tipo=tipo)}, 'arrays': {n: {} for n in todos}}
+    return Paquete(None, manifiesto, todos).objeto(nombre, registro)
+
+
+def abrir_paquete(carpeta):
+    # FileNotFoundError si no hay paquete | ValueError si es de otra versión del esquema
+    with open(os.path.join(carpeta, MANIFIESTO), encoding='utf-8') as f:
+        manifiesto = json.load(f)
+    if manifiesto.get('version_esquema') != VERSION_ESQUEMA:
+        raise ValueError(f"Paquete con versión de esquema {manifiesto.get('version_esquema')} (se esperaba {VERSION_ESQUEMA})")
+    return Paquete(carpeta, manifiesto)
+
+
+if __name__ == "__main__":
+    import joblib
+
+    from predictor_lote import RAIZ
+
+    print("📦 ARMANDO PAQUETE DE ARTEFACTOS...")
+    inicio = time.perf_counter()
+    manifiesto = construir_paquete(RAIZ)
+    if manifiesto is None:
+        print("❌ No se encontró ningún artefacto")
+        raise SystemExit(1)
+    carpeta = carpeta_paquete(RAIZ)
+    peso = sum(os.path.getsize(os.path.join(carpeta, a)) for a in os.listdir(carpeta)) / 1024 ** 2
+    print(f"   💾 {len(manifiesto['componentes'])} componentes, {len(manifiesto['arrays'])} arrays, "
+          f"{peso:.1f} MB en {time.perf_counter() - inicio:.2f} s -> '{carpeta}'")
+
+    # --- Comparación con los originales ---
+    paquete = abrir_paquete(carpeta)
+    assert paquete.verificar(), "❌ El hash de los datos no coincide"
+    for nombre, meta in paquete.manifiesto['componentes'].items():
+        ruta = os.path.join(RAIZ, *meta['origen'].split('/'))
+        inicio = time.perf_counter()
+        nuevo = paquete.objeto(nombre)
+        segundos_paquete = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        original = _cargar_origen(meta['tipo'], ruta)
+        segundos_original = time.perf_counter() - inicio
+
+        if meta['tipo'] in ('perfiles', 'por_jugador'):
+            # Las formas de escribir a un jugador que no son la del registro quedan unificadas en su id
+            registro = paquete.registro()
+            if meta['tipo'] == 'perfiles':
+                nombre_de = lambda k: k
+            else:
+                nombre_de = lambda k: k[0] if isinstance(k, tuple) else k
+            canonicas = [k for k in original if registro.nombre(registro.buscar(str(nombre_de(k)))) == str(nombre_de(k))]
+            assert all(nuevo[k] == original[k] for k in canonicas) and all(k in nuevo for k in original), \
+                f"❌ {nombre} distinto"
+            if len(canonicas) < len(original):
+                print(f"   🪪 {nombre}: {len(original) - len(canonicas)} claves con otra forma de escribir el nombre, "
+                      f"unificadas en su id")
+        elif meta['tipo'] == 'h2h':
+            assert nuevo.jugadores == original.jugadores and np.array_equal(nuevo.claves, original.claves) \
+                and np.array_equal(nuevo.conteos, original.conteos), f"❌ {nombre} distinto"
+        elif meta['tipo'] == 'registro':
+            # (el del paquete puede tener además los jugadores que agregaron perfiles y stats, al final)
+            assert nuevo.nombres[:len(original)] == original.nombres \
+                and all(nuevo.alias.get(k) == v for k, v in original.alias.items()), f"❌ {nombre} distinto"
+        else:
+            X = np.random.default_rng(0).normal(size=(500, 9))
+            viejo = CLASES[original[0]](**original[1])
+            metodo = 'transform' if original[0] == 'escalador' else 'predict_proba'
+            assert np.array_equal(getattr(nuevo, metodo)(X), getattr(viejo, metodo)(X)), f"❌ {nombre} distinto"
+        print(f"   ✅ {nombre:<17} igual al original | abrir: {segundos_paquete * 1000:6.1f} ms "
+              f"(original: {segundos_original * 1000:6.1f} ms)")
@@ -0,0 +1,191 @@
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# =============================================================================
+# ⏱️ PERFIL DE ARRANQUE (cuánto tarda un proceso nuevo en pintar la página)
+# =============================================================================
+# Cada proceso nuevo de Streamlit paga los imports y la carga de artefactos antes
+# de mostrar algo. Acá se anota, UNA vez por proceso:
+#   - cuánto tardó cada bloque de imports de la página (y cuántos módulos trajo,
+#     por paquete: así se ve si se coló sklearn o plotly donde no hacía falta)
+#   - cuánto tardó cada artefacto (lo mide Recursos, ver recursos_app.py)
+#   - el total desde que arrancó el proceso
+# y se imprime en la consola al terminar el primer pintado. La página de
+# diagnóstico lo muestra y además puede medir los imports "en frío" en un proceso
+# nuevo con `python -X importtime` (el desglose de verdad, paquete por paquete).
+#
+#   with PERFIL_ARRANQUE.importando('módulos de la app'):
+#       from recursos_app import Recursos
+#   ...
+#   PERFIL_ARRANQUE.registrar(recursos)   # imprime (solo la primera vez)
+#
+# Uso:  python perfil_arranque.py                  (imports en frío de la página del predictor)
+#       python perfil_arranque.py --limite-ms 800  (sale con error si se pasa: para no perder lo ganado)
+
+# Lo que importa la página del predictor al arrancar, en orden
+MODULOS_PAGINA = ['streamlit', 'pandas', 'perfil_arranque', 'recursos_app', 'matriz_top',
+                  'cache_predicciones', 'registro_modelos']
+# Lo que se difiere: solo se importa en el camino que lo usa
+MODULOS_DIFERIDOS = {
+    'plotly.graph_objects': 'al dibujar el radar',
+    'xgboost': 'al cargar el modelo XGBoost sin paquete (.pkl)',
+    'sklearn': 'al cargar un modelo o scaler sin paquete (.pkl)',
+    'joblib': 'al leer un pickle suelto (sin paquete al día)',
+}
+
+
+def _inicio_proceso():
+    # perf_counter() del momento en que arrancó el proceso (Linux, por /proc); None si no se puede saber
+    try:
+        with open('/proc/self/stat') as f:
+            campos = f.read().rsplit(')', 1)[1].split()
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        edad = uptime - int(campos[19]) / os.sysconf('SC_CLK_TCK')  # (campo 22: starttime, en ticks)
+        return time.perf_counter() - edad
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class PerfilArranque:
+    def __init__(self):
+        self.inicio = _inicio_proceso()
+        self.importado = time.perf_counter()  # Si no hay /proc, se cuenta desde acá
+        self.importaciones = []  # [(bloque, segundos, {paquete: módulos nuevos})]
+        self.total = None        # Segundos hasta el primer pintado
+        self.recursos = None     # El Recursos de la página (para que la de diagnóstico vea las cargas)
+        self.registrado = False
+        self._candado = threading.Lock()
+
+    @contextmanager
+    def importando(self, bloque):
+        # Mide los imports del bloque (la primera vez que trae algo: en los re-runs de Streamlit
+        # ya están en sys.modules). Los diferidos se anotan cuando llegan, aunque sea después del registro
+        antes = set(sys.modules)
+        inicio = time.perf_counter()
+        yield
+        segundos = time.perf_counter() - inicio
+        nuevos = set(sys.modules) - antes
+        with self._candado:
+            if nuevos and bloque not in (b for b, _, _ in self.importaciones):
+                por_paquete = {}
+                for modulo in nuevos:
+                    raiz = modulo.split('.')[0]
+                    por_paquete[raiz] = por_paquete.get(raiz, 0) + 1
+                self.importaciones.append((bloque, segundos, por_paquete))
+
+    def segundos_desde_inicio(self):
+        return time.perf_counter() - (self.inicio if self.inicio is not None else self.importado)
+
+    def registrar(self, recursos=None):
+        # Cierra el perfil del primer pintado y lo imprime. Devuelve False si ya estaba
+        with self._candado:
+            if self.registrado:
+                return False
+            self.registrado = True
+            self.total = self.segundos_desde_inicio()
+            self.recursos = recursos
+        desde = "desde que arrancó el proceso" if self.inicio is not None else "desde el primer import"
+        print(f"⏱️ ARRANQUE: primer pintado a {self.total:.2f} s {desde}")
+        for bloque, segundos, por_paquete in self.importaciones:
+            pesados = sorted(por_paquete.items(), key=lambda x: -x[1])[:4]
+            detalle = ', '.join(f"{p} ({n})" for p, n in pesados)
+            print(f"   📥 {bloque:<24} {segundos * 1000:8.1f} ms | {sum(por_paquete.values()):4d} módulos: {detalle}")
+        if recursos is not None:
+            diag = recursos.diagnostico()
+            for _, fila in diag[diag['Cargado']].iterrows():
+                print(f"   📦 {fila['Recurso']:<24} {fila['Segundos'] * 1000:8.1f} ms | "
+                      f"RSS +{fila['RSS MB']:6.1f} MB (estimado {fila['MB estimado']:6.1f} MB)")
+        adelantados = [m for m in MODULOS_DIFERIDOS if m in sys.modules]
+        if adelantados:
+            print(f"   ⚠️ Ya importados (se esperaban diferidos): {', '.join(adelantados)}")
+        return True
+
+    def importaciones_tabla(self):
+        # [{Bloque, ms, Módulos, Paquetes}] para la página de diagnóstico
+        return [{'Bloque': bloque, 'ms': segundos * 1000, 'Módulos': sum(por_paquete.values()),
+                 'Paquetes': ', '.join(f"{p} ({n})" for p, n in sorted(por_paquete.items(), key=lambda x: -x[1]))}
+                for bloque, segundos, por_paquete in self.importaciones]
+
+
+# El del proceso (lo comparten todas las páginas)
+PERFIL_ARRANQUE = PerfilArranque()
+
+
+# -------------------------------------------------------------------------
+# IMPORTS EN FRÍO (proceso nuevo con -X importtime)
+# -------------------------------------------------------------------------
+_LINEA_IMPORTTIME = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$')
+
+
+def medir_importaciones(modulos=MODULOS_PAGINA, carpeta=None):
+    # Importa `modulos` en orden en un proceso nuevo -> (por_modulo, por_paquete)
+    #   por_modulo:  [{Módulo, ms}] lo que costó cada uno (lo compartido se lo lleva el primero que lo importa)
+    #                ms = None si no está instalado
+    #   por_paquete: {paquete raíz: ms propios} sumando todos sus submódulos
+    carpeta = carpeta or os.path.dirname(os.path.abspath(__file__))
+    # (__import__ y no importlib.import_module: ese no pasa por el import de C y -X importtime no lo anota)
+    codigo = (f"for m in {list(modulos)!r}:\n"
+              "    try:\n"
+              "        __import__(m)\n"
+              "    except ImportError:\n"
+              "        print('FALTA', m)\n")
+    salida = subprocess.run([sys.executable, '-X', 'importtime', '-c', codigo], capture_output=True, text=True,
+                            cwd=carpeta, check=True)
+    faltan = {linea.split()[1] for linea in salida.stdout.splitlines() if linea.startswith('FALTA ')}
+
+    acumulado, por_paquete = {}, {}
+    for linea in salida.stderr.splitlines():
+        m = _LINEA_IMPORTTIME.match(linea)
+        if m is None:
+            continue
+        propio, total, sangria, nombre = int(m[1]), int(m[2]), m[3], m[4]
+        raiz = nombre.split('.')[0]
+        por_paquete[raiz] = por_paquete.get(raiz, 0) + propio / 1000
+        if not sangria:  # Primer nivel: lo que pidió el import de arriba
+            acumulado[nombre] = acumulado.get(nombre, 0) + total / 1000
+
+    por_modulo = []
+    for modulo in modulos:
+        if modulo in faltan:
+            por_modulo.append({'Módulo': modulo, 'ms': None})
+            continue
+        # 'plotly.graph_objects' aparece como plotly, plotly.graph_objects... (todos los que no estaban)
+        partes = modulo.split('.')
+        ms = sum(acumulado.pop('.'.join(partes[:k]), 0) for k in range(1, len(partes) + 1))
+        por_modulo.append({'Módulo': modulo, 'ms': ms})
+    return por_modulo, dict(sorted(por_paquete.items(), key=lambda x: -x[1]))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Imports en frío de la página del predictor")
+    parser.add_argument('--limite-ms', type=float, default=None, help="Falla si los imports de la página se pasan")
+    parser.add_argument('--paquetes', type=int, default=10, help="Cuántos paquetes mostrar en el desglose")
+    args = parser.parse_args()
+
+    por_modulo, por_paquete = medir_importaciones(MODULOS_PAGINA)
+    total = sum(f['ms'] or 0 for f in por_modulo)
+    print(f"⏱️ IMPORTS DE LA PÁGINA EN FRÍO: {total:.0f} ms")
+    for fila in por_modulo:
+        print(f"   {fila['Módulo']:<22} " + ("no instalado" if fila['ms'] is None else f"{fila['ms']:8.1f} ms"))
+    print("   --- por paquete (tiempo propio) ---")
+    for paquete, ms in list(por_paquete.items())[:args.paquetes]:
+        print(f"   {paquete:<22} {ms:8.1f} ms")
+
+    # Los diferidos: lo que se paga recién cuando se usan (cada uno en su proceso, sin la página)
+    print("   --- diferidos (solo cuando se usan) ---")
+    for modulo, cuando in MODULOS_DIFERIDOS.items():
+        (fila,), _ = medir_importaciones([modulo])
+        costo = "no instalado" if fila['ms'] is None else f"{fila['ms']:8.1f} ms"
+        print(f"   {modulo:<22} {costo:>12} | {cuando}")
+
+    if args.limite_ms is not None and total > args.limite_ms:
+        print(f"❌ Los imports de la página ({total:.0f} ms) pasan el límite de {args.limite_ms:.0f} ms")
+        raise SystemExit(1)
@@ -1,118 +1,41 @@
+import argparse
+import time
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split, RandomizedSearchCV
+from sklearn.model_selection import GroupKFold, train_test_split, RandomizedSearchCV
 from sklearn.metrics import accuracy_score
 from sklearn.preprocessing import StandardScaler
 import joblib
 import xgboost as xgb
 from scipy.stats import randint, uniform
 
+from almacen_features import cargar_features
+from tuning_xgb import busqueda_halving, modelo_final, score_validacion
+
+parser = argparse.ArgumentParser(description="Optimización del modelo XGBoost con Elo")
+parser.add_argument('--tuning', choices=['halving', 'randomized', 'comparar'], default='halving',
+                    help="halving: successive halving + early stopping (rápido) | randomized: búsqueda vieja | "
+                         "comparar: corre las dos y muestra el tiempo ahorrado")
+args = parser.parse_args()
+
 print("🚀 INICIANDO OPTIMIZACIÓN AVANZADA DEL MODELO...")
 
-# 1. CARGAR DATOS
-df = pd.read_csv('historial_tenis_COMPLETO.csv')
-df = df[df['tourney_date'] > 0].copy()
-df['tourney_date'] = pd.to_numeric(df['tourney_date'], errors='coerce')
-df = df.sort_values(['tourney_date', 'match_num'])
+# 1. CARGAR DATOS (Elo, Fatiga y H2H salen del almacén de variables)
+df, _ = cargar_features('historial_tenis_COMPLETO.csv')
 
 # =============================================================================
 # 🧠 1. ELO RATING (Mantener lo que funciona)
 # =============================================================================
-print("   -> Recalculando Elo Rating...")
-
-def calcular_elo(df_matches):
-    elo_dict = {}
-    elo_surf_dict = {}
-    w_elo, l_elo = [], []
-    w_elo_surf, l_elo_surf = [], []
-    
-    STARTING_ELO = 1500
-    
-    for idx, row in df_matches.iterrows():
-        w, l, surf = row['winner_name'], row['loser_name'], row['surface']
-        
-        # Get Elo
-        we = elo_dict.get(w, STARTING_ELO)
-        le = elo_dict.get(l, STARTING_ELO)
-        wes = elo_surf_dict.get((w, surf), STARTING_ELO)
-        les = elo_surf_dict.get((l, surf), STARTING_ELO)
-        
-        w_elo.append(we); l_elo.append(le)
-        w_elo_surf.append(wes); l_elo_surf.append(les)
-        
-        # Calc Prob
-        pw = 1 / (1 + 10 ** ((le - we) / 400))
-        pws = 1 / (1 + 10 ** ((les - wes) / 400))
-        
-        # Update
-        k = 32
-        if 'Grand Slam' in str(row['tourney_level']): k = 50
-        elif 'Masters' in str(row['tourney_level']): k = 40
-        
-        delta = k * (1 - pw)
-        delta_s = k * (1 - pws)
-        
-        elo_dict[w] = we + delta
-        elo_dict[l] = le - delta
-        elo_surf_dict[(w, surf)] = wes + delta_s
-        elo_surf_dict[(l, surf)] = les - delta_s
-        
-    return w_elo, l_elo, w_elo_surf, l_elo_surf, elo_dict, elo_surf_dict
-
-we, le, wes, les, dict_elo, dict_surf = calcular_elo(df)
-df['w_elo'] = we; df['l_elo'] = le
-df['w_elo_surf'] = wes; df['l_elo_surf'] = les
-
-# Guardar diccionarios para la App
-joblib.dump(dict_elo, 'elo_rating.pkl')
-joblib.dump(dict_surf, 'elo_rating_surface.pkl')
-
-# =============================================================================
-# 🔋 2. RECUPERAR FATIGA Y PUNTOS DE RANKING
-# =============================================================================
-print("   -> Calculando Fatiga y H2H...")
-
-fatiga = {}
-h2h = {}
-w_fat, l_fat = [], []
-w_h2h, l_h2h = [], []
-
-for idx, row in df.iterrows():
-    tid, w, l, mins = row['tourney_id'], row['winner_name'], row['loser_name'], row['minutes']
-    mins = 100 if pd.isna(mins) or mins == 0 else mins # Relleno inteligente
-    
-    # Fatiga
-    fw = fatiga.get((tid, w), 0)
-    fl = fatiga.get((tid, l), 0)
-    w_fat.append(fw); l_fat.append(fl)
-    fatiga[(tid, w)] = fw + mins
-    fatiga[(tid, l)] = fl + mins
-    
-    # H2H
-    p1, p2 = sorted([w, l])
-    rec = h2h.get((p1, p2), 0)
-    if w == p1:
-        w_h2h.append(rec); l_h2h.append(-rec)
-        h2h[(p1, p2)] = rec + 1
-    else:
-        w_h2h.append(-rec); l_h2h.append(rec)
-        h2h[(p1, p2)] = rec - 1
-
-df['w_fat'] = w_fat; df['l_fat'] = l_fat
-df['w_h2h'] = w_h2h; df['l_h2h'] = l_h2h
+# Las columnas w_elo / l_elo / w_elo_surf / l_elo_surf ya vienen calculadas.
+# El Elo "en vivo" (estado_elo.pkl, reemplaza a elo_rating.pkl / elo_rating_surface.pkl) NO se
+# escribe acá: lo lleva 'python motor_elo.py update' sobre scraping/historialTenis.csv (paso del
+# pipeline), siempre con ese mismo historial para que la actualización sea incremental.
 
 # =============================================================================
 # ⚙️ 3. PREPARAR DATASET
 # =============================================================================
 
-# Diferencias
-df['diff_elo'] = df['w_elo'] - df['l_elo']
-df['diff_elo_surf'] = df['w_elo_surf'] - df['l_elo_surf']
-df['diff_rank_pts'] = df['winner_rank_points'] - df['loser_rank_points'] # IMPORTANTE
-df['diff_h2h'] = df['w_h2h'] - df['l_h2h']
-df['diff_fatigue'] = df['w_fat'] - df['l_fat']
-df['diff_age'] = df['winner_age'] - df['loser_age']
-
+# Diferencias (ya calculadas en el almacén)
 features = ['diff_elo', 'diff_elo_surf', 'diff_rank_pts', 'diff_h2h', 'diff_fatigue', 'diff_age']
 
 # Filtro moderno (2012+) para evitar ruido antiguo
@@ -125,6 +48,8 @@ X_final = pd.concat([X, -X])
 y_final = np.concatenate([y, np.zeros(len(X))])
 
 X_train, X_test, y_train, y_test = train_test_split(X_final, y_final, test_size=0.2, random_state=42)
+# El índice se repite en las dos filas de cada partido (X y -X): con él como grupo no se separan
+grupos_train = X_train.index.to_numpy()
 
 # =============================================================================
 # 🎛️ 4. TUNING DE HIPERPARÁMETROS (LA CLAVE)
@@ -141,24 +66,70 @@ param_dist = {
     'gamma': uniform(0, 0.5)                 # Reducción mínima de pérdida
 }
 
-xgb_model = xgb.XGBClassifier(eval_metric='logloss', use_label_encoder=False)
-
-# RandomizedSearchCV probará 10 combinaciones aleatorias
-random_search = RandomizedSearchCV(
-    xgb_model, 
-    param_distributions=param_dist, 
-    n_iter=10, 
-    cv=3, 
-    scoring='accuracy', 
-    verbose=1, 
-    n_jobs=-1, # Usar todos los núcleos del CPU
-    random_state=42
-)
-
-random_search.fit(X_train, y_train)
-
-best_model = random_search.best_estimator_
-print(f"\n✨ Mejor configuración encontrada: {random_search.best_params_}")
+def busqueda_randomizada():
+    xgb_model = xgb.XGBClassifier(eval_metric='logloss', use_label_encoder=False)
+
+    # RandomizedSearchCV probará 10 combinaciones aleatorias
+    random_search = RandomizedSearchCV(
+        xgb_model, 
+        param_distributions=param_dist, 
+        n_iter=10, 
+        cv=GroupKFold(n_splits=3), # Por partido: X y -X del mismo partido caen en el mismo fold
+        scoring='accuracy', 
+        verbose=1, 
+        n_jobs=-1, # Usar todos los núcleos del CPU
+        random_state=42
+    )
+
+    random_search.fit(X_train, y_train, groups=grupos_train)
+    return random_search.best_estimator_, random_search.best_params_, random_search.best_score_
+
+
+def busqueda_rapida():
+    # Successive halving sobre n_estimators + early stopping + 'hist' (ver tuning_xgb.py)
+    resultado = busqueda_halving(X_train, y_train, param_dist, grupos=grupos_train)
+    params = dict(resultado['best_params'], n_estimators=resultado['n_estimators'])
+    return modelo_final(X_train, y_train, resultado), params, resultado['best_score']
+
+
+busquedas = {'halving': busqueda_rapida, 'randomized': busqueda_randomizada}
+elegidas = list(busquedas) if args.tuning == 'comparar' else [args.tuning]
+
+resultados_busqueda = {}
+for nombre in elegidas:
+    print(f"\n   -> Búsqueda '{nombre}'...")
+    inicio = time.perf_counter()
+    modelo, params, score = busquedas[nombre]()
+    segundos = time.perf_counter() - inicio
+    acc_test = accuracy_score(y_test, modelo.predict(X_test))
+    resultados_busqueda[nombre] = (modelo, params, score, segundos, acc_test)
+    print(f"      ⏱️ {segundos:.1f} s | mejor score de la búsqueda: {score:.4f} | test: {acc_test:.2%}")
+
+if args.tuning == 'comparar':
+    modelo_h, _, _, t_h, acc_h = resultados_busqueda['halving']
+    modelo_r, _, _, t_r, acc_r = resultados_busqueda['randomized']
+    print("\n" + "=" * 60)
+    print(f"   RandomizedSearchCV: {t_r:8.1f} s | test {acc_r:.2%}")
+    print(f"   Halving + early stop: {t_h:6.1f} s | test {acc_h:.2%}")
+    print(f"   🚀 Tiempo ahorrado: {t_r - t_h:.1f} s ({t_r / t_h:.1f}x más rápido)")
+    # El score de cada búsqueda sale de cortes distintos (holdout vs CV de 3 folds): no se comparan.
+    # Las dos configuraciones ganadoras se reentrenan y se miden en el MISMO fold de validación
+    # agrupado por partido (dentro del train). El test solo se informa: si decidiera, la
+    # "PRECISIÓN MEJORADA" de abajo estaría medida sobre lo mismo que eligió
+    score_h = score_validacion(modelo_h, X_train, y_train, grupos_train)
+    score_r = score_validacion(modelo_r, X_train, y_train, grupos_train)
+    print(f"   Validación compartida: halving {score_h:.4f} | randomized {score_r:.4f}")
+    if score_h >= score_r:
+        print("   ✅ Halving igual o mejor en la misma validación")
+    else:
+        print(f"   ⚠️ Halving queda {score_r - score_h:.4f} abajo en la misma validación: nos quedamos con la vieja")
+    print("=" * 60)
+    ganadora = 'halving' if score_h >= score_r else 'randomized'
+else:
+    ganadora = args.tuning
+
+best_model, best_params, _, _, _ = resultados_busqueda[ganadora]
+print(f"\n✨ Mejor configuración encontrada: {best_params}")
 
 # =============================================================================
 # 🏆 5. EVALUACIÓN FINAL
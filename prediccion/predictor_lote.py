@@ -0,0 +1,224 @@
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from paquete_artefactos import en_memoria
+from recursos_app import Recursos
+from registro_jugadores import RegistroJugadores
+
+# =============================================================================
+# 📦 PREDICCIÓN EN LOTE: MUCHOS PARTIDOS EN UNA SOLA LLAMADA AL MODELO
+# =============================================================================
+# La página arma un DataFrame de UNA fila por clic. Acá los datos de cada
+# jugador (ranking, puntos, edad, altura, momentum, país) quedan en arrays
+# alineados UNA vez; para N partidos se buscan las posiciones de los dos
+# jugadores, las diferencias salen restando arrays y el modelo se llama una
+# sola vez con la matriz entera.
+# Las posiciones salen del id del registro de jugadores (array id -> fila): los
+# nombres se resuelven a id una vez por nombre distinto, y con ids no se toca ninguno.
+#
+#   predictor = PredictorLote.desde_recursos(ruta_proyecto, modelo='xgboost')
+#   probs = predictor.predict_many([("Carlos Alcaraz", "Jannik Sinner"), ...], "Clay", "ESP")
+#   probs = predictor.predict_many([(id_1, id_2), ...], "Clay", "ESP")   # ids del registro
+#
+# probs[k] = probabilidad de que gane el PRIMER jugador del par k (NaN si alguno no tiene perfil).
+# Mismas features que la página: skill por superficie, localía contra el país sede y H2H total.
+#
+# Uso:  python predictor_lote.py ../scraping/atp_matches_2026_full.csv
+#       python predictor_lote.py cuadro.csv --columnas jugador_1 jugador_2 --superficie Clay --pais FRA
+
+FEATURES = ['diff_rank', 'diff_rank_points', 'diff_age', 'diff_ht', 'diff_skill',
+            'diff_home', 'diff_fatigue', 'diff_momentum', 'diff_h2h']
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class PredictorLote:
+    def __init__(self, modelo, scaler, stats_dict, perfiles, ranking_2026_dict=None, indice_h2h=None, registro=None):
+        # perfiles / stats_dict: los lectores por id de recursos_app (un dict {nombre: ...} se pasa a ese formato)
+        self.modelo, self.scaler = modelo, scaler
+        if registro is None:
+            registro = getattr(perfiles, 'registro', None)
+        self.registro = registro if registro is not None else RegistroJugadores()
+        if isinstance(perfiles, dict):
+            perfiles = en_memoria('perfiles', 'perfiles', perfiles, self.registro)
+        if isinstance(stats_dict, dict):
+            stats_dict = en_memoria('stats_superficie', 'por_jugador', stats_dict, self.registro)
+        self.stats_dict = stats_dict
+        self.indice_h2h = indice_h2h
+        self.perfiles = perfiles
+        self.ranking = ranking = ranking_2026_dict or {}
+
+        # Un array por dato, alineado con self.ids / self.nombres (mismo criterio que la página)
+        self.ids = np.asarray(perfiles.ids, dtype=np.int64)
+        self.nombres = list(perfiles.nombres)
+        columna = lambda campo: np.array(perfiles.columna(campo), dtype=float)
+        self.rank = np.array([ranking.get(n, r) for n, r in zip(self.nombres, columna('rank'))], dtype=float)
+        self.puntos, self.edad = columna('points'), columna('age')
+        self.altura, self.momentum = columna('ht'), columna('momentum')
+        self.pais = np.array(perfiles.textos('ioc'), dtype=object)
+
+        # Los ids de las otras estructuras, por fila (una vez): las skills comparten el registro
+        # (si vinieran de otro, se pasa por el nombre) y el índice H2H tiene sus propios ids
+        mismo = getattr(stats_dict, 'registro', None) is self.registro
+        self._ids_stats = self.ids if mismo else stats_dict.registro.ids(self.nombres)
+        self._ids_h2h = indice_h2h.ids(self.nombres) if indice_h2h is not None else None
+        self._skill = {}  # {superficie: array} (se arma la primera vez que se pide)
+
+    @classmethod
+    def desde_recursos(cls, ruta_proyecto=RAIZ, modelo='xgboost'):
+        # modelo: 'xgboost' o 'logistica' (los dos que guarda el entrenamiento para la app). Solo carga ese.
+        rec = Recursos(ruta_proyecto)
+        return cls(rec.modelo(modelo), rec.obtener('scaler'), rec.obtener('stats_superficie'), rec.obtener('perfiles'),
+                   rec.obtener('ranking_2026'), rec.obtener('indice_h2h'), rec.obtener('registro'))
+
+    def skill(self, superficie):
+        if superficie not in self._skill:
+            self._skill[superficie] = self.stats_dict.valores_ids(self._ids_stats, superficie, 0.5)
+        return self._skill[superficie]
+
+    def posiciones(self, jugadores):
+        # Posición de cada jugador en los arrays (-1 si no tiene perfil). Con ids del registro es
+        # indexar un array; los nombres pasan antes por el registro (una vez por nombre distinto)
+        jugadores = np.asarray(jugadores)
+        ids = jugadores if jugadores.dtype.kind in 'iu' else self.registro.ids(jugadores)
+        return self.perfiles.filas(ids)
+
+    # -------------------------------------------------------------------------
+    # FEATURES Y PREDICCIÓN
+    # -------------------------------------------------------------------------
+    def armar_features(self, pairs, surface, country='NEUTRAL', fatiga=None):
+        # Devuelve (DataFrame con FEATURES de los pares válidos, máscara de válidos sobre los N pares)
+        # pairs: pares de nombres o de ids del registro
+        # fatiga: array (N, 2) con los minutos de cada jugador (por defecto 0, como la página)
+        p1 = [a for a, _ in pairs]
+        p2 = [b for _, b in pairs]
+        i, j = self.posiciones(p1), self.posiciones(p2)
+        validos = (i >= 0) & (j >= 0)
+        i, j = i[validos], j[validos]
+
+        fat = np.zeros((len(validos), 2)) if fatiga is None else np.asarray(fatiga, dtype=float)
+        fat = fat[validos]
+        skill = self.skill(surface)
+        local = self.pais == country
+        if self.indice_h2h is not None:
+            wins1, wins2 = self.indice_h2h.victorias_ids(self._ids_h2h[i], self._ids_h2h[j])
+        else:
+            wins1 = wins2 = np.zeros(len(i))
+
+        X = pd.DataFrame({
+            'diff_rank': self.rank[j] - self.rank[i],  # Ranking P2 - Ranking P1 (positivo si P1 está mejor)
+            'diff_rank_points': self.puntos[i] - self.puntos[j],
+            'diff_age': self.edad[i] - self.edad[j],
+            'diff_ht': self.altura[i] - self.altura[j],
+            'diff_skill': skill[i] - skill[j],
+            'diff_home': local[i].astype(float) - local[j].astype(float),
+            'diff_fatigue': fat[:, 0] - fat[:, 1],
+            'diff_momentum': self.momentum[i] - self.momentum[j],
+            'diff_h2h': (wins1 - wins2).astype(float),
+        }, columns=FEATURES)
+        return X, validos
+
+    def predict_many(self, pairs, surface, country='NEUTRAL', fatiga=None):
+        X, validos = self.armar_features(pairs, surface, country, fatiga)
+        probs = np.full(len(validos), np.nan)
+        if len(X):
+            probs[validos] = self.modelo.predict_proba(self.scaler.transform(X))[:, 1]
+        return probs
+
+
+# =============================================================================
+# 🖥️ LÍNEA DE COMANDOS: PUNTUAR UN CSV DE PARTIDOS
+# =============================================================================
+def puntuar_csv(predictor, df, col1, col2, superficie=None, pais='NEUTRAL'):
+    # Si el CSV tiene columna 'surface' se usa la de cada fila; si no, la que se pasó
+    probs = np.full(len(df), np.nan)
+    superficies = df['surface'].fillna(superficie or 'Hard') if 'surface' in df.columns and superficie is None \
+        else pd.Series(superficie or 'Hard', index=df.index)
+    for sup, filas in superficies.groupby(superficies).groups.items():
+        posiciones = df.index.get_indexer(filas)
+        pares = list(zip(df[col1].to_numpy()[posiciones], df[col2].to_numpy()[posiciones]))
+        probs[posiciones] = predictor.predict_many(pares, sup, pais)
+    return probs
+
+
+def fila_pagina(predictor, p1, p2, superficie, pais):
+    # El DataFrame de una fila que arma la página al tocar "Predecir" (con los valores por defecto del perfil)
+    d1, d2 = predictor.perfiles[p1], predictor.perfiles[p2]
+    r1, r2 = predictor.ranking.get(p1, d1['rank']), predictor.ranking.get(p2, d2['rank'])
+    wins_p1, wins_p2 = predictor.indice_h2h.victorias(p1, p2) if predictor.indice_h2h is not None else (0, 0)
+    return pd.DataFrame([{
+        'diff_rank': r2 - r1,
+        'diff_rank_points': d1.get('points', 0) - d2.get('points', 0),
+        'diff_age': d1['age'] - d2['age'],
+        'diff_ht': d1['ht'] - d2['ht'],
+        'diff_skill': predictor.stats_dict.get((p1, superficie), 0.5) - predictor.stats_dict.get((p2, superficie), 0.5),
+        'diff_home': int(d1['ioc'] == pais) - int(d2['ioc'] == pais),
+        'diff_fatigue': 0,
+        'diff_momentum': d1['momentum'] - d2['momentum'],
+        'diff_h2h': wins_p1 - wins_p2,
+    }])
+
+
+def _verificar(predictor, df, col1, col2, superficie, pais, probs, cantidad=100):
+    # Chequeo contra el camino de la página: un DataFrame de una fila por partido
+    revisados = 0
+    for k in range(min(cantidad, len(df))):
+        p1, p2 = df[col1].iat[k], df[col2].iat[k]
+        if p1 not in predictor.perfiles or p2 not in predictor.perfiles:
+            continue
+        sup = df['surface'].iat[k] if 'surface' in df.columns and superficie is None else (superficie or 'Hard')
+        una = predictor.modelo.predict_proba(predictor.scaler.transform(fila_pagina(predictor, p1, p2, sup, pais)))[0][1]
+        assert abs(una - probs[k]) < 1e-6, f"❌ Fila {k}: {una} (de a una) vs {probs[k]} (en lote)"
+        revisados += 1
+    print(f"✅ Coincide con la predicción de a una fila ({revisados} partidos)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Predice todos los partidos de un CSV en una sola llamada")
+    parser.add_argument('csv')
+    parser.add_argument('--columnas', nargs=2, default=None, metavar=('JUGADOR_1', 'JUGADOR_2'),
+                        help="Por defecto winner_name/loser_name o jugador_1/jugador_2")
+    parser.add_argument('--superficie', default=None, help="Si no se pasa, se usa la columna 'surface' del CSV")
+    parser.add_argument('--pais', default='NEUTRAL', help="País sede (para la localía)")
+    parser.add_argument('--modelo', default='xgboost', choices=['xgboost', 'logistica'])
+    parser.add_argument('--repeticiones', type=int, default=3, help="Se informa la más rápida")
+    parser.add_argument('--salida', default=None, help="CSV con la columna prob_jugador_1 agregada")
+    parser.add_argument('--verificar', action='store_true', help="Compara contra la predicción de a una fila")
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.csv, low_memory=False)
+    if args.columnas:
+        col1, col2 = args.columnas
+    elif {'winner_name', 'loser_name'} <= set(df.columns):
+        col1, col2 = 'winner_name', 'loser_name'
+    else:
+        col1, col2 = 'jugador_1', 'jugador_2'
+
+    print(f"📦 PREDICCIÓN EN LOTE: {len(df):,} partidos ({col1} vs {col2})")
+    inicio = time.perf_counter()
+    predictor = PredictorLote.desde_recursos(RAIZ, args.modelo)
+    print(f"   -> Recursos cargados en {time.perf_counter() - inicio:.2f} s")
+
+    tiempos = []
+    for _ in range(max(args.repeticiones, 1)):
+        inicio = time.perf_counter()
+        probs = puntuar_csv(predictor, df, col1, col2, args.superficie, args.pais)
+        tiempos.append(time.perf_counter() - inicio)
+    mejor = min(tiempos)
+
+    conocidos = ~np.isnan(probs)
+    print(f"⏱️ {len(df):,} partidos en {mejor * 1000:.1f} ms -> {len(df) / mejor:,.0f} partidos/s")
+    if (~conocidos).any():
+        print(f"⚠️ {(~conocidos).sum()} partidos con algún jugador sin perfil (quedan en NaN)")
+    if col1 == 'winner_name' and conocidos.any():
+        print(f"🎯 Acierto sobre los resultados reales: {(probs[conocidos] > 0.5).mean():.2%}")
+
+    if args.verificar:
+        _verificar(predictor, df, col1, col2, args.superficie, args.pais, probs)
+
+    if args.salida:
+        df.assign(prob_jugador_1=probs).to_csv(args.salida, index=False)
+        print(f"💾 Guardado en '{args.salida}'")
@@ -0,0 +1,216 @@
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from almacen_partidos import cargar_historial
+from indice_h2h import IndiceH2H, cargar_indice
+from inferencia_numpy import cargar_modelo
+from paquete_artefactos import abrir_paquete, carpeta_paquete, en_memoria
+from registro_jugadores import RegistroJugadores, cargar_registro
+
+# =============================================================================
+# 📦 RECURSOS DEL PREDICTOR EN VIVO (carga perezosa, uno por uno)
+# =============================================================================
+# Antes se cargaba TODO al arrancar: los dos modelos, el historial completo, etc.
+# Ahora cada recurso se carga la primera vez que alguien lo pide y queda guardado:
+#   - el modelo que eligió el radio de la barra lateral (el otro, solo si se cambia)
+#   - el historial, solo si hace falta (armar el índice H2H cuando no está guardado)
+# De cada uno se anota cuánto tardó y cuánta memoria sumó, para el panel de
+# diagnóstico de la página:
+#   - 'RSS MB': cuánto creció la memoria residente del proceso durante la carga (medido)
+#   - 'MB estimado': lo que ocupa el objeto recorriéndolo (sin contar los mmap del paquete)
+#
+#   recursos = Recursos(ruta_proyecto)          # no carga nada
+#   recursos.obtener('perfiles')                # carga (una vez) y devuelve
+#   recursos.diagnostico()                      # DataFrame: recurso, cargado, segundos, RSS MB, MB estimado
+#
+# ruta_proyecto: la raíz del repo (la que tiene /prediccion y /scraping).
+# La página guarda UN Recursos en @st.cache_resource; cargar_recursos() carga todo de una.
+#
+# Si existe el paquete de artefactos (prediccion/paquete/, ver paquete_artefactos.py)
+# modelos, skills, perfiles e índice H2H salen de ahí (mmap, sin pickles). Cada uno
+# vuelve a su archivo suelto si no está en el paquete o si el archivo cambió después.
+# Perfiles y skills quedan SIEMPRE por id del registro ('registro'): los pickles sueltos
+# se pasan en memoria al mismo formato del paquete, con el mismo registro.
+
+
+# Lo que la app usa del historial: el índice H2H (si no está guardado) y los partidos de un cruce
+COLUMNAS_HISTORIAL = ['tourney_date', 'tourney_name', 'round', 'surface', 'winner_name', 'loser_name', 'score']
+
+
+def _cargar_pkl(ruta):
+    import joblib  # Solo hace falta sin paquete al día (~30 ms menos al arrancar)
+    return joblib.load(ruta)
+
+
+def _paquete(rec):
+    try:
+        return abrir_paquete(carpeta_paquete(rec.ruta_proyecto))
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _del_paquete(componente, cargar_suelto):
+    # Cargador que prueba primero el paquete y si no, el archivo suelto
+    def cargar(rec):
+        paquete = rec.obtener('paquete')
+        if paquete is not None and paquete.al_dia(componente, rec.ruta_proyecto):
+            return paquete.objeto(componente)
+        return cargar_suelto(rec)
+    return cargar
+
+
+def _historial(rec):
+    # Del almacén columnar si está al día (ver almacen_partidos.py)
+    try:
+        return cargar_historial(rec.ruta_scrap("historialTenis.csv"), COLUMNAS_HISTORIAL)
+    except:
+        return pd.DataFrame()
+
+
+def _indice_h2h_suelto(rec):
+    # ⚔️ Lo deja listo generar_perfiles.py; si falta o es viejo, se arma acá (esto sí necesita el historial)
+    try:
+        return cargar_indice(rec.ruta_scrap('indice_h2h.pkl'))
+    except (FileNotFoundError, ValueError):
+        df_history = rec.obtener('historial')
+        return IndiceH2H.construir(df_history, rec.obtener('registro')) if not df_history.empty else None
+
+
+def _registro_suelto(rec):
+    # 🪪 Lo deja listo generar_perfiles.py (sin registro, uno vacío: se llena con los nombres que se carguen)
+    try:
+        return cargar_registro(rec.ruta_scrap('registro_jugadores.pkl'))
+    except (FileNotFoundError, ValueError):
+        return RegistroJugadores()
+
+
+def _por_id(componente, tipo, ruta):
+    # Pickle suelto {nombre: ...} -> el mismo lector por id que sale del paquete
+    def cargar(rec):
+        return en_memoria(componente, tipo, _cargar_pkl(ruta(rec)), rec.obtener('registro'))
+    return cargar
+
+
+def _ranking_2026(rec):
+    try:
+        df_rank_26 = pd.read_csv(rec.ruta_scrap("ranking_2026.csv"))
+        # (Asegúrate de que 'player_slug' exista en tu CSV de ranking,
+        # o cámbialo por 'player' / 'Nombre Completo' según como lo hayas dejado en tu scraper)
+        return dict(zip(df_rank_26['player_slug'], df_rank_26['rank']))
+    except:
+        return {}
+
+
+# {nombre: función(recursos) -> objeto}. Modelos y pickles: si falta el archivo -> FileNotFoundError
+CARGADORES = {
+    'paquete': _paquete,
+    # 🧠 MODELOS ESTÁTICOS (/prediccion). Versión NumPy si está al día (ver inferencia_numpy.py)
+    'modelo_xgboost': _del_paquete('modelo_xgboost', lambda rec: cargar_modelo(rec.ruta_pred('modelo_xgboost_final.pkl'))),
+    'modelo_logistica': _del_paquete('modelo_logistica', lambda rec: cargar_modelo(rec.ruta_pred('modelo_logistico_final.pkl'))),
+    'scaler': _del_paquete('scaler', lambda rec: cargar_modelo(rec.ruta_pred('scaler_final.pkl'))),
+    'stats_superficie': _del_paquete('stats_superficie', _por_id('stats_superficie', 'por_jugador',
+                                                                  lambda rec: rec.ruta_pred('stats_superficie_v2.pkl'))),
+    # 📊 PERFILES, HISTORIAL Y RANKING (/scraping)
+    'perfiles': _del_paquete('perfiles', _por_id('perfiles', 'perfiles', lambda rec: rec.ruta_scrap('perfiles_jugadores.pkl'))),
+    'historial': _historial,
+    'indice_h2h': _del_paquete('indice_h2h', _indice_h2h_suelto),
+    'ranking_2026': _ranking_2026,
+    'registro': _del_paquete('registro', _registro_suelto),
+}
+MODELOS = {'xgboost': 'modelo_xgboost', 'logistica': 'modelo_logistica'}
+
+
+def rss_mb():
+    # Memoria residente ACTUAL del proceso (no el pico: ru_maxrss no baja y no sirve para restar)
+    try:
+        with open('/proc/self/statm') as f:  # Linux: tamaño y residentes, en páginas
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 1024 ** 2
+    except ImportError:
+        return np.nan
+
+
+def tamanio_bytes(objeto, vistos=None):
+    # Tamaño aproximado en memoria, recorriendo contenedores (arrays y DataFrames por sus datos)
+    vistos = set() if vistos is None else vistos
+    if id(objeto) in vistos:
+        return 0
+    vistos.add(id(objeto))
+    if isinstance(objeto, pd.DataFrame):
+        return int(objeto.memory_usage(deep=True).sum())
+    if isinstance(objeto, np.memmap):
+        return 0  # Arrays del paquete: están en disco (el sistema los trae a RAM por páginas)
+    if isinstance(objeto, np.ndarray):
+        return objeto.nbytes
+    total = sys.getsizeof(objeto)
+    if isinstance(objeto, dict):
+        total += sum(tamanio_bytes(k, vistos) + tamanio_bytes(v, vistos) for k, v in objeto.items())
+    elif isinstance(objeto, (list, tuple, set, frozenset)):
+        total += sum(tamanio_bytes(x, vistos) for x in objeto)
+    elif hasattr(objeto, '__dict__'):
+        total += tamanio_bytes(vars(objeto), vistos)
+    return total
+
+
+class Recursos:
+    def __init__(self, ruta_proyecto):
+        self.ruta_proyecto = ruta_proyecto
+        self.ruta_prediccion = os.path.join(ruta_proyecto, "prediccion")
+        self.ruta_scraping = os.path.join(ruta_proyecto, "scraping")
+        self._cargados = {}
+        self._medidas = {}   # {nombre: (segundos, MB de RSS, bytes estimados)}
+        self._candado = threading.RLock()  # Streamlit atiende cada sesión en su propio hilo
+
+    def ruta_pred(self, archivo):
+        return os.path.join(self.ruta_prediccion, archivo)
+
+    def ruta_scrap(self, archivo):
+        return os.path.join(self.ruta_scraping, archivo)
+
+    def obtener(self, nombre):
+        if nombre in self._cargados:
+            return self._cargados[nombre]
+        with self._candado:
+            if nombre not in self._cargados:
+                rss_antes, inicio = rss_mb(), time.perf_counter()
+                objeto = CARGADORES[nombre](self)
+                # (el índice H2H incluye el historial si tuvo que leerlo; el RSS, además, lo que
+                # hayan reservado otras sesiones en paralelo y las páginas del mmap que se tocaron)
+                segundos, rss = time.perf_counter() - inicio, rss_mb() - rss_antes
+                self._medidas[nombre] = (segundos, rss, tamanio_bytes(objeto))
+                self._cargados[nombre] = objeto
+        return self._cargados[nombre]
+
+    def descartar(self):
+        # Olvida todo lo cargado (se publicaron artefactos nuevos): se vuelve a cargar lo que se pida
+        with self._candado:
+            self._cargados.clear()
+            self._medidas.clear()
+
+    def modelo(self, id_modelo):
+        # id_modelo: 'xgboost' o 'logistica'
+        return self.obtener(MODELOS[id_modelo])
+
+    def diagnostico(self):
+        filas = []
+        for nombre in CARGADORES:
+            segundos, rss, tamanio = self._medidas.get(nombre, (np.nan, np.nan, np.nan))
+            filas.append({'Recurso': nombre, 'Cargado': nombre in self._cargados,
+                          'Segundos': segundos, 'RSS MB': rss, 'MB estimado': tamanio / 1024 ** 2})
+        return pd.DataFrame(filas)
+
+
+def cargar_recursos(ruta_proyecto):
+    # Todo de una (como antes) -> (model_xgb, model_log, scaler, stats_dict, perfiles, df_history, ranking_2026_dict, indice_h2h)
+    rec = Recursos(ruta_proyecto)
+    return (rec.modelo('xgboost'), rec.modelo('logistica'), rec.obtener('scaler'), rec.obtener('stats_superficie'),
+            rec.obtener('perfiles'), rec.obtener('historial'), rec.obtener('ranking_2026'), rec.obtener('indice_h2h'))
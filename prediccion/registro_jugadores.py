@@ -0,0 +1,143 @@
+import os
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+# =============================================================================
+# 🪪 REGISTRO DE JUGADORES (ID entero estable por jugador)
+# =============================================================================
+# Cada jugador aparece escrito de varias formas: "C. Alcaraz" en el ranking
+# scrapeado, "Carlos Alcaraz" sacado de la URL del perfil, "Albert Ramos-Vinolas"
+# en un CSV y "Albert Ramos Vinolas" en otro. El registro le da a cada jugador UN
+# número que no cambia nunca (solo se agregan nuevos al final) y guarda:
+#   - nombres: id -> nombre para mostrar (la primera forma en que apareció)
+#   - alias:   forma normalizada (sin tildes, minúsculas, sin guiones) -> id
+# Los alias se resuelven UNA vez al cargar los datos (generar_perfiles.py); de ahí
+# en adelante las estructuras pesadas usan el id (arrays en vez de diccionarios
+# con strings de clave).
+#
+#   registro = cargar_registro('registro_jugadores.pkl')   # o RegistroJugadores() si no existe
+#   ids = registro.ids(df['winner_name'], crear=True)     # array int32
+#   registro.registrar('Carlos Alcaraz', alias=['C. Alcaraz'])
+#   registro.nombre(ids[0])
+#
+# Uso:  python registro_jugadores.py   (arma / completa ../scraping/registro_jugadores.pkl con los
+#                                        perfiles y el ranking ya generados, sin pasar por el historial)
+
+VERSION_REGISTRO = 1
+ARCHIVO_REGISTRO = 'registro_jugadores.pkl'
+SIN_ID = -1
+
+
+def normalizar(nombre):
+    # "Albert Ramos-Viñolas " -> "albert ramos vinolas"
+    texto = unicodedata.normalize('NFKD', str(nombre))
+    texto = ''.join(c for c in texto if not unicodedata.combining(c))
+    return re.sub(r'[^a-z0-9]+', ' ', texto.lower()).strip()
+
+
+class RegistroJugadores:
+    def __init__(self, nombres=None, alias=None):
+        self.nombres = list(nombres or [])  # id -> nombre para mostrar
+        self.alias = dict(alias or {})      # normalizado -> id
+        self._exactos = {n: i for i, n in enumerate(self.nombres)}
+
+    def __len__(self):
+        return len(self.nombres)
+
+    def buscar(self, nombre):
+        # id del jugador (por nombre exacto o por cualquiera de sus alias), o None
+        i = self._exactos.get(nombre)
+        return i if i is not None else self.alias.get(normalizar(nombre))
+
+    def registrar(self, nombre, alias=()):
+        # id del jugador (lo crea si no existe). Los alias nuevos apuntan a ese id;
+        # un alias que ya era de OTRO jugador no se pisa (ej. dos "J. Smith")
+        i = self.buscar(nombre)
+        if i is None:
+            i = len(self.nombres)
+            self.nombres.append(str(nombre))
+            self._exactos[str(nombre)] = i
+        for texto in (nombre, *alias):
+            if texto is None or (isinstance(texto, float) and np.isnan(texto)):
+                continue
+            self.alias.setdefault(normalizar(texto), i)
+            self._exactos.setdefault(str(texto), i)
+        return i
+
+    def ids(self, nombres, crear=False):
+        # Array int32 de ids (SIN_ID si no está y crear=False). Se resuelve cada nombre distinto una sola vez
+        codigos, unicos = pd.factorize(pd.Series(nombres, dtype=object))
+        if crear:
+            por_unico = np.array([self.registrar(n) for n in unicos], dtype=np.int32)
+        else:
+            por_unico = np.array([SIN_ID if (i := self.buscar(n)) is None else i for n in unicos], dtype=np.int32)
+        return np.where(codigos >= 0, por_unico[np.maximum(codigos, 0)] if len(unicos) else SIN_ID, SIN_ID).astype(np.int32)
+
+    def nombre(self, i):
+        return self.nombres[i]
+
+    def canonicos(self, nombres, crear=True):
+        # Los nombres reescritos con el nombre para mostrar de su id (los desconocidos quedan igual)
+        ids = self.ids(nombres, crear)
+        tabla = np.array(self.nombres + [None], dtype=object)  # SIN_ID (-1) -> None
+        resultado = tabla[ids]
+        originales = np.asarray(pd.Series(nombres, dtype=object))
+        return np.where(ids == SIN_ID, originales, resultado)
+
+    # --- Persistencia (mismo esquema que estado_elo / indice_h2h) ---
+    def a_estado(self):
+        return {'version': VERSION_REGISTRO, 'nombres': self.nombres, 'alias': self.alias}
+
+    @classmethod
+    def desde_estado(cls, estado):
+        return cls(estado['nombres'], estado['alias'])
+
+
+def guardar_registro(registro, ruta=ARCHIVO_REGISTRO):
+    import joblib
+    joblib.dump(registro.a_estado(), ruta)
+
+
+def cargar_registro(ruta=ARCHIVO_REGISTRO):
+    import joblib
+    estado = joblib.load(ruta)
+    if not isinstance(estado, dict) or estado.get('version') != VERSION_REGISTRO:
+        raise ValueError(f"Versión de registro de jugadores incompatible en '{ruta}'")
+    return RegistroJugadores.desde_estado(estado)
+
+
+def cargar_o_crear(ruta=ARCHIVO_REGISTRO):
+    # El registro guardado (los ids no cambian entre corridas) o uno vacío
+    try:
+        return cargar_registro(ruta)
+    except (FileNotFoundError, ValueError):
+        return RegistroJugadores()
+
+
+if __name__ == "__main__":
+    import joblib
+
+    carpeta = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scraping')
+    ruta = os.path.join(carpeta, ARCHIVO_REGISTRO)
+    registro = cargar_o_crear(ruta)
+    antes = len(registro)
+
+    # Mismo orden que generar_perfiles.py: primero los nombres del historial (los de los perfiles),
+    # después el ranking con sus dos formas ("Jannik Sinner" sacado de la URL y "J. Sinner")
+    perfiles = joblib.load(os.path.join(carpeta, 'perfiles_jugadores.pkl'))
+    for jugador in perfiles:
+        registro.registrar(jugador)
+    ranking = pd.read_csv(os.path.join(carpeta, 'ranking_2026.csv')).drop_duplicates(subset=['player'])
+    reales = ranking['url_perfil'].astype(str).str.split('/').str[5].str.replace('-', ' ').str.title()
+    for real, abreviado in zip(reales, ranking['player']):
+        if isinstance(real, str) and real:
+            registro.registrar(real, alias=[abreviado])
+
+    guardar_registro(registro, ruta)
+    con_perfil = sum(isinstance(r, str) and registro.nombre(registro.buscar(r)) in perfiles for r in reales)
+    exactos = sum(r in perfiles for r in reales)
+    print(f"🪪 Registro: {len(registro):,} jugadores ({len(registro) - antes:,} nuevos), {len(registro.alias):,} alias")
+    print(f"   🏆 Ranking con perfil: {con_perfil}/{len(ranking)} (por nombre exacto: {exactos})")
@@ -0,0 +1,77 @@
+# =============================================================================
+# 🗂️ REGISTRO DE MODELOS
+# =============================================================================
+# Cada modelo se registra con un ID corto (para la línea de comandos) y un nombre
+# para mostrar (el mismo que usa resultados_comparacion.csv).
+# La fábrica devuelve un modelo NUEVO sin entrenar, con el escalado incluido.
+# Para sumar un modelo alcanza con decorar una función:
+#
+#     @registrar_modelo('svm', 'SVM')
+#     def _svm():
+#         return make_pipeline(StandardScaler(), SVC(probability=True))
+#
+# scikit-learn / xgboost se importan DENTRO de cada fábrica: la app importa este
+# módulo solo por elegir_modelo() y no paga ~0.7 s de sklearn al arrancar.
+
+MODELOS = {}  # {id: (nombre, fabrica)}
+
+
+def registrar_modelo(id_modelo, nombre):
+    def decorador(fabrica):
+        MODELOS[id_modelo] = (nombre, fabrica)
+        return fabrica
+    return decorador
+
+
+def crear_modelo(id_modelo):
+    if id_modelo not in MODELOS:
+        raise KeyError(f"Modelo desconocido '{id_modelo}'. Registrados: {', '.join(MODELOS)}")
+    return MODELOS[id_modelo][1]()
+
+
+def nombre_modelo(id_modelo):
+    return MODELOS[id_modelo][0]
+
+
+# Mismos hiperparámetros que comparar_modelos.py. n_jobs=1: el paralelismo lo pone quien los llama.
+@registrar_modelo('logistica', 'Regresión Logística')
+def _logistica():
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+    return make_pipeline(StandardScaler(), LogisticRegression(C=0.01, max_iter=1000))
+
+
+@registrar_modelo('random_forest', 'Random Forest')
+def _random_forest():
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+    return make_pipeline(StandardScaler(), RandomForestClassifier(n_estimators=100, max_depth=10, n_jobs=1, random_state=42))
+
+
+@registrar_modelo('xgboost', 'XGBoost')
+def _xgboost():
+    import xgboost as xgb  # Solo se importa si se usa
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+    return make_pipeline(StandardScaler(), xgb.XGBClassifier(n_estimators=100, learning_rate=0.05, max_depth=5,
+                                                             tree_method='hist', n_jobs=1, random_state=42))
+
+
+# =============================================================================
+# 🏁 ELECCIÓN DEL MODELO PARA LA APP (precisión + costo de servirlo)
+# =============================================================================
+# La app predice de a UN partido por clic: una décima de precisión no justifica
+# un modelo 10 veces más lento o pesado. Entre los que quedan a menos de
+# TOLERANCIA_ACCURACY del mejor, gana el de menor latencia por fila y, a igual
+# latencia, el más liviano.
+TOLERANCIA_ACCURACY = 0.005
+
+
+def elegir_modelo(resultados, tolerancia=TOLERANCIA_ACCURACY):
+    # resultados: DataFrame con el formato de resultados_comparacion.csv -> nombre del modelo elegido
+    if 'Latencia_1_ms' not in resultados.columns:
+        return resultados.sort_values('Accuracy', ascending=False)['Modelo'].iloc[0]  # CSV viejo, sin costos
+    cerca = resultados[resultados['Accuracy'] >= resultados['Accuracy'].max() - tolerancia]
+    return cerca.sort_values(['Latencia_1_ms', 'Tamaño_KB'])['Modelo'].iloc[0]
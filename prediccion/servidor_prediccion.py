@@ -0,0 +1,194 @@
+import argparse
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from predictor_lote import RAIZ, PredictorLote
+from registro_jugadores import normalizar
+
+# =============================================================================
+# 🌐 SERVIDOR DE PREDICCIONES (HTTP, solo biblioteca estándar)
+# =============================================================================
+# Para que otros sistemas (alertas, comparador de cuotas...) pidan predicciones
+# sin pasar por Streamlit. Usa los mismos artefactos que la app (PredictorLote).
+#
+#   POST /predecir   {"jugador1": "Carlos Alcaraz", "jugador2": "Jannik Sinner",
+#                     "superficie": "Clay", "pais": "ESP", "modelo": "xgboost"}
+#     -> 200 {"jugador1": ..., "jugador2": ..., "prob_jugador1": 0.57, "prob_jugador2": 0.43, "modelo": "xgboost"}
+#     -> 404 si algún jugador no tiene perfil | 400 si falta algo
+#   GET  /salud      -> {"estado": "ok", "modelos": [...], "lotes": ..., "pedidos": ...}
+#
+# MICRO-LOTES: cada pedido se encola y un único hilo los junta. Espera hasta
+# `espera_ms` desde el primero (o hasta `lote_max` pedidos) y resuelve todos con
+# UNA llamada a predict_many por (modelo, superficie, país). Con muchos pedidos a
+# la vez, el costo del modelo se reparte entre todos.
+#
+# Uso:  python servidor_prediccion.py                    (http://127.0.0.1:8765)
+#       python servidor_prediccion.py --puerto 9000 --espera-ms 0   (sin juntar: un pedido por llamada)
+#       python carga_servidor.py                         (mide latencia y pedidos/s)
+
+PUERTO = 8765
+ESPERA_MS = 1.0
+LOTE_MAX = 256
+MODELOS = ['xgboost', 'logistica']
+
+
+class AgrupadorLotes:
+    def __init__(self, ruta_proyecto=RAIZ, espera_ms=ESPERA_MS, lote_max=LOTE_MAX):
+        self.ruta_proyecto = ruta_proyecto
+        self.espera, self.lote_max = espera_ms / 1000, lote_max
+        self._cola = queue.Queue()
+        self._predictores = {}  # {modelo: PredictorLote} (cada uno se carga la primera vez que se pide)
+        self.lotes = self.pedidos = 0
+        self._hilo = threading.Thread(target=self._trabajar, daemon=True)
+        self._hilo.start()
+
+    def predictor(self, modelo):
+        # Lo carga el hilo de lotes (el primero que lo usa): no hace falta candado
+        if modelo not in self._predictores:
+            self._predictores[modelo] = PredictorLote.desde_recursos(self.ruta_proyecto, modelo)
+        return self._predictores[modelo]
+
+    def pedir(self, jugador1, jugador2, superficie, pais='NEUTRAL', modelo='xgboost'):
+        # Encola un partido y devuelve un Future con la prob. de que gane jugador1 (NaN si no tiene perfil)
+        futuro = Future()
+        self._cola.put(((modelo, superficie, pais), (jugador1, jugador2), futuro))
+        return futuro
+
+    def _juntar(self):
+        # Bloquea hasta el primer pedido y después junta lo que llegue dentro de la ventana
+        lote = [self._cola.get()]
+        limite = time.perf_counter() + self.espera
+        while len(lote) < self.lote_max:
+            restante = limite - time.perf_counter()
+            try:
+                lote.append(self._cola.get(timeout=restante) if restante > 0 else self._cola.get_nowait())
+            except queue.Empty:
+                break
+        return lote
+
+    def _resolver(self, lote):
+        grupos = {}
+        for clave, par, futuro in lote:
+            grupos.setdefault(clave, []).append((par, futuro))
+        for (modelo, superficie, pais), pedidos in grupos.items():
+            try:
+                probs = self.predictor(modelo).predict_many([p for p, _ in pedidos], superficie, pais)
+            except Exception as e:  # Que un error no deje colgados a los que esperan
+                for _, futuro in pedidos:
+                    futuro.set_exception(e)
+                continue
+            for (_, futuro), prob in zip(pedidos, probs):
+                futuro.set_result(float(prob))
+
+    def _trabajar(self):
+        # El hilo no se puede morir: si uno falla, el resto del servidor queda esperando para siempre
+        while True:
+            lote = self._juntar()
+            try:
+                self._resolver(lote)
+            except Exception as e:
+                for _, _, futuro in lote:
+                    if not futuro.done():
+                        futuro.set_exception(e)
+            self.lotes += 1
+            self.pedidos += len(lote)
+
+
+# -------------------------------------------------------------------------
+# HTTP
+# -------------------------------------------------------------------------
+class ManejadorPrediccion(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Conexiones keep-alive (el generador de carga las reutiliza)
+    disable_nagle_algorithm = True  # Cabecera y cuerpo salen en dos writes: sin esto cada respuesta espera ~40 ms
+    agrupador = None               # Lo asigna crear_servidor()
+
+    def _responder(self, codigo, datos):
+        cuerpo = json.dumps(datos, ensure_ascii=False).encode('utf-8')
+        self.send_response(codigo)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def do_GET(self):
+        if self.path != '/salud':
+            return self._responder(404, {'error': f'Ruta desconocida: {self.path}'})
+        ag = self.agrupador
+        self._responder(200, {'estado': 'ok', 'modelos': sorted(ag._predictores), 'lotes': ag.lotes,
+                              'pedidos': ag.pedidos, 'espera_ms': ag.espera * 1000, 'lote_max': ag.lote_max})
+
+    def do_POST(self):
+        if self.path != '/predecir':
+            return self._responder(404, {'error': f'Ruta desconocida: {self.path}'})
+        try:
+            datos = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+            j1, j2 = datos['jugador1'], datos['jugador2']
+            superficie = datos.get('superficie', 'Hard')
+            pais = datos.get('pais') or 'NEUTRAL'
+            modelo = datos.get('modelo', 'xgboost')
+        except (ValueError, KeyError, TypeError) as e:
+            return self._responder(400, {'error': f'Pedido inválido: {e}'})
+        campos = {'jugador1': j1, 'jugador2': j2, 'superficie': superficie, 'pais': pais, 'modelo': modelo}
+        no_texto = [nombre for nombre, valor in campos.items() if not isinstance(valor, str)]
+        if no_texto:
+            return self._responder(400, {'error': f"Pedido inválido: {', '.join(no_texto)} debe(n) ser texto"})
+        if modelo not in MODELOS:
+            return self._responder(400, {'error': f'Modelo desconocido: {modelo} (usar {MODELOS})'})
+        # Mismo jugador de los dos lados (también "carlos alcaraz" vs "Carlos Alcaraz"): el modelo
+        # igual devolvería una probabilidad, que no significa nada
+        if normalizar(j1) == normalizar(j2):
+            return self._responder(400, {'error': f'Pedido inválido: jugador1 y jugador2 son el mismo jugador ({j1})'})
+
+        try:
+            prob = self.agrupador.pedir(j1, j2, superficie, pais, modelo).result(timeout=30)
+        except Exception as e:
+            return self._responder(500, {'error': f'{type(e).__name__}: {e}'})
+        if np.isnan(prob):
+            filas = self.agrupador.predictor(modelo).posiciones([j1, j2])
+            sin_perfil = [j for j, fila in zip((j1, j2), filas) if fila < 0]
+            return self._responder(404, {'error': f"Sin perfil: {', '.join(map(str, sin_perfil))}"})
+        self._responder(200, {'jugador1': j1, 'jugador2': j2, 'superficie': superficie, 'pais': pais,
+                              'modelo': modelo, 'prob_jugador1': prob, 'prob_jugador2': 1 - prob})
+
+    def log_message(self, formato, *args):
+        pass  # Sin una línea por pedido (con carga inunda la consola)
+
+
+class ServidorPrediccion(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256  # El default (5) rechaza conexiones cuando llegan muchos clientes juntos
+
+
+def crear_servidor(ruta_proyecto=RAIZ, host='127.0.0.1', puerto=PUERTO, espera_ms=ESPERA_MS, lote_max=LOTE_MAX):
+    agrupador = AgrupadorLotes(ruta_proyecto, espera_ms, lote_max)
+    manejador = type('Manejador', (ManejadorPrediccion,), {'agrupador': agrupador})
+    return ServidorPrediccion((host, puerto), manejador), agrupador
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor HTTP de predicciones con micro-lotes")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', type=int, default=PUERTO)
+    parser.add_argument('--espera-ms', type=float, default=ESPERA_MS, help="Ventana para juntar pedidos (0 = no esperar)")
+    parser.add_argument('--lote-max', type=int, default=LOTE_MAX)
+    parser.add_argument('--modelos', nargs='+', default=MODELOS, choices=MODELOS, help="Modelos a cargar al arrancar")
+    args = parser.parse_args()
+
+    servidor, agrupador = crear_servidor(RAIZ, args.host, args.puerto, args.espera_ms, args.lote_max)
+    inicio = time.perf_counter()
+    for modelo in args.modelos:  # Precarga (desde el hilo de lotes, el único que los usa)
+        agrupador.pedir('', '', 'Hard', 'NEUTRAL', modelo).result()
+    print(f"🌐 Servidor de predicciones en http://{args.host}:{args.puerto} "
+          f"(modelos listos en {time.perf_counter() - inicio:.2f} s | ventana {args.espera_ms} ms, lote máx. {args.lote_max})")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Servidor detenido")
+    finally:
+        servidor.server_close()
@@ -0,0 +1,212 @@
+import argparse
+import os
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+from generador_sintetico import CUADRO_POR_NIVEL, orden_cuadro
+from predictor_lote import RAIZ, PredictorLote
+from torneos import resolver_torneo
+
+# =============================================================================
+# 🎲 SIMULADOR DE CUADROS (MONTE CARLO VECTORIZADO)
+# =============================================================================
+# 1. Matriz de probabilidades: P[i, j] = prob. de que i le gane a j, para TODOS
+#    los pares del cuadro en UNA llamada al modelo (predict_many). El modelo no es
+#    perfectamente simétrico, así que se promedia: P = (P + 1 - P.T) / 2.
+# 2. Simulación: una fila por simulación y una columna por lugar del cuadro.
+#    En cada ronda se enfrentan las columnas pares con las impares, se sortea
+#    cada partido con P[a, b] y quedan la mitad de las columnas. Sin recursión
+#    ni bucles por partido: un bucle por RONDA (7 en un cuadro de 128).
+# 3. Resultado: probabilidad de cada jugador de llegar a cada ronda.
+#
+# Los "byes" son un jugador más (el último índice) que pierde siempre.
+#
+# Uso:  python simulador_cuadro.py australian-open
+#       python simulador_cuadro.py roland-garros --simulaciones 200000 --modelo logistica
+
+ARCHIVO_PARTIDOS = os.path.join(RAIZ, 'scraping', 'atp_matches_2026_full.csv')
+ARCHIVO_TORNEOS = os.path.join(RAIZ, 'scraping', 'atp_torneos_2026_final.csv')
+RONDAS_CUADRO = ['Round of 128', 'Round of 64', 'Round of 32', 'Round of 16', 'Quarterfinals', 'Semifinals', 'Final']
+NOMBRE_RONDA = {128: 'R128', 64: 'R64', 32: 'R32', 16: 'R16', 8: 'QF', 4: 'SF', 2: 'F', 1: 'Campeón'}
+SIMULACIONES = 100_000
+LOTE = 50_000  # Simulaciones por tanda (acota la memoria: LOTE x cuadro enteros)
+
+
+def slug_torneo(link):
+    # ".../tournaments/australian-open/580/results" -> "australian-open" (como tourney_name en los partidos)
+    encontrado = re.search(r'/tournaments/([^/]+)/', str(link))
+    return encontrado.group(1) if encontrado else None
+
+
+# -------------------------------------------------------------------------
+# ARMADO DEL CUADRO (lista de nombres en orden de cuadro, None = bye)
+# -------------------------------------------------------------------------
+def cuadro_desde_resultados(partidos):
+    # Reconstruye el cuadro de arriba hacia abajo desde la final: cada jugador de una ronda
+    # se reemplaza por el partido que jugó en la anterior (o por él + bye si no jugó).
+    rondas = partidos['round'].astype(str).str.strip()
+    presentes = [r for r in RONDAS_CUADRO if (rondas == r).any()]
+    if not presentes or presentes[-1] != 'Final':
+        return None
+
+    por_ronda = {}
+    for r in presentes:
+        tabla = partidos[rondas == r]
+        por_ronda[r] = {}
+        for w, l in zip(tabla['winner_name'], tabla['loser_name']):
+            por_ronda[r][w] = por_ronda[r][l] = (w, l)
+
+    final = partidos[rondas == 'Final'].iloc[0]
+    lugares = [final['winner_name'], final['loser_name']]
+    for r in reversed(presentes[:-1]):
+        nuevos = []
+        for jugador in lugares:
+            w, l = por_ronda[r].get(jugador, (jugador, None))
+            nuevos += [jugador, l if w == jugador else w]
+        lugares = nuevos
+    return lugares
+
+
+def cuadro_por_ranking(predictor, jugadores=None, tamano=32):
+    # Sin resultados: los mejores del ranking (o los jugadores dados) en las posiciones de siembra clásicas
+    if jugadores is None:
+        orden = np.argsort(predictor.rank, kind='stable')[:tamano]
+        jugadores = [predictor.nombres[i] for i in orden]
+    else:
+        filas = predictor.posiciones(jugadores)
+        rank = np.where(filas >= 0, predictor.rank[np.maximum(filas, 0)], np.inf)
+        jugadores = [jugadores[k] for k in np.argsort(rank, kind='stable')]
+    tamano = 1 << max(len(jugadores) - 1, 1).bit_length()
+    sembrados = jugadores + [None] * (tamano - len(jugadores))  # Byes para los mejores sembrados
+    return [sembrados[i] for i in orden_cuadro(tamano)]
+
+
+def cuadro_torneo(predictor, slug, partidos, nombre=None):
+    # Devuelve (cuadro, superficie, país, origen). Usa los resultados 2026 si el torneo está completo.
+    datos = resolver_torneo(nombre or slug)
+    del_torneo = partidos[partidos['tourney_name'] == slug] if slug else partidos.iloc[:0]
+    superficie = del_torneo['surface'].iloc[0] if len(del_torneo) else datos['superficie']
+
+    cuadro = cuadro_desde_resultados(del_torneo)
+    if cuadro is not None:
+        return cuadro, superficie, datos['ioc'], 'Cuadro real (resultados 2026)'
+
+    # Torneo a medio jugar: los del cuadro principal, sembrados por ranking
+    rondas = del_torneo['round'].astype(str).str.strip()
+    principal = del_torneo[rondas.isin(RONDAS_CUADRO)]
+    if len(principal):
+        jugadores = list(pd.unique(pd.concat([principal['winner_name'], principal['loser_name']])))
+        return cuadro_por_ranking(predictor, jugadores), superficie, datos['ioc'], 'Inscriptos 2026, sembrados por ranking'
+
+    tamano = CUADRO_POR_NIVEL.get(datos['nivel'], 32)
+    return cuadro_por_ranking(predictor, tamano=tamano), superficie, datos['ioc'], f'Top {tamano} del ranking (sin resultados)'
+
+
+# -------------------------------------------------------------------------
+# MATRIZ Y SIMULACIÓN
+# -------------------------------------------------------------------------
+def matriz_probabilidades(predictor, jugadores, superficie, pais='NEUTRAL'):
+    # P[i, j] para todos los pares ordenados, en UNA llamada (jugadores sin perfil: 0.5)
+    n = len(jugadores)
+    i, j = np.nonzero(~np.eye(n, dtype=bool))
+    probs = predictor.predict_many([(jugadores[a], jugadores[b]) for a, b in zip(i, j)], superficie, pais)
+    P = np.full((n, n), 0.5)
+    P[i, j] = np.nan_to_num(probs, nan=0.5)
+    return (P + 1.0 - P.T) / 2.0
+
+
+def _con_byes(P, cuadro_idx):
+    # Agrega el "jugador bye" (índice n): pierde con todos; bye contra bye da igual quién pase
+    n = len(P)
+    Q = np.zeros((n + 1, n + 1))
+    Q[:n, :n] = P
+    Q[:n, n] = 1.0
+    Q[n, n] = 0.5
+    return Q, np.where(cuadro_idx < 0, n, cuadro_idx)
+
+
+def simular_cuadro(P, cuadro_idx, simulaciones=SIMULACIONES, semilla=0, lote=LOTE):
+    # cuadro_idx: índice en P de cada lugar del cuadro (-1 = bye; largo potencia de 2)
+    # Devuelve un array (n_jugadores, n_rondas): prob. de GANAR la ronda k (= llegar a la siguiente)
+    Q, lugares = _con_byes(P, np.asarray(cuadro_idx))
+    n, n_rondas = len(P), int(np.log2(len(lugares)))
+    tipo = np.int16 if n < 2 ** 15 else np.int32
+    conteos = np.zeros((n + 1, n_rondas), dtype=np.int64)
+    rng = np.random.default_rng(semilla)
+
+    hechas = 0
+    while hechas < simulaciones:
+        tanda = min(lote, simulaciones - hechas)
+        vivos = np.broadcast_to(lugares.astype(tipo), (tanda, len(lugares)))
+        for ronda in range(n_rondas):
+            a, b = vivos[:, 0::2], vivos[:, 1::2]
+            gana_a = rng.random(a.shape, dtype=np.float32) < Q[a, b]
+            vivos = np.where(gana_a, a, b)
+            conteos[:, ronda] += np.bincount(vivos.ravel(), minlength=n + 1)
+        hechas += tanda
+    return conteos[:n] / simulaciones
+
+
+def probabilidades_exactas(P, cuadro_idx):
+    # Cálculo exacto (para verificar la simulación): ronda a ronda, la prob. de cada lugar de ganarle
+    # a alguno del bloque vecino, pesada por la prob. de que ese rival haya llegado.
+    Q, lugares = _con_byes(P, np.asarray(cuadro_idx))
+    m = len(lugares)
+    M = Q[np.ix_(lugares, lugares)]
+    llega = np.ones(m)
+    salida, tamano = [], 1
+    while tamano < m:
+        bloque = np.arange(m) // tamano
+        rivales = bloque[None, :] == (bloque ^ 1)[:, None]
+        llega = llega * ((M * rivales) @ llega)
+        salida.append(llega)
+        tamano *= 2
+    por_lugar = np.column_stack(salida)
+    resultado = np.zeros((len(P) + 1, por_lugar.shape[1]))
+    np.add.at(resultado, lugares, por_lugar)
+    return resultado[:len(P)]
+
+
+def simular_torneo(predictor, cuadro, superficie, pais='NEUTRAL', simulaciones=SIMULACIONES, semilla=0):
+    # Todo junto: nombres del cuadro -> DataFrame (una fila por jugador, una columna por ronda)
+    jugadores = [n for n in cuadro if n is not None]
+    posicion = {n: k for k, n in enumerate(jugadores)}
+    cuadro_idx = np.array([posicion[n] if n is not None else -1 for n in cuadro])
+
+    P = matriz_probabilidades(predictor, jugadores, superficie, pais)
+    probs = simular_cuadro(P, cuadro_idx, simulaciones, semilla)
+    columnas = [NOMBRE_RONDA.get(len(cuadro) >> (k + 1), f'Ronda {k + 2}') for k in range(probs.shape[1])]
+    tabla = pd.DataFrame(probs, columns=columnas)
+    tabla.insert(0, 'Jugador', jugadores)
+    tabla.insert(1, 'Lugar', [cuadro.index(n) + 1 for n in jugadores])
+    return tabla.sort_values(columnas[::-1], ascending=False).reset_index(drop=True), P, cuadro_idx
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Probabilidad de cada jugador de llegar a cada ronda")
+    parser.add_argument('torneo', help="Slug del torneo (ej: australian-open)")
+    parser.add_argument('--simulaciones', type=int, default=SIMULACIONES)
+    parser.add_argument('--modelo', default='xgboost', choices=['xgboost', 'logistica'])
+    parser.add_argument('--semilla', type=int, default=0)
+    args = parser.parse_args()
+
+    predictor = PredictorLote.desde_recursos(RAIZ, args.modelo)
+    partidos = pd.read_csv(ARCHIVO_PARTIDOS, low_memory=False)
+    cuadro, superficie, pais, origen = cuadro_torneo(predictor, args.torneo, partidos)
+    print(f"🎲 {args.torneo}: cuadro de {len(cuadro)} ({origen}) | {superficie} | {pais}")
+
+    inicio = time.perf_counter()
+    tabla, P, cuadro_idx = simular_torneo(predictor, cuadro, superficie, pais, args.simulaciones, args.semilla)
+    print(f"⏱️ Matriz + {args.simulaciones:,} simulaciones en {time.perf_counter() - inicio:.2f} s")
+
+    # Chequeo contra el cálculo exacto (el error de Monte Carlo es ~1/sqrt(simulaciones))
+    exactas = probabilidades_exactas(P, cuadro_idx)
+    simuladas = simular_cuadro(P, cuadro_idx, args.simulaciones, args.semilla)
+    error = np.abs(exactas - simuladas).max()
+    tolerancia = 5 / np.sqrt(args.simulaciones)
+    print(("✅" if error < tolerancia else "❌") + f" Máxima diferencia con el cálculo exacto: {error:.4f} (tolerancia {tolerancia:.4f})")
+
+    print("\n" + tabla.head(16).to_string(index=False, float_format=lambda x: f"{x:6.1%}"))
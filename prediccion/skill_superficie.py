@@ -0,0 +1,213 @@
+import math
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from fatiga import dias_calendario
+
+# =============================================================================
+# 🏟️ SKILL POR SUPERFICIE "AL DÍA DEL PARTIDO" (sin mirar el futuro)
+# =============================================================================
+# Antes el win rate por superficie salía de un groupby sobre TODA la historia:
+# para entrenar, un partido de 2005 usaba victorias de 2020 (fuga de información).
+# Este motor recorre los partidos en orden cronológico y, para cada uno, devuelve
+# el win rate que el jugador tenía en esa superficie ANTES de jugarlo.
+#
+# - Estado en arrays por (id_jugador, superficie): victorias, peso y partidos jugados.
+# - Opcional: decaimiento exponencial por tiempo (semivida en días). Con semivida=365
+#   un partido de hace un año pesa la mitad que uno de hoy.
+# - Al final, la "foto" del estado (sin decaimiento) es exactamente el win rate de
+#   carrera de siempre: es lo que usa la app (stats_superficie_v2.pkl).
+
+MIN_PARTIDOS_SKILL = 5  # Partidos mínimos en una superficie para confiar en su win rate
+SKILL_NEUTRO = 0.5
+VERSION_SKILL = 1
+ARCHIVO_SKILL = 'estado_skill.pkl'
+
+
+def _asignar_ids(valores, mapa):
+    codigos, unicos = pd.factorize(np.asarray(valores, dtype=object), use_na_sentinel=False)
+    ids_unicos = np.array([mapa.setdefault(u, len(mapa)) for u in unicos], dtype=np.int64)
+    return ids_unicos[codigos]
+
+
+def _actualizar(w_celdas, l_celdas, dias, semividas, victorias, pesos, cuenta, ultimo, min_partidos):
+    # Bucle secuencial sobre listas planas (celda = jugador * n_superficies + superficie)
+    k = len(semividas)
+    v = [fila.tolist() for fila in victorias]
+    p = [fila.tolist() for fila in pesos]
+    c = cuenta.tolist()
+    u = ultimo.tolist()
+    tasas = [(-math.log(2) / h) if h else 0.0 for h in semividas]
+
+    n = len(w_celdas)
+    out_w = [None] * n
+    out_l = [None] * n
+    for i, (cw, cl, d) in enumerate(zip(w_celdas.tolist(), l_celdas.tolist(), dias.tolist())):
+        # Win rate ANTES del partido (el decaimiento no cambia el cociente, solo el peso futuro)
+        out_w[i] = [v[j][cw] / p[j][cw] for j in range(k)] if c[cw] >= min_partidos else [SKILL_NEUTRO] * k
+        out_l[i] = [v[j][cl] / p[j][cl] for j in range(k)] if c[cl] >= min_partidos else [SKILL_NEUTRO] * k
+
+        for celda, gano in ((cw, 1.0), (cl, 0.0)):
+            dt = d - u[celda]
+            for j in range(k):
+                f = math.exp(tasas[j] * dt) if tasas[j] and c[celda] else 1.0
+                v[j][celda] = v[j][celda] * f + gano
+                p[j][celda] = p[j][celda] * f + 1.0
+            c[celda] += 1
+            u[celda] = d
+
+    victorias[:] = v
+    pesos[:] = p
+    cuenta[:] = c
+    ultimo[:] = u
+    return np.array(out_w, dtype=float).reshape(n, k), np.array(out_l, dtype=float).reshape(n, k)
+
+
+class MotorSkill:
+    def __init__(self, semividas=(None,), min_partidos=MIN_PARTIDOS_SKILL):
+        # semividas: una columna de salida por cada una (None = sin decaimiento)
+        self.semividas = tuple(semividas)
+        self.min_partidos = min_partidos
+        self.jugadores = {}    # {nombre: id}
+        self.superficies = {}  # {superficie: id}
+        k = len(self.semividas)
+        self.victorias = np.zeros((k, 0, 0))
+        self.pesos = np.zeros((k, 0, 0))
+        self.cuenta = np.zeros((0, 0), dtype=np.int64)
+        self.ultimo = np.zeros((0, 0), dtype=np.int64)  # Día del último partido en esa superficie
+
+    def _crecer(self):
+        n_j, n_s = len(self.jugadores), len(self.superficies)
+        if (n_j, n_s) == self.cuenta.shape:
+            return
+        f, c = self.cuenta.shape
+        k = len(self.semividas)
+        victorias, pesos = np.zeros((k, n_j, n_s)), np.zeros((k, n_j, n_s))
+        cuenta, ultimo = np.zeros((n_j, n_s), dtype=np.int64), np.zeros((n_j, n_s), dtype=np.int64)
+        victorias[:, :f, :c] = self.victorias
+        pesos[:, :f, :c] = self.pesos
+        cuenta[:f, :c] = self.cuenta
+        ultimo[:f, :c] = self.ultimo
+        self.victorias, self.pesos, self.cuenta, self.ultimo = victorias, pesos, cuenta, ultimo
+
+    def procesar(self, winners, losers, surfaces, fechas):
+        # Columnas ya ordenadas cronológicamente -> skill previo de ganador y perdedor, forma (n, k)
+        winners = np.asarray(winners, dtype=object)
+        losers = np.asarray(losers, dtype=object)
+        ids = _asignar_ids(np.column_stack([winners, losers]).ravel(), self.jugadores)
+        s_ids = _asignar_ids(surfaces, self.superficies)
+        self._crecer()
+
+        n_s = len(self.superficies)
+        k = len(self.semividas)
+        forma = self.cuenta.shape
+        v, p = self.victorias.reshape(k, -1), self.pesos.reshape(k, -1)
+        c, u = self.cuenta.ravel(), self.ultimo.ravel()
+        skill_w, skill_l = _actualizar(ids[0::2] * n_s + s_ids, ids[1::2] * n_s + s_ids,
+                                       dias_calendario(fechas), self.semividas, v, p, c, u, self.min_partidos)
+        self.victorias, self.pesos = v.reshape(k, *forma), p.reshape(k, *forma)
+        self.cuenta, self.ultimo = c.reshape(forma), u.reshape(forma)
+
+        # Sin superficie no hay skill (igual que el groupby viejo, que descartaba los NaN)
+        sin_superficie = pd.isna(pd.Series(surfaces)).to_numpy()
+        skill_w[sin_superficie] = SKILL_NEUTRO
+        skill_l[sin_superficie] = SKILL_NEUTRO
+        return skill_w, skill_l
+
+    def procesar_df(self, df):
+        return self.procesar(df['winner_name'].to_numpy(), df['loser_name'].to_numpy(),
+                             df['surface'].to_numpy(), df['tourney_date'])
+
+    def foto(self, indice=0):
+        # Win rate actual por (jugador, superficie) -> tabla player/surface/win_rate
+        jugadores = np.array(list(self.jugadores), dtype=object)
+        superficies = np.array(list(self.superficies), dtype=object)
+        j, s = np.nonzero(self.cuenta >= self.min_partidos)
+        tabla = pd.DataFrame({
+            'player': jugadores[j],
+            'surface': superficies[s],
+            'win_rate': self.victorias[indice, j, s] / self.pesos[indice, j, s],
+        })
+        return tabla[tabla['player'].notna() & tabla['surface'].notna()].reset_index(drop=True)
+
+    def diccionario(self, indice=0):
+        # Mismo formato que stats_superficie_v2.pkl: {(jugador, superficie): win_rate}
+        tabla = self.foto(indice)
+        return dict(zip(zip(tabla['player'], tabla['surface']), tabla['win_rate'].astype(float)))
+
+    # --- PERSISTENCIA ---
+    def a_estado(self):
+        return {
+            'version': VERSION_SKILL,
+            'semividas': self.semividas,
+            'min_partidos': self.min_partidos,
+            'jugadores': list(self.jugadores),
+            'superficies': list(self.superficies),
+            'victorias': self.victorias,
+            'pesos': self.pesos,
+            'cuenta': self.cuenta,
+            'ultimo': self.ultimo,
+        }
+
+    @classmethod
+    def desde_estado(cls, estado):
+        motor = cls(estado['semividas'], estado['min_partidos'])
+        motor.jugadores = {n: i for i, n in enumerate(estado['jugadores'])}
+        motor.superficies = {s: i for i, s in enumerate(estado['superficies'])}
+        motor.victorias = np.array(estado['victorias'], dtype=np.float64)
+        motor.pesos = np.array(estado['pesos'], dtype=np.float64)
+        motor.cuenta = np.array(estado['cuenta'], dtype=np.int64)
+        motor.ultimo = np.array(estado['ultimo'], dtype=np.int64)
+        return motor
+
+
+def guardar_estado_skill(motor, ruta=ARCHIVO_SKILL):
+    joblib.dump(motor.a_estado(), ruta)
+
+
+def cargar_estado_skill(ruta=ARCHIVO_SKILL):
+    estado = joblib.load(ruta)
+    if not isinstance(estado, dict) or estado.get('version') != VERSION_SKILL:
+        raise ValueError(f"Versión de estado de skill incompatible en '{ruta}'")
+    return MotorSkill.desde_estado(estado)
+
+
+def skill_de_carrera(df, min_partidos=MIN_PARTIDOS_SKILL):
+    # El cálculo viejo (groupby sobre toda la historia), para comparar
+    wins = df.groupby(['winner_name', 'surface']).size().reset_index(name='wins')
+    wins.columns = ['player', 'surface', 'wins']
+    losses = df.groupby(['loser_name', 'surface']).size().reset_index(name='losses')
+    losses.columns = ['player', 'surface', 'losses']
+    stats = pd.merge(wins, losses, on=['player', 'surface'], how='outer').fillna(0)
+    stats['total'] = stats['wins'] + stats['losses']
+    stats = stats[stats['total'] >= min_partidos]
+    return dict(zip(zip(stats['player'], stats['surface']), stats['wins'] / stats['total']))
+
+
+# Uso:  python skill_superficie.py historial_tenis_COMPLETO.csv
+if __name__ == "__main__":
+    import sys
+    import time
+    from motor_elo import ordenar_cronologico
+
+    ruta = sys.argv[1] if len(sys.argv) > 1 else 'historial_tenis_COMPLETO.csv'
+    df = pd.read_csv(ruta, low_memory=False)
+    df['tourney_date'] = pd.to_numeric(df['tourney_date'], errors='coerce')
+    df = ordenar_cronologico(df[df['tourney_date'] > 0]).reset_index(drop=True)
+
+    inicio = time.perf_counter()
+    motor = MotorSkill(semividas=(None, 365))
+    skill_w, skill_l = motor.procesar_df(df)
+    print(f"⏱️ {len(df):,} partidos en {time.perf_counter() - inicio:.2f} s")
+
+    # La foto final sin decaimiento tiene que ser el win rate de carrera de siempre
+    viejo, nuevo = skill_de_carrera(df), motor.diccionario()
+    assert viejo.keys() == nuevo.keys(), "❌ Las claves (jugador, superficie) no coinciden"
+    assert all(abs(viejo[c] - nuevo[c]) < 1e-12 for c in viejo), "❌ Los win rates no coinciden"
+    print(f"✅ Foto final = win rate de carrera ({len(nuevo):,} pares jugador/superficie)")
+
+    # Cuánto "veía el futuro" el cálculo viejo
+    carrera_w = np.array([viejo.get(c, SKILL_NEUTRO) for c in zip(df['winner_name'], df['surface'])])
+    print(f"📉 Diferencia media |carrera - al día| del ganador: {np.abs(carrera_w - skill_w[:, 0]).mean():.3f}")
@@ -0,0 +1,185 @@
+import re
+import unicodedata
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# =============================================================================
+# 🗺️ METADATOS DE TORNEOS (país, superficie, fecha de calendario, nivel)
+# =============================================================================
+# Una sola tabla para todo el proyecto. Antes cada script tenía su propia lista
+# de palabras clave (detectar_pais, mapa_superficies, detectar_superficie,
+# meses_torneos) y a veces no coincidían entre sí.
+#
+# - Los nombres se normalizan: minúsculas, sin tildes, guiones = espacios.
+#   Así "Monte-Carlo", "monte-carlo" y "Monte Carlo Masters" son lo mismo.
+# - Todos los alias se compilan en UNA expresión regular.
+# - Se resuelve una vez por nombre distinto (con caché) y después se mapea por fila.
+#
+# Si hay varios alias en el mismo nombre gana el que está MÁS ARRIBA en la tabla
+# (por eso "roland garros" va antes que "paris" y "nitto atp finals" antes que "turin").
+# Un campo en None significa "no sé": se usa el siguiente alias que coincida o el valor por defecto.
+
+PAIS_POR_DEFECTO = 'NEUTRAL'
+SUPERFICIE_POR_DEFECTO = 'Hard'
+FECHA_POR_DEFECTO = '0101'
+
+# (alias, IOC, superficie, MMDD de inicio, nivel estilo Sackmann: G, M, A, F, D)
+TORNEOS = [
+    # --- Grand Slams ---
+    (['australian open', 'melbourne'], 'AUS', 'Hard', '0115', 'G'),
+    (['roland garros', 'french open'], 'FRA', 'Clay', '0525', 'G'),
+    (['wimbledon'], 'GBR', 'Grass', '0701', 'G'),
+    (['us open'], 'USA', 'Hard', '0828', 'G'),
+
+    # --- Finales y equipos ---
+    (['nitto atp finals', 'atp finals', 'tour finals', 'masters cup'], None, 'Hard', '1115', 'F'),
+    (['davis cup'], None, None, '0131', 'D'),
+    (['united cup', 'perth sydney'], 'AUS', 'Hard', '0102', None),
+    (['laver cup'], None, 'Hard', '0919', None),
+
+    # --- Masters 1000 ---
+    (['indian wells'], 'USA', 'Hard', '0310', 'M'),
+    (['miami'], 'USA', 'Hard', '0325', 'M'),
+    (['monte carlo', 'montecarlo'], 'MON', 'Clay', '0406', 'M'),
+    (['madrid'], 'ESP', 'Clay', '0423', 'M'),
+    (['rome', 'roma', 'internazionali'], 'ITA', 'Clay', '0507', 'M'),
+    (['canada', 'montreal', 'toronto'], 'CAN', 'Hard', '0807', 'M'),
+    (['cincinnati'], 'USA', 'Hard', '0815', 'M'),
+    (['shanghai'], 'CHN', 'Hard', '1005', 'M'),
+    (['paris masters', 'paris', 'bercy'], 'FRA', 'Hard', '1030', 'M'),
+
+    # --- ATP 500 / 250 ---
+    (['brisbane'], 'AUS', 'Hard', '0102', 'A'),
+    (['hong kong'], 'HKG', 'Hard', '0102', 'A'),
+    (['adelaide'], 'AUS', 'Hard', '0108', 'A'),
+    (['auckland'], 'NZL', 'Hard', '0108', 'A'),
+    (['montpellier'], 'FRA', 'Hard', '0127', 'A'),
+    (['cordoba'], 'ARG', 'Clay', '0203', 'A'),
+    (['dallas'], 'USA', 'Hard', '0205', 'A'),
+    (['rotterdam'], 'NED', 'Hard', '0205', 'A'),
+    (['buenos aires'], 'ARG', 'Clay', '0205', 'A'),
+    (['delray beach', 'delray'], 'USA', 'Hard', '0210', 'A'),
+    (['marseille'], 'FRA', 'Hard', '0210', 'A'),
+    (['rio de janeiro', 'rio'], 'BRA', 'Clay', '0217', 'A'),
+    (['doha'], 'QAT', 'Hard', '0217', 'A'),
+    (['dubai'], 'UAE', 'Hard', '0224', 'A'),
+    (['acapulco'], 'MEX', 'Hard', '0224', 'A'),
+    (['santiago'], 'CHI', 'Clay', '0224', 'A'),
+    (['houston'], 'USA', 'Clay', '0331', 'A'),
+    (['marrakech'], 'MAR', 'Clay', '0331', 'A'),
+    (['bucharest'], 'ROU', 'Clay', '0331', 'A'),
+    (['barcelona'], 'ESP', 'Clay', '0414', 'A'),
+    (['munich'], 'GER', 'Clay', '0414', 'A'),
+    (['estoril'], 'POR', 'Clay', '0331', 'A'),
+    (['geneva'], 'SUI', 'Clay', '0518', 'A'),
+    (['hamburg'], 'GER', 'Clay', '0518', 'A'),
+    (['lyon'], 'FRA', 'Clay', '0518', 'A'),
+    (['stuttgart'], 'GER', 'Grass', '0609', 'A'),
+    (['s hertogenbosch', 'hertogenbosch'], 'NED', 'Grass', '0609', 'A'),
+    (['queen s club', 'queens', 'london'], 'GBR', 'Grass', '0616', 'A'),
+    (['halle'], 'GER', 'Grass', '0616', 'A'),
+    (['mallorca'], 'ESP', 'Grass', '0622', 'A'),
+    (['eastbourne'], 'GBR', 'Grass', '0622', 'A'),
+    (['newport'], 'USA', 'Grass', '0714', 'A'),
+    (['bastad'], 'SWE', 'Clay', '0714', 'A'),
+    (['gstaad'], 'SUI', 'Clay', '0714', 'A'),
+    (['kitzbuhel'], 'AUT', 'Clay', '0721', 'A'),
+    (['umag'], 'CRO', 'Clay', '0721', 'A'),
+    (['los cabos'], 'MEX', 'Hard', '0721', 'A'),
+    (['washington'], 'USA', 'Hard', '0728', 'A'),
+    (['winston salem'], 'USA', 'Hard', '0824', 'A'),
+    (['hangzhou'], 'CHN', 'Hard', '0917', 'A'),
+    (['chengdu'], 'CHN', 'Hard', '0924', 'A'),
+    (['beijing'], 'CHN', 'Hard', '0924', 'A'),
+    (['tokyo'], 'JPN', 'Hard', '0924', 'A'),
+    (['almaty'], 'KAZ', 'Hard', '1013', 'A'),
+    (['stockholm'], 'SWE', 'Hard', '1013', 'A'),
+    (['brussels', 'antwerp'], 'BEL', 'Hard', '1013', 'A'),
+    (['basel'], 'SUI', 'Hard', '1020', 'A'),
+    (['vienna'], 'AUT', 'Hard', '1020', 'A'),
+    (['metz'], 'FRA', 'Hard', '1110', 'A'),
+
+    # --- Solo ciudad -> país (sedes viejas o que cambian de torneo) ---
+    (['valencia', 'seville'], 'ESP', None, None, None),
+    (['manchester'], 'GBR', None, None, None),
+    (['sydney', 'perth'], 'AUS', 'Hard', None, None),
+    (['turin', 'milan', 'florence'], 'ITA', None, None, None),
+    (['berlin'], 'GER', None, None, None),
+    (['sao paulo'], 'BRA', None, None, None),
+    (['vancouver'], 'CAN', None, None, None),
+    (['zhuhai'], 'CHN', 'Hard', None, None),
+]
+
+CAMPOS = ('ioc', 'superficie', 'mmdd', 'nivel')
+POR_DEFECTO = {'ioc': PAIS_POR_DEFECTO, 'superficie': SUPERFICIE_POR_DEFECTO, 'mmdd': FECHA_POR_DEFECTO, 'nivel': None}
+
+
+def normalizar(texto):
+    # "Queen's Club" -> "queen s club" | "2026-monte-carlo-22" -> "2026 monte carlo 22"
+    t = unicodedata.normalize('NFKD', str(texto)).encode('ascii', 'ignore').decode().lower()
+    return ' '.join(re.findall(r'[a-z0-9]+', t))
+
+
+# Alias normalizado -> fila de la tabla (la prioridad es el número de fila)
+_ALIAS = {}
+for _fila, (_alias, *_) in enumerate(TORNEOS):
+    for _a in _alias:
+        _ALIAS.setdefault(normalizar(_a), _fila)
+
+# Una sola regex con todos los alias (los largos primero) y límites de palabra
+_PATRON = re.compile(r'\b(?:' + '|'.join(re.escape(a) for a in sorted(_ALIAS, key=len, reverse=True)) + r')\b')
+
+
+@lru_cache(maxsize=None)
+def resolver_torneo(nombre):
+    # Devuelve {'ioc', 'superficie', 'mmdd', 'nivel'} para un nombre o slug de torneo
+    texto = normalizar(nombre)
+    filas = sorted({_ALIAS[m.group(0)] for m in _PATRON.finditer(texto)})
+    resultado = dict(POR_DEFECTO)
+    pendientes = set(CAMPOS)
+    for fila in filas:
+        for campo, valor in zip(CAMPOS, TORNEOS[fila][1:]):
+            if campo in pendientes and valor is not None:
+                resultado[campo] = valor
+                pendientes.discard(campo)
+    return resultado
+
+
+def metadatos_torneos(nombres):
+    # Columna de nombres -> DataFrame con una columna por campo (se resuelve por nombre único)
+    serie = pd.Series(nombres).astype(str)
+    codigos, unicos = pd.factorize(serie)
+    tabla = pd.DataFrame([resolver_torneo(n) for n in unicos], columns=list(CAMPOS))
+    return pd.DataFrame({c: tabla[c].to_numpy()[codigos] for c in CAMPOS}, index=serie.index)
+
+
+def _campo(nombres, campo):
+    serie = pd.Series(nombres).astype(str)
+    codigos, unicos = pd.factorize(serie)
+    valores = np.array([resolver_torneo(n)[campo] for n in unicos], dtype=object)
+    return pd.Series(valores[codigos], index=serie.index)
+
+
+def pais_torneo(nombres):
+    return _campo(nombres, 'ioc')
+
+
+def superficie_torneo(nombres):
+    return _campo(nombres, 'superficie')
+
+
+def fecha_torneo(nombres):
+    return _campo(nombres, 'mmdd')
+
+
+def nivel_torneo(nombres):
+    return _campo(nombres, 'nivel')
+
+
+# Uso:  python torneos.py "monte-carlo" "Queen's Club" "2026-rio-de-janeiro-12"
+if __name__ == "__main__":
+    import sys
+    for nombre in sys.argv[1:] or ['australian-open', 'monte-carlo', "Queen's Club", 'nitto-atp-finals']:
+        print(f"{nombre:<35} {resolver_torneo(nombre)}")
@@ -0,0 +1,131 @@
+import time
+
+import numpy as np
+import xgboost as xgb
+from sklearn.model_selection import GroupShuffleSplit, ParameterSampler, train_test_split
+
+# =============================================================================
+# ✂️ TUNING DE XGBOOST CON "SUCCESSIVE HALVING" + EARLY STOPPING
+# =============================================================================
+# RandomizedSearchCV entrena cada candidato completo (hasta 1000 árboles x 3 folds).
+# Acá el presupuesto se reparte por rondas:
+#   - Todos los candidatos arrancan con pocos árboles.
+#   - Solo el mejor tercio sigue entrenando (se continúa el mismo booster, no se
+#     empieza de cero), y así hasta llegar al máximo de árboles.
+#   - Early stopping contra un fold de validación: si un candidato deja de mejorar,
+#     no se le agregan más árboles.
+#   - tree_method='hist' y los datos se convierten UNA vez al formato nativo de
+#     XGBoost (QuantileDMatrix), que se reutiliza en todos los entrenamientos.
+
+RONDAS_MAX = 1000     # Árboles máximos (el tope de la búsqueda vieja)
+FACTOR = 3            # En cada escalón sigue 1 de cada FACTOR candidatos
+PACIENCIA = 30        # Early stopping: rondas sin mejorar el logloss de validación
+FRACCION_VALID = 0.2
+
+
+def _matrices(X_fit, y_fit, X_valid, y_valid):
+    # Con 'hist' alcanza con los cuantiles: QuantileDMatrix ocupa menos y se arma una sola vez
+    if hasattr(xgb, 'QuantileDMatrix'):
+        d_fit = xgb.QuantileDMatrix(X_fit, y_fit)
+        return d_fit, xgb.QuantileDMatrix(X_valid, y_valid, ref=d_fit)
+    return xgb.DMatrix(X_fit, y_fit), xgb.DMatrix(X_valid, y_valid)
+
+
+def _parametros(candidato, semilla, n_jobs):
+    params = {k: v for k, v in candidato.items() if k != 'n_estimators'}
+    params.update(objective='binary:logistic', eval_metric='logloss', tree_method='hist',
+                  seed=semilla, nthread=n_jobs)
+    return params
+
+
+def _separar_validacion(X, y, grupos, semilla):
+    # Con grupos (ej: las dos filas espejadas de un mismo partido) ambas caen del mismo lado
+    if grupos is None:
+        return train_test_split(X, y, test_size=FRACCION_VALID, random_state=semilla)
+    fit, valid = next(GroupShuffleSplit(n_splits=1, test_size=FRACCION_VALID, random_state=semilla)
+                      .split(X, y, groups=grupos))
+    return X[fit], X[valid], y[fit], y[valid]
+
+
+def busqueda_halving(X, y, param_dist, grupos=None, n_candidatos=27, rondas_max=RONDAS_MAX, factor=FACTOR,
+                     paciencia=PACIENCIA, semilla=42, n_jobs=-1, verbose=True):
+    # Devuelve un dict con los mejores hiperparámetros, la cantidad de árboles y el historial
+    inicio = time.perf_counter()
+    X = np.ascontiguousarray(X, dtype=np.float32)
+    y = np.asarray(y, dtype=np.float32)
+    X_fit, X_valid, y_fit, y_valid = _separar_validacion(X, y, grupos, semilla)
+    d_fit, d_valid = _matrices(X_fit, y_fit, X_valid, y_valid)
+
+    # Mismo muestreo que RandomizedSearchCV (n_estimators lo decide el halving)
+    espacio = {k: v for k, v in param_dist.items() if k != 'n_estimators'}
+    candidatos = [{'params': p, 'booster': None, 'convergio': False, 'score': 0.0, 'logloss': np.inf}
+                  for p in ParameterSampler(espacio, n_iter=n_candidatos, random_state=semilla)]
+
+    # Escalones de árboles: ..., rondas_max / 9, rondas_max / 3, rondas_max
+    escalones, quedan = 1, n_candidatos
+    while quedan >= factor:
+        quedan //= factor
+        escalones += 1
+    rondas = [max(1, int(rondas_max / factor ** (escalones - 1 - i))) for i in range(escalones)]
+    historial = []
+
+    vivos = candidatos
+    for escalon, objetivo in enumerate(rondas):
+        for c in vivos:
+            hechas = c['booster'].num_boosted_rounds() if c['booster'] is not None else 0
+            if c['convergio'] or hechas >= objetivo:
+                continue
+            c['booster'] = xgb.train(_parametros(c['params'], semilla, n_jobs), d_fit,
+                                     num_boost_round=objetivo - hechas, evals=[(d_valid, 'valid')],
+                                     early_stopping_rounds=paciencia, xgb_model=c['booster'], verbose_eval=False)
+            # Al continuar un booster, XGBoost empieza el early stopping de cero: best_iteration
+            # (que sí cuenta desde el primer árbol) y best_score son solo de ESTA tanda. Lo mejor
+            # del candidato se reemplaza únicamente si esta tanda lo mejora
+            mejor, logloss = c['booster'].best_iteration, float(c['booster'].best_score)
+            mejoro = logloss < c['logloss']
+            if mejoro:
+                prob = c['booster'].predict(d_valid, iteration_range=(0, mejor + 1))
+                c['score'] = float(np.mean((prob > 0.5) == y_valid))
+                c['logloss'] = logloss
+                c['arboles'] = mejor + 1
+            # Cortó antes por early stopping, o toda la tanda no mejoró lo que ya tenía
+            c['convergio'] = c['booster'].num_boosted_rounds() < objetivo or not mejoro
+
+        # Ranking: accuracy de validación (la métrica de la búsqueda vieja), desempate por logloss
+        vivos = sorted(vivos, key=lambda c: (-c['score'], c['logloss']))
+        historial.append({'escalon': escalon, 'arboles': objetivo, 'candidatos': len(vivos),
+                          'mejor_score': vivos[0]['score']})
+        if verbose:
+            print(f"   ✂️ Escalón {escalon + 1}/{len(rondas)}: {len(vivos):>2} candidatos hasta {objetivo:>4} árboles "
+                  f"| mejor accuracy de validación {vivos[0]['score']:.4f}")
+        if escalon < len(rondas) - 1:
+            vivos = vivos[:max(1, len(vivos) // factor)]
+
+    ganador = vivos[0]
+    return {
+        'best_params': ganador['params'],
+        'n_estimators': ganador['arboles'],
+        'best_score': ganador['score'],
+        'historial': historial,
+        'segundos': time.perf_counter() - inicio,
+    }
+
+
+def score_validacion(modelo, X, y, grupos=None, semilla=42):
+    # Accuracy de `modelo` (se clona sin entrenar) ajustado con la parte de ajuste y medido en el MISMO
+    # fold de validación que usa busqueda_halving (mismos grupos y semilla). Sirve para comparar dos
+    # configuraciones sobre el mismo corte, sin que las dos filas de un partido queden repartidas
+    from sklearn.base import clone
+
+    X = np.ascontiguousarray(X, dtype=np.float32)
+    y = np.asarray(y, dtype=np.float32)
+    X_fit, X_valid, y_fit, y_valid = _separar_validacion(X, y, grupos, semilla)
+    return float(np.mean(clone(modelo).fit(X_fit, y_fit).predict(X_valid) == y_valid))
+
+
+def modelo_final(X, y, resultado, semilla=42, n_jobs=-1):
+    # Reentrena el ganador con TODO el train (como el refit de RandomizedSearchCV)
+    modelo = xgb.XGBClassifier(**resultado['best_params'], n_estimators=resultado['n_estimators'],
+                               tree_method='hist', eval_metric='logloss', random_state=semilla, n_jobs=n_jobs)
+    modelo.fit(np.ascontiguousarray(X, dtype=np.float32), np.asarray(y, dtype=np.float32))
+    return modelo
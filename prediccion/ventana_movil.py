@@ -0,0 +1,49 @@
+import numpy as np
+
+# =============================================================================
+# 🔁 VENTANA MÓVIL (buffer circular por jugador)
+# =============================================================================
+# Reemplaza a los racha_tracker = {jugador: [1, 0, 1, ...]} con list.pop(0).
+# - Una matriz preasignada [jugador, posición] guarda los últimos resultados.
+# - Sumas acumuladas por ventana: agregar un partido cuesta O(1) sin importar el tamaño.
+# - Se pueden seguir varias ventanas (ej: 5, 10 y 20 partidos) en la misma pasada.
+# Los jugadores se identifican por ID entero (0 .. n_jugadores-1).
+
+
+class VentanaMovil:
+    def __init__(self, n_jugadores, ventanas=(5,), guardar_indices=False):
+        self.ventanas = tuple(ventanas)
+        self.tamano = max(self.ventanas)
+        self.valores = np.zeros((n_jugadores, self.tamano), dtype=np.int8)
+        self.cuenta = np.zeros(n_jugadores, dtype=np.int64)               # Partidos registrados por jugador
+        self.sumas = np.zeros((n_jugadores, len(self.ventanas)), dtype=np.int64)
+        # Opcional: de qué fila vino cada resultado (para reconstruir "últimos 5 partidos")
+        self.indices = np.full((n_jugadores, self.tamano), -1, dtype=np.int64) if guardar_indices else None
+
+    def promedios(self, jugador, neutro=0.5):
+        # Win rate en cada ventana ANTES del próximo partido (neutro si todavía no jugó)
+        c = self.cuenta[jugador]
+        if c == 0:
+            return [neutro] * len(self.ventanas)
+        return [s / min(c, v) for s, v in zip(self.sumas[jugador].tolist(), self.ventanas)]
+
+    def agregar(self, jugador, valor, indice=-1):
+        c = int(self.cuenta[jugador])
+        fila = self.valores[jugador]
+        sumas = self.sumas[jugador]
+        for k, v in enumerate(self.ventanas):
+            if c >= v:
+                sumas[k] -= fila[(c - v) % self.tamano]  # El resultado que sale de esta ventana
+            sumas[k] += valor
+        pos = c % self.tamano
+        fila[pos] = valor
+        if self.indices is not None:
+            self.indices[jugador, pos] = indice
+        self.cuenta[jugador] = c + 1
+
+    def ultimos(self, jugador, k=None):
+        # Índices de los últimos k partidos, del más viejo al más nuevo
+        k = min(k or self.tamano, self.tamano, int(self.cuenta[jugador]))
+        c = int(self.cuenta[jugador])
+        posiciones = [(c - k + i) % self.tamano for i in range(k)]
+        return self.indices[jugador, posiciones].tolist()
@@ -12,7 +12,15 @@ def ejecutar_pipeline():
         "corregir_superficie_ranking.py",
         "juntar_scrapings.py",
         "fusionar_historico_final.py",
-        "generar_perfiles.py" # ¡No olvides generar el .pkl al final!
+        # Copia columnar tipada de historialTenis.csv (la leen generar_perfiles, Elo y la app)
+        "../prediccion/almacen_partidos.py",
+        "generar_perfiles.py", # ¡No olvides generar el .pkl al final!
+        # Elo incremental: solo aplica los partidos nuevos sobre el estado guardado (único que escribe estado_elo.pkl)
+        ["../prediccion/motor_elo.py", "update", "--historial", "historialTenis.csv", "--estado", "../prediccion/estado_elo.pkl"],
+        # Paquete de artefactos para la app (perfiles, skills, H2H y modelos en arrays con mmap)
+        "../prediccion/paquete_artefactos.py",
+        # Matriz del top 200 para la app: se rearma solo si cambiaron el ranking, los perfiles o los modelos
+        "../prediccion/matriz_top.py"
     ]
     
     directorio_scraping = os.path.dirname(os.path.abspath(__file__))
@@ -21,13 +29,16 @@ def ejecutar_pipeline():
     inicio = time.time()
     
     for script in scripts:
+        # Cada paso puede ser "script.py" o ["script.py", "arg1", ...]
+        comando = script if isinstance(script, list) else [script]
+        script = comando[0]
         print(f"\n" + "="*40)
         print(f"▶️ Ejecutando: {script}")
         print("="*40)
         
         try:
             # Ejecuta el script y espera a que termine
-            resultado = subprocess.run([sys.executable, "-X", "utf8", script], check=True, capture_output=True, text=True,encoding='utf-8', cwd=directorio_scraping)
+            resultado = subprocess.run([sys.executable, "-X", "utf8", *comando], check=True, capture_output=True, text=True,encoding='utf-8', cwd=directorio_scraping)
             print(resultado.stdout) # Imprime lo que dice el script
         except subprocess.CalledProcessError as e:
             print(f"❌ Error crítico en {script}!")
@@ -1,5 +1,14 @@
 import pandas as pd
 import numpy as np
+import os
+import sys
+
+# --- MAPA HACIA LA CARPETA PREDICCION (módulos compartidos) ---
+ruta_prediccion = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'prediccion'))
+if ruta_prediccion not in sys.path:
+    sys.path.append(ruta_prediccion)
+
+from torneos import superficie_torneo
 
 print("🛠️ INICIANDO CORRECCIÓN DE SUPERFICIES Y RANKINGS...")
 
@@ -23,31 +32,9 @@ try:
     # ---------------------------------------------------------
     print("🌍 Corrigiendo superficies...")
 
-    def detectar_superficie(nombre_torneo):
-        nombre = str(nombre_torneo).lower()
-        
-        # --- PALABRAS CLAVE PARA ARCILLA (CLAY) ---
-        clay_keywords = [
-            'roland garros', 'madrid', 'rome', 'roma', 'monte carlo', 'barcelona', 
-            'rio', 'buenos aires', 'cordoba', 'santiago', 'estoril', 'munich', 
-            'geneva', 'lyon', 'hamburg', 'bastad', 'gstaad', 'umag', 'kitzbuhel'
-        ]
-        # --- PALABRAS CLAVE PARA PASTO (GRASS) ---
-        grass_keywords = [
-            'wimbledon', 'queen', 'halle', 'mallorca', 'eastbourne', 
-            'stuttgart', 'hertogenbosch', 'newport'
-        ]
-        # (Todo lo demás será Hard por descarte: AO, US Open, Masters grandes, etc.)
-
-        if any(k in nombre for k in clay_keywords):
-            return 'Clay'
-        elif any(k in nombre for k in grass_keywords):
-            return 'Grass'
-        else:
-            return 'Hard' # Por defecto (Cementos, Indoor, Carpet)
-
-    # Aplicamos la función fila por fila
-    df['surface'] = df['tourney_name'].apply(detectar_superficie)
+    # Tabla de metadatos compartida (prediccion/torneos.py): se resuelve una vez por
+    # torneo distinto y se mapea a todas las filas. Lo que no está en la tabla queda Hard.
+    df['surface'] = superficie_torneo(df['tourney_name']).to_numpy()
     
     # Reporte rápido
     conteo = df['surface'].value_counts()
@@ -1,11 +1,20 @@
-import pandas as pd
+import os
+import sys
+
+# --- MAPA HACIA LA CARPETA PREDICCION (módulos compartidos) ---
+ruta_prediccion = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'prediccion'))
+if ruta_prediccion not in sys.path:
+    sys.path.append(ruta_prediccion)
+
+from almacen_partidos import cargar_historial
 
 print("🔍 ABRIENDO LA CAJA NEGRA DEL HISTORIAL COMPLETO...\n")
 
-# 1. AHORA SÍ LEEMOS EL ARCHIVO FUSIONADO (Usa low_memory=False para evitar el warning de letras rojas)
+# 1. AHORA SÍ LEEMOS EL ARCHIVO FUSIONADO (solo las columnas que mostramos, del almacén columnar si está)
 ARCHIVO = "historialTenis.csv"
+columnas_ver = ['tourney_id', 'tourney_name', 'tourney_date', 'round', 'winner_name', 'loser_name']
 try:
-    df = pd.read_csv(ARCHIVO, low_memory=False)
+    df = cargar_historial(ARCHIVO, columnas_ver)
 except FileNotFoundError:
     print(f"❌ ERROR: No se encuentra el archivo {ARCHIVO}. Revisa que se llame así en tu carpeta.")
     exit()
@@ -18,7 +27,6 @@ df_jugador = df[df['winner_name'].str.contains(apellido, case=False, na=False) |
 
 # 3. IMPRIMIMOS LOS ÚLTIMOS 20 PARTIDOS
 ultimos_20 = df_jugador.tail(20)
-columnas_ver = ['tourney_id', 'tourney_name', 'tourney_date', 'round', 'winner_name', 'loser_name']
 
 print(f"🎾 Partidos encontrados para '{apellido}': {len(df_jugador)}\n")
 print(ultimos_20[columnas_ver].to_string())
\ No newline at end of file
@@ -1,6 +1,15 @@
 import pandas as pd
 import joblib
 import numpy as np
+import os
+import sys
+
+# --- MAPA HACIA LA CARPETA PREDICCION (módulos compartidos) ---
+ruta_prediccion = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'prediccion'))
+if ruta_prediccion not in sys.path:
+    sys.path.append(ruta_prediccion)
+
+from torneos import superficie_torneo
 
 # --- CONFIGURACIÓN ---
 ARCHIVO_NUEVO = "atp_matches_2026_indetectable.csv" # Tu CSV flaco (recién bajado)
@@ -20,56 +29,20 @@ except Exception as e:
     print("Asegúrate de tener 'atp_matches_2026_indetectable.csv' y 'perfiles_jugadores.pkl'")
     exit()
 
-# 2. DICCIONARIO DE SUPERFICIES (Para no dejarlo vacío)
-# Agrega aquí los torneos que vayas bajando
-mapa_superficies = {
-    'Australian Open': 'Hard',
-    'Roland Garros': 'Clay',
-    'Wimbledon': 'Grass',
-    'US Open': 'Hard',
-    'Indian Wells': 'Hard',
-    'Miami': 'Hard',
-    'Monte Carlo': 'Clay',
-    'Madrid': 'Clay',
-    'Rome': 'Clay',
-    'Cincinnati': 'Hard',
-    'Canada': 'Hard',
-    'Shanghai': 'Hard',
-    'Paris': 'Hard',
-    'Rotterdam': 'Hard', 
-    'perth-sydney': 'Hard',
-    'brisbane': 'Hard',
-    'hong-kong': 'Hard',
-    'adelaide': 'Hard',
-    'auckland': 'Hard',
-    'montpellier': 'Clay',
-    'dallas': 'Hard',
-    'buenos-aires': 'Clay',
-    'doha': 'Hard',
-    'rio-de-janeiro': 'Clay',
-    'delray-beach': 'Hard'
-}
+# 2. SUPERFICIES (tabla de metadatos compartida, una búsqueda por torneo distinto)
+# Para agregar un torneo nuevo, sumarlo en prediccion/torneos.py
+df['surface'] = superficie_torneo(df['tourney_name']).to_numpy()
 
 # 3. LISTAS PARA LOS DATOS NUEVOS
 w_ht, w_age, w_rank, w_hand, w_ioc = [], [], [], [], []
 l_ht, l_age, l_rank, l_hand, l_ioc = [], [], [], [], []
-surfaces = []
 
 print("🔄 Cruzando datos...")
 
 for index, row in df.iterrows():
     w_name = row['winner_name']
     l_name = row['loser_name']
-    torneo = row['tourney_name']
     
-    # --- A. SUPERFICIE ---
-    # Buscamos el torneo en el mapa, si no está, ponemos 'Hard' por defecto
-    surf = mapa_superficies.get(torneo, 'Hard')
-    # Intento simple de detectar Clay/Grass si está en el nombre
-    if 'Clay' in str(torneo): surf = 'Clay'
-    if 'Grass' in str(torneo): surf = 'Grass'
-    surfaces.append(surf)
-
     # --- B. DATOS DEL GANADOR ---
     if w_name in perfiles:
         p = perfiles[w_name]
@@ -102,7 +75,6 @@ for index, row in df.iterrows():
         l_hand.append('R')
 
 # 4. AGREGAR COLUMNAS AL DATAFRAME
-df['surface'] = surfaces
 df['winner_ht'] = w_ht
 df['winner_age'] = w_age
 df['winner_rank'] = w_rank
@@ -1,12 +1,36 @@
 import pandas as pd
 import joblib
 import numpy as np
+import os
+import sys
+
+# --- MAPA HACIA LA CARPETA PREDICCION (módulos compartidos) ---
+ruta_prediccion = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'prediccion'))
+if ruta_prediccion not in sys.path:
+    sys.path.append(ruta_prediccion)
+
+from ventana_movil import VentanaMovil
+from indice_h2h import IndiceH2H, guardar_indice
+from almacen_partidos import cargar_historial
+from registro_jugadores import cargar_o_crear, guardar_registro
+
+VENTANAS_RACHA = (5, 10, 20) # La de 5 es la "oficial" (momentum y last_5)
 
 print("👤 GENERANDO PERFILES (V5.0 - SOLUCIÓN TOTAL)...")
 
 try:
-    # 1. Cargar CSV
-    df = pd.read_csv("historialTenis.csv")
+    # 1. Cargar historial (del almacén columnar si está al día; si no, el CSV)
+    df = cargar_historial("historialTenis.csv", categorias=False)
+
+    # --- REGISTRO DE JUGADORES (un id por jugador; cada forma de escribir un nombre cae en el mismo) ---
+    registro = cargar_o_crear('registro_jugadores.pkl')
+    df['winner_name'] = registro.canonicos(df['winner_name'])
+    df['loser_name'] = registro.canonicos(df['loser_name'])
+
+    # --- ÍNDICE H2H (filas en el orden del CSV, igual que lo lee la app) ---
+    indice_h2h = IndiceH2H.construir(df, registro)
+    guardar_indice(indice_h2h, 'indice_h2h.pkl', origen='historialTenis.csv')
+    print(f"   ⚔️ Índice H2H guardado ({len(indice_h2h)} cruces)")
     
     # --- A. LIMPIEZA Y FORMATO ---
     df['tourney_id'] = df['tourney_id'].astype(str)
@@ -76,7 +100,12 @@ try:
 
     # --- E. PROCESAMIENTO CON MEMORIA ---
     perfiles = {}
-    racha_tracker = {}
+
+    # Racha: buffer circular por jugador (id del registro) que recuerda resultado y fila de cada partido
+    df = df.reset_index(drop=True)
+    ids_w = registro.ids(df['winner_name']).tolist()
+    ids_l = registro.ids(df['loser_name']).tolist()
+    racha_tracker = VentanaMovil(len(registro), VENTANAS_RACHA, guardar_indices=True)
     
     # "Cache" para recordar datos si vienen vacíos
     bio_cache = {} 
@@ -86,45 +115,14 @@ try:
     for index, row in df.iterrows():
         w = row['winner_name']
         l = row['loser_name']
-        score = row['score']
-        torneo = row['tourney_name']
-        ronda = row['round']
-        fecha = row['tourney_date']
 
         total_partidos[w] = total_partidos.get(w, 0) + 1
         total_partidos[l] = total_partidos.get(l, 0) + 1
         
         # --- 1. GESTIÓN DEL HISTORIAL (RACHA) ---
-        rw = racha_tracker.get(w, [])
-        rl = racha_tracker.get(l, [])
-        
-        # A. Datos para el GANADOR
-        match_w = {
-            'resultado': 'W',      # Won
-            'rival': l,            # El rival fue el perdedor
-            'score': score,        # El score (siempre está visto desde el ganador)
-            'torneo': torneo,
-            'ronda': ronda
-        }
-        
-        # B. Datos para el PERDEDOR
-        match_l = {
-            'resultado': 'L',      # Lost
-            'rival': w,            # El rival fue el ganador
-            'score': score,        # El score
-            'torneo': torneo,
-            'ronda': ronda
-        }
-        
-        rw.append(match_w)
-        rl.append(match_l)
-        
-        # Mantenemos solo los últimos 5
-        if len(rw) > 5: rw.pop(0)
-        if len(rl) > 5: rl.pop(0)
-        
-        racha_tracker[w] = rw
-        racha_tracker[l] = rl
+        # Guardamos solo el resultado y la fila: el detalle (rival, score, ronda) se arma al final
+        racha_tracker.agregar(ids_w[index], 1, index)
+        racha_tracker.agregar(ids_l[index], 0, index)
         
         # --- 2. DATOS BIO (Igual que antes) ---
         # (Resumido para no ocupar espacio, la lógica es la misma de la V4.0)
@@ -150,7 +148,10 @@ try:
     # Cargar Stats
     try:
         df_stats_adv = pd.read_csv("estadisticas_jugadores_avanzadas.csv")
-        stats_dict_adv = df_stats_adv.set_index('player').to_dict(orient='index')
+        # Por id: el CSV de stats escribe los nombres a su manera (guiones, tildes...)
+        stats_dict_adv = {registro.buscar(jugador): datos
+                          for jugador, datos in df_stats_adv.set_index('player').to_dict(orient='index').items()}
+        stats_dict_adv.pop(None, None)
     except:
         print("   ⚠️ No se encontró 'estadisticas_jugadores_avanzadas.csv'.")
         stats_dict_adv = {}
@@ -173,8 +174,12 @@ try:
         # Creamos una nueva columna con el nombre perfecto
         df_ranking['player_real'] = df_ranking['url_perfil'].apply(extraer_nombre_real)
         
-        # Ahora usamos 'player_real' como llave del diccionario en lugar del abreviado
-        ranking_dict_fresco = df_ranking.set_index('player_real').to_dict(orient='index')
+        # Cada fila del ranking queda registrada con sus dos nombres ("Jannik Sinner" y "J. Sinner")
+        # y el diccionario va por id
+        ranking_dict_fresco = {}
+        for fila in df_ranking.to_dict(orient='records'):
+            if fila['player_real']:
+                ranking_dict_fresco[registro.registrar(fila['player_real'], alias=[fila['player']])] = fila
         print("   ✅ 'ranking_2026.csv' cargado OK con nombres corregidos.")
     except Exception as e:
         print(f"   ⚠️ ERROR REAL con ranking: {e}")
@@ -187,23 +192,39 @@ try:
     print("-----------------------\n")
 
     for jugador, datos in perfiles.items():
-        
+        j = registro.buscar(jugador)
+
         # 1. Actualizar Ranking y Puntos con la info fresca de hoy (Pisa la memoria vieja)
-        if jugador in ranking_dict_fresco:
-            perfiles[jugador]['rank'] = ranking_dict_fresco[jugador].get('rank', 500)
-            perfiles[jugador]['points'] = ranking_dict_fresco[jugador].get('points', 0)
+        if j in ranking_dict_fresco:
+            perfiles[jugador]['rank'] = ranking_dict_fresco[j].get('rank', 500)
+            perfiles[jugador]['points'] = ranking_dict_fresco[j].get('points', 0)
 
         # 2. Racha y Momentum
-        historial = racha_tracker.get(jugador, [])
-        victorias = sum(1 for x in historial if x['resultado'] == 'W')
-        perfiles[jugador]['momentum'] = victorias / len(historial) if historial else 0.5
+        historial = []
+        if j is not None:
+            for fila in racha_tracker.ultimos(j, 5):
+                partido = df.iloc[fila]
+                gano = partido['winner_name'] == jugador
+                historial.append({
+                    'resultado': 'W' if gano else 'L',
+                    'rival': partido['loser_name'] if gano else partido['winner_name'],
+                    'score': partido['score'],  # El score (siempre está visto desde el ganador)
+                    'torneo': partido['tourney_name'],
+                    'ronda': partido['round']
+                })
+            momentos = racha_tracker.promedios(j)
+        else:
+            momentos = [0.5] * len(VENTANAS_RACHA)
+        perfiles[jugador]['momentum'] = momentos[0]
+        for v, m in zip(VENTANAS_RACHA[1:], momentos[1:]):
+            perfiles[jugador][f'momentum_{v}'] = m
         perfiles[jugador]['last_5'] = historial
 
         # 3. Stats Avanzadas
         partidos_jugados = total_partidos.get(jugador, 1) # Evitar dividir por cero
         
-        if jugador in stats_dict_adv:
-            datos_extra = stats_dict_adv[jugador]
+        if j in stats_dict_adv:
+            datos_extra = stats_dict_adv[j]
             perfiles[jugador]['serve_win'] = datos_extra.get('serve_win_pct', 65.0)
             perfiles[jugador]['bp_saved'] = datos_extra.get('bp_saved_pct', 60.0)
             perfiles[jugador]['service_hold'] = datos_extra.get('service_hold_pct', 75.0)
@@ -225,6 +246,8 @@ try:
         print(f"   Jannik Sinner -> Ranking: {p.get('rank')} | Puntos: {p.get('points')}")
 
     joblib.dump(perfiles, 'perfiles_jugadores.pkl')
+    guardar_registro(registro, 'registro_jugadores.pkl')
+    print(f"   🪪 Registro de jugadores guardado ({len(registro)} jugadores)")
     print("\n✅ Archivo de perfiles actualizado con Ranking Fresco. ¡Listo para la App!")
 
 except Exception as e: